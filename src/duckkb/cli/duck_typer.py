@@ -5,6 +5,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+import orjson
 import typer
 
 from duckkb import __version__
@@ -26,6 +27,25 @@ def _run_async(coro: Any) -> Any:
     return asyncio.run(coro)
 
 
+def _echo_json(data: Any) -> None:
+    """以 JSON 格式输出结果。
+
+    orjson 直接产出 UTF-8 字节并原样写入标准输出，省去 str 解码再编码的往返。
+    日期时间经 str() 输出，与 json.dumps(default=str) 的格式一致；
+    超出 64 位的整数等 orjson 无法编码的值回退到标准库 json。
+
+    Args:
+        data: 待输出的数据。
+    """
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    payload: bytes | str
+    try:
+        payload = orjson.dumps(data, default=str, option=option)
+    except orjson.JSONEncodeError:
+        payload = json.dumps(data, ensure_ascii=False, indent=2, default=str)
+    typer.echo(payload)
+
+
 class DuckTyper(typer.Typer):
     """DuckKB CLI 工具类。
 
@@ -191,7 +211,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_import())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            _echo_json(result)
 
     def _register_search_commands(self) -> None:
         """注册搜索相关命令。"""
@@ -239,7 +259,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_search())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            _echo_json(result)
 
     def _register_vector_search_command(self) -> None:
         """注册 vector-search 命令。"""
@@ -273,7 +293,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_search())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            _echo_json(result)
 
     def _register_fts_search_command(self) -> None:
         """注册 fts-search 命令。"""
@@ -307,7 +327,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_search())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            _echo_json(result)
 
     def _register_get_source_record_command(self) -> None:
         """注册 get-source-record 命令。"""
@@ -340,7 +360,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_get())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            _echo_json(result)
 
     def _register_query_raw_sql_command(self) -> None:
         """注册 query-raw-sql 命令。"""
@@ -364,7 +384,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_query())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+            _echo_json(result)
 
     def _register_graph_commands(self) -> None:
         """注册图谱检索相关命令。"""
@@ -422,7 +442,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_execute())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+            _echo_json(result)
 
     def _register_graph_search_command(self) -> None:
         """注册 graph-search 命令。"""
@@ -496,7 +516,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_execute())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+            _echo_json(result)
 
     def _register_traverse_command(self) -> None:
         """注册 traverse 命令。"""
@@ -554,7 +574,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_execute())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+            _echo_json(result)
 
     def _register_extract_subgraph_command(self) -> None:
         """注册 extract-subgraph 命令。"""
@@ -601,7 +621,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_execute())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+            _echo_json(result)
 
     def _register_find_paths_command(self) -> None:
         """注册 find-paths 命令。"""
@@ -654,7 +674,7 @@ class DuckTyper(typer.Typer):
                     engine.close()
 
             result = _run_async(_execute())
-            typer.echo(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+            _echo_json(result)
 
     def create_mcp(self, **kwargs: Any) -> DuckMCP:
         """创建 MCP 服务实例。
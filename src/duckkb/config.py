@@ -18,7 +18,9 @@ from pydantic import BaseModel, Field, field_validator
 from duckkb.constants import (
     CONFIG_FILE_NAME,
     DEFAULT_CHUNK_SIZE,
+    DEFAULT_EMBEDDING_BATCH_SIZE,
     DEFAULT_EMBEDDING_DIM,
+    DEFAULT_EMBEDDING_MAX_CONCURRENCY,
     DEFAULT_EMBEDDING_MODEL,
     DEFAULT_LOG_LEVEL,
     DEFAULT_TOKENIZER,
@@ -117,12 +119,16 @@ class EmbeddingConfig(BaseModel):
         dim: 嵌入向量维度，必须为 1536 或 3072。
         api_key: OpenAI API 密钥。
         base_url: OpenAI API 基础 URL，用于自定义端点。
+        batch_size: 单次 Embedding API 请求携带的最大文本数。
+        max_concurrency: 同时在途的 Embedding API 请求数上限。
     """
 
     model: str = DEFAULT_EMBEDDING_MODEL
     dim: int = DEFAULT_EMBEDDING_DIM
     api_key: str | None = None
     base_url: str | None = None
+    batch_size: int = Field(default=DEFAULT_EMBEDDING_BATCH_SIZE, ge=1, le=2048)
+    max_concurrency: int = Field(default=DEFAULT_EMBEDDING_MAX_CONCURRENCY, ge=1, le=32)
 
     @field_validator("dim")
     @classmethod
@@ -227,6 +233,10 @@ class KBConfig(BaseModel):
                     dim=embedding_config.get("dim", DEFAULT_EMBEDDING_DIM),
                     api_key=embedding_config.get("api_key"),
                     base_url=embedding_config.get("base_url"),
+                    batch_size=embedding_config.get("batch_size", DEFAULT_EMBEDDING_BATCH_SIZE),
+                    max_concurrency=embedding_config.get(
+                        "max_concurrency", DEFAULT_EMBEDDING_MAX_CONCURRENCY
+                    ),
                 ),
                 chunk_size=data.get("chunk_size", DEFAULT_CHUNK_SIZE),
                 tokenizer=data.get("tokenizer", DEFAULT_TOKENIZER),
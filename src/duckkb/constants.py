@@ -22,9 +22,17 @@ EMBEDDING_MODEL_DIMS: dict[str, int] = {
 
 DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
 DEFAULT_EMBEDDING_DIM = 1536
+DEFAULT_EMBEDDING_BATCH_SIZE = 128
+DEFAULT_EMBEDDING_MAX_CONCURRENCY = 4
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_CHUNK_SIZE = 800
 DEFAULT_TOKENIZER = "jieba"
+SEGMENT_PARALLEL_MIN_TEXTS = 256
+SEGMENT_PARALLEL_CHUNK_SIZE = 32
+SEGMENT_THREAD_WORKERS = 2
+QUERY_VECTOR_CACHE_SIZE = 1024
+SEARCH_RESULT_CACHE_SIZE = 1000
+SEARCH_RESULT_CACHE_TTL = 300
 CONFIG_FILE_NAME = "config.yaml"
 
 VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
@@ -182,15 +182,15 @@ class Engine(
         if loaded_nodes > 0 or loaded_edges > 0:
             logger.info(f"Loaded existing data: {loaded_nodes} nodes, {loaded_edges} edges")
 
-        await self._rebuild_index_from_cache()
-
-        self._try_create_fts_index()
+        if await self._rebuild_index_from_cache():
+            self._try_create_fts_index()
 
     def close(self) -> None:
         """关闭引擎。
 
-        关闭数据库连接。
+        关闭分词进程池和数据库连接。
         """
+        self.shutdown_tokenizer()
         super().close()
 
     def __enter__(self) -> Self:
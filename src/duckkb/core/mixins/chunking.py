@@ -1,7 +1,11 @@
 """文本切片 Mixin。"""
 
+import re
+
 from duckkb.core.base import BaseEngine
 
+_SENTENCE_ENDINGS = re.compile(r"[。！？.!?]\s*")
+
 
 class ChunkingMixin(BaseEngine):
     """文本切片 Mixin。
@@ -47,25 +51,27 @@ class ChunkingMixin(BaseEngine):
         if not text:
             return []
 
-        if len(text) <= self.chunk_size:
+        chunk_size = self.chunk_size
+        text_len = len(text)
+        if text_len <= chunk_size:
             return [text]
 
         chunks: list[str] = []
         start = 0
-        step = self.chunk_size - self._chunk_overlap
+        step = chunk_size - self._chunk_overlap
+        min_tail = chunk_size // 2
 
-        while start < len(text):
-            end = start + self.chunk_size
-            chunk = text[start:end]
+        while start < text_len:
+            chunk = text[start : start + chunk_size]
 
-            if len(chunk) < self.chunk_size // 2 and chunks:
+            if len(chunk) < min_tail and chunks:
                 chunks[-1] += chunk
             else:
                 chunks.append(chunk)
 
             start += step
 
-        return [c.strip() for c in chunks if c.strip()]
+        return [stripped for chunk in chunks if (stripped := chunk.strip())]
 
     def chunk_by_sentence(self, text: str, max_size: int | None = None) -> list[str]:
         """按句子边界切分文本。
@@ -88,14 +94,11 @@ class ChunkingMixin(BaseEngine):
         if len(text) <= max_size:
             return [text]
 
-        import re
-
-        sentence_endings = re.compile(r"[。！？.!?]\s*")
         chunks: list[str] = []
         current_chunk = ""
 
-        sentences = sentence_endings.split(text)
-        separators = sentence_endings.findall(text)
+        sentences = _SENTENCE_ENDINGS.split(text)
+        separators = _SENTENCE_ENDINGS.findall(text)
 
         for i, sentence in enumerate(sentences):
             sep = separators[i] if i < len(separators) else ""
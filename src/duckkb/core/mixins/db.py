@@ -1,12 +1,15 @@
 """数据库连接管理 Mixin。"""
 
 import atexit
+import os
 import shutil
 import tempfile
+import threading
 import uuid
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, TypeVar
 
 import duckdb
 
@@ -15,12 +18,17 @@ from duckkb.exceptions import DatabaseError
 from duckkb.logger import logger
 from duckkb.utils.rwlock import FairReadWriteLock
 
+_T = TypeVar("_T")
+
 
 class DBMixin(BaseEngine):
     """数据库连接管理 Mixin（文件模式 + 公平读写锁）。
 
     支持多读并发，写入独占，避免写饥饿。
     使用临时目录创建数据库文件，对用户透明。
+    引擎生命周期内只持有一个读写连接，各操作在其游标上执行，
+    避免每次调用重复打开数据库文件、加载目录与 FTS 扩展。
+    读游标用完后放回空闲池复用，池容量为 CPU 核数；写入独占，共用一个写游标。
 
     Attributes:
         db_path: 临时数据库文件路径。
@@ -30,6 +38,11 @@ class DBMixin(BaseEngine):
         """初始化数据库 Mixin。"""
         super().__init__(*args, **kwargs)
         self._db_path: Path | None = None
+        self._conn: duckdb.DuckDBPyConnection | None = None
+        self._conn_lock = threading.Lock()
+        self._read_cursors: list[duckdb.DuckDBPyConnection] = []
+        self._write_cursor: duckdb.DuckDBPyConnection | None = None
+        self._read_pool_size = os.cpu_count() or 4
         self._rw_lock = FairReadWriteLock()
         self._cleaned_up = False
         atexit.register(self._cleanup_on_exit)
@@ -83,44 +96,157 @@ class DBMixin(BaseEngine):
         finally:
             conn.close()
 
+    def _get_connection(self) -> duckdb.DuckDBPyConnection:
+        """获取长连接（懒加载）。
+
+        首次调用时打开读写连接并加载 FTS 扩展，之后复用同一连接。
+
+        Returns:
+            引擎持有的 DuckDB 连接实例。
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                conn = duckdb.connect(str(self.db_path), read_only=False)
+                try:
+                    conn.execute("LOAD fts")
+                except Exception:
+                    conn.close()
+                    raise
+                self._conn = conn
+            return self._conn
+
     def _create_read_connection(self) -> duckdb.DuckDBPyConnection:
-        """创建只读连接。
+        """创建读游标。
+
+        游标共享长连接的数据库实例，调用方负责关闭。
 
         Returns:
-            只读 DuckDB 连接实例。
+            DuckDB 游标实例。
+        """
+        return self._get_connection().cursor()
+
+    @contextmanager
+    def _acquire_read_cursor(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+        """从空闲池借出读游标，用完归还。
+
+        执行出错的游标直接关闭丢弃，池满时归还的游标也直接关闭。
+
+        Yields:
+            DuckDB 游标实例。
         """
-        conn = duckdb.connect(str(self.db_path), read_only=True)
-        conn.execute("LOAD fts")
-        return conn
+        with self._conn_lock:
+            cursor = self._read_cursors.pop() if self._read_cursors else None
+        if cursor is None:
+            cursor = self._create_read_connection()
+        try:
+            yield cursor
+        except BaseException:
+            cursor.close()
+            raise
+        with self._conn_lock:
+            if self._conn is not None and len(self._read_cursors) < self._read_pool_size:
+                self._read_cursors.append(cursor)
+                return
+        cursor.close()
 
     def _create_write_connection(self) -> duckdb.DuckDBPyConnection:
-        """创建写连接。
+        """创建写游标。
+
+        游标共享长连接的数据库实例，调用方负责关闭。
 
         Returns:
-            读写 DuckDB 连接实例。
+            DuckDB 游标实例。
         """
-        conn = duckdb.connect(str(self.db_path), read_only=False)
-        conn.execute("LOAD fts")
-        return conn
+        return self._get_connection().cursor()
+
+    def _get_write_cursor(self) -> duckdb.DuckDBPyConnection:
+        """获取复用的写游标（懒加载）。
+
+        写操作由读写锁保证独占，同一时刻至多一个持有者，因此所有写入共用一个游标，
+        省去每次写入创建与关闭游标的开销。调用方必须持有写锁。
 
-    def execute_read(self, sql: str, params: list | None = None) -> list:
+        Returns:
+            DuckDB 游标实例。
+        """
+        if self._write_cursor is None:
+            self._write_cursor = self._create_write_connection()
+        return self._write_cursor
+
+    def _discard_write_cursor(self) -> None:
+        """关闭并丢弃写游标，下次写入时重新创建。调用方必须持有写锁。"""
+        if self._write_cursor is not None:
+            self._write_cursor.close()
+            self._write_cursor = None
+
+    def execute_read(
+        self,
+        sql: str,
+        params: list | None = None,
+        views: dict[str, Any] | None = None,
+    ) -> list:
         """执行读操作（可并发）。
 
+        在只读事务中执行，写语句会被 DuckDB 拒绝。
+
         Args:
             sql: SQL 查询语句。
             params: 查询参数。
+            views: 执行前注册到游标上的临时视图（视图名到 NumPy 列字典等），
+                执行后注销。视图只对当前游标可见，并发查询互不影响。
 
         Returns:
             查询结果列表。
+
+        Raises:
+            duckdb.InvalidInputException: 包含多条语句时抛出。
+        """
+        return self._run_read(sql, params, views, lambda conn: conn.fetchall())
+
+    def execute_read_record(self, sql: str, params: list | None = None) -> dict[str, Any] | None:
+        """执行读操作并以字典形式返回首行。
+
+        列名直接取自结果描述，无需再查询 information_schema。
+
+        Args:
+            sql: SQL 查询语句。
+            params: 查询参数。
+
+        Returns:
+            列名到值的字典，无结果时返回 None。
         """
-        with self._rw_lock.read_lock():
-            conn = self._create_read_connection()
+
+        def _consume(conn: duckdb.DuckDBPyConnection) -> dict[str, Any] | None:
+            row = conn.fetchone()
+            if row is None:
+                return None
+            return {desc[0]: value for desc, value in zip(conn.description, row, strict=True)}
+
+        return self._run_read(sql, params, None, _consume)
+
+    def _run_read(
+        self,
+        sql: str,
+        params: list | None,
+        views: dict[str, Any] | None,
+        consume: Callable[[duckdb.DuckDBPyConnection], _T],
+    ) -> _T:
+        """在只读事务中执行查询，并用 consume 从游标取回结果。"""
+        if ";" in sql and len(duckdb.extract_statements(sql)) > 1:
+            raise duckdb.InvalidInputException("execute_read only accepts a single statement")
+        with self._rw_lock.read_lock(), self._acquire_read_cursor() as conn:
+            for name, data in (views or {}).items():
+                conn.register(name, data)
+            conn.execute("BEGIN TRANSACTION READ ONLY")
             try:
                 if params:
-                    return conn.execute(sql, params).fetchall()
-                return conn.execute(sql).fetchall()
+                    conn.execute(sql, params)
+                else:
+                    conn.execute(sql)
+                return consume(conn)
             finally:
-                conn.close()
+                conn.execute("ROLLBACK")
+                for name in views or ():
+                    conn.unregister(name)
 
     def execute_write(self, sql: str, params: list | None = None) -> None:
         """执行写操作（独占）。
@@ -130,14 +256,11 @@ class DBMixin(BaseEngine):
             params: 语句参数。
         """
         with self._rw_lock.write_lock():
-            conn = self._create_write_connection()
-            try:
-                if params:
-                    conn.execute(sql, params)
-                else:
-                    conn.execute(sql)
-            finally:
-                conn.close()
+            conn = self._get_write_cursor()
+            if params:
+                conn.execute(sql, params)
+            else:
+                conn.execute(sql)
 
     def execute_write_with_result(self, sql: str, params: list | None = None) -> list:
         """执行写操作并返回结果（独占）。
@@ -150,40 +273,40 @@ class DBMixin(BaseEngine):
             执行结果列表。
         """
         with self._rw_lock.write_lock():
-            conn = self._create_write_connection()
-            try:
-                if params:
-                    return conn.execute(sql, params).fetchall()
-                return conn.execute(sql).fetchall()
-            finally:
-                conn.close()
+            conn = self._get_write_cursor()
+            if params:
+                return conn.execute(sql, params).fetchall()
+            return conn.execute(sql).fetchall()
 
     @contextmanager
     def write_transaction(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
         """写事务上下文（独占）。
 
         Yields:
-            写连接实例。
+            写游标实例。
 
         Raises:
             Exception: 事务执行失败时回滚并抛出异常。
         """
         with self._rw_lock.write_lock():
-            conn = self._create_write_connection()
+            conn = self._get_write_cursor()
+            conn.begin()
             try:
-                conn.begin()
                 yield conn
                 conn.commit()
-            except Exception:
-                conn.rollback()
+            except BaseException:
+                # 游标会被后续写入复用，任何异常（含取消）都必须结束事务；回滚失败则丢弃游标。
+                try:
+                    conn.rollback()
+                except duckdb.Error:
+                    self._discard_write_cursor()
                 raise
-            finally:
-                conn.close()
 
     def _cleanup_on_exit(self) -> None:
         """程序退出时清理临时文件。"""
         if self._cleaned_up:
             return
+        self._close_connection()
         self._cleanup_temp_files()
         self._cleaned_up = True
 
@@ -205,8 +328,21 @@ class DBMixin(BaseEngine):
             except Exception as e:
                 logger.warning(f"Failed to cleanup temp directory {temp_dir}: {e}")
 
+    def _close_connection(self) -> None:
+        """关闭空闲读游标、写游标与长连接。"""
+        with self._conn_lock:
+            for cursor in self._read_cursors:
+                cursor.close()
+            self._read_cursors.clear()
+            self._discard_write_cursor()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def close(self) -> None:
-        """关闭连接管理器，清理临时文件。"""
+        """关闭长连接，清理临时文件。"""
+        with self._rw_lock.write_lock():
+            self._close_connection()
         self._cleanup_temp_files()
         atexit.unregister(self._cleanup_on_exit)
         logger.debug("Database connection manager closed")
@@ -1,12 +1,15 @@
 """嵌入向量管理 Mixin。"""
 
 import asyncio
-import hashlib
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from duckkb.core.base import BaseEngine
 from duckkb.logger import logger
+from duckkb.utils.hashing import content_hash
+from duckkb.utils.vector import normalize_vectors, register_vector_batch
 
 if TYPE_CHECKING:
     from openai import AsyncOpenAI
@@ -40,6 +43,16 @@ class EmbeddingMixin(BaseEngine):
         """嵌入向量维度。"""
         return self.config.embedding_dim
 
+    @property
+    def embedding_batch_size(self) -> int:
+        """单次 Embedding API 请求的最大文本数，从 embedding 配置读取。"""
+        return self.kb_config.embedding.batch_size
+
+    @property
+    def embedding_max_concurrency(self) -> int:
+        """同时在途的 Embedding API 请求数上限，从 embedding 配置读取。"""
+        return self.kb_config.embedding.max_concurrency
+
     @property
     def openai_client(self) -> "AsyncOpenAI":
         """OpenAI 客户端（懒加载）。"""
@@ -55,50 +68,68 @@ class EmbeddingMixin(BaseEngine):
             )
         return self._openai_client
 
-    async def embed(self, texts: list[str]) -> list[list[float]]:
+    async def embed(self, texts: list[str], hashes: list[str] | None = None) -> list[list[float]]:
         """获取文本列表的向量嵌入，支持缓存和批量处理。
 
         流程：
-        1. 计算文本哈希
+        1. 计算文本哈希，按哈希去重，重复文本只请求一次
         2. 批量查询缓存
-        3. 对缓存未命中的文本调用 OpenAI API
-        4. 将新嵌入存入缓存
+        3. 将缓存未命中的文本按 batch_size 切分，每批一次 OpenAI API 请求，
+           最多 max_concurrency 个批次并发在途
+        4. 每批返回后立即存入缓存，最后按哈希回填到原始顺序
 
         Args:
             texts: 待获取嵌入的文本列表。
+            hashes: 与 texts 一一对应的内容哈希。调用方已为切片算过哈希时传入，
+                避免重复编码与哈希；为 None 时在此计算。
 
         Returns:
             向量嵌入列表，每个元素是与输入文本对应的嵌入向量。
+
+        Raises:
+            Exception: 任一批次 API 调用失败时抛出；此前成功的批次已写入缓存，
+                重试时只会请求失败的部分。
         """
         if not texts:
             return []
 
-        hashes = [self.compute_hash(t) for t in texts]
-
-        cached_map = await asyncio.to_thread(self._get_cached_embeddings_batch, hashes)
-
-        results: list[list[float] | None] = [None] * len(texts)
-        missing_indices: list[int] = []
-        missing_texts: list[str] = []
+        if hashes is None:
+            hashes = [content_hash(t) for t in texts]
+        unique: dict[str, str] = dict(zip(hashes, texts, strict=True))
 
-        for i, h in enumerate(hashes):
-            if h in cached_map:
-                results[i] = cached_map[h]
-            else:
-                missing_indices.append(i)
-                missing_texts.append(texts[i])
+        vectors_by_hash = await asyncio.to_thread(self._get_cached_embeddings_batch, list(unique))
 
-        if missing_texts:
-            logger.debug(f"Embedding cache miss: {len(missing_texts)}/{len(texts)}")
-            new_embeddings = await self._call_embedding_api(missing_texts)
+        missing_hashes = [h for h in unique if h not in vectors_by_hash]
 
-            missing_hashes = [hashes[i] for i in missing_indices]
-            await asyncio.to_thread(self._cache_embeddings_batch, missing_hashes, new_embeddings)
-
-            for idx, embedding in zip(missing_indices, new_embeddings, strict=True):
-                results[idx] = embedding
+        if missing_hashes:
+            logger.debug(
+                "Embedding cache miss: %d/%d unique (%d total)",
+                len(missing_hashes),
+                len(unique),
+                len(texts),
+            )
+            batch_size = self.embedding_batch_size
+            semaphore = asyncio.Semaphore(self.embedding_max_concurrency)
+
+            async def _embed_batch(start: int) -> None:
+                batch_hashes = missing_hashes[start : start + batch_size]
+                async with semaphore:
+                    new_embeddings = await self._call_embedding_api(
+                        [unique[h] for h in batch_hashes]
+                    )
+
+                await asyncio.to_thread(self._cache_embeddings_batch, batch_hashes, new_embeddings)
+                vectors_by_hash.update(zip(batch_hashes, new_embeddings, strict=True))
+
+            outcomes = await asyncio.gather(
+                *(_embed_batch(start) for start in range(0, len(missing_hashes), batch_size)),
+                return_exceptions=True,
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
 
-        return [r if r is not None else [] for r in results]
+        return [vectors_by_hash.get(h, []) for h in hashes]
 
     async def embed_single(self, text: str) -> list[float]:
         """获取单个文本的向量嵌入。
@@ -121,11 +152,14 @@ class EmbeddingMixin(BaseEngine):
         Returns:
             MD5 哈希字符串。
         """
-        return hashlib.md5(text.encode("utf-8")).hexdigest()
+        return content_hash(text)
 
     def _get_cached_embeddings_batch(self, hashes: list[str]) -> dict[str, list[float]]:
         """批量查询缓存中的向量嵌入。
 
+        以单条 ``UPDATE ... RETURNING`` 同时刷新命中条目的 last_used 并取回向量，
+        哈希列表作为一个 LIST 参数绑定。
+
         Args:
             hashes: 文本哈希列表。
 
@@ -135,20 +169,12 @@ class EmbeddingMixin(BaseEngine):
         if not hashes:
             return {}
         try:
-            placeholders = ",".join("?" * len(hashes))
-            rows = self.execute_read(
-                f"SELECT content_hash, vector FROM {SEARCH_CACHE_TABLE} "
-                f"WHERE content_hash IN ({placeholders})",
-                hashes,
+            rows = self.execute_write_with_result(
+                f"UPDATE {SEARCH_CACHE_TABLE} SET last_used = ? "
+                "WHERE content_hash IN (SELECT unnest(?::VARCHAR[])) "
+                "RETURNING content_hash, vector",
+                [datetime.now(UTC), hashes],
             )
-
-            now = datetime.now(UTC)
-            for h, _ in rows:
-                self.execute_write(
-                    f"UPDATE {SEARCH_CACHE_TABLE} SET last_used = ? WHERE content_hash = ?",
-                    [now, h],
-                )
-
             return {r[0]: r[1] for r in rows if r[1] is not None}
         except Exception as e:
             logger.warning(f"Cache lookup failed: {e}")
@@ -157,6 +183,8 @@ class EmbeddingMixin(BaseEngine):
     def _cache_embeddings_batch(self, hashes: list[str], embeddings: list[list[float]]) -> None:
         """批量存储向量嵌入到缓存。
 
+        向量以列式 NumPy 缓冲区整批写入，避免逐行绑定列表参数。
+
         Args:
             hashes: 文本哈希列表。
             embeddings: 嵌入向量列表。
@@ -165,24 +193,38 @@ class EmbeddingMixin(BaseEngine):
             return
         try:
             now = datetime.now(UTC)
-            data = [(h, emb, now, now) for h, emb in zip(hashes, embeddings, strict=True)]
+            unique = dict(zip(hashes, embeddings, strict=True))
+            keys = {
+                "row": np.arange(len(unique), dtype=np.int64),
+                "content_hash": np.array(list(unique.keys()), dtype=object),
+            }
             with self.write_transaction() as conn:
-                conn.executemany(
-                    f"INSERT OR REPLACE INTO {SEARCH_CACHE_TABLE} "
-                    "(content_hash, vector, last_used, created_at) VALUES (?, ?, ?, ?)",
-                    data,
-                )
+                vectors_sql = register_vector_batch(conn, "_embed_vectors", list(unique.values()))
+                conn.register("_embed_keys", keys)
+                try:
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO {SEARCH_CACHE_TABLE} "
+                        "(content_hash, vector, last_used, created_at) "
+                        f"SELECT k.content_hash, v.vector, ?, ? "
+                        f"FROM _embed_keys k JOIN {vectors_sql} v USING (row)",
+                        [now, now],
+                    )
+                finally:
+                    conn.unregister("_embed_keys")
+                    conn.unregister("_embed_vectors")
         except Exception as e:
             logger.error(f"Failed to cache embeddings: {e}")
 
     async def _call_embedding_api(self, texts: list[str]) -> list[list[float]]:
         """调用 OpenAI Embedding API。
 
+        返回的向量统一做 L2 归一化后再入缓存与索引，检索时以内积代替余弦相似度。
+
         Args:
             texts: 待嵌入的文本列表。
 
         Returns:
-            嵌入向量列表。
+            归一化后的嵌入向量列表。
 
         Raises:
             Exception: API 调用失败时抛出。
@@ -191,7 +233,8 @@ class EmbeddingMixin(BaseEngine):
             response = await self.openai_client.embeddings.create(
                 input=texts, model=self.embedding_model
             )
-            return [d.embedding for d in response.data]
+            embeddings = [d.embedding for d in response.data]
+            return normalize_vectors(embeddings).tolist() if embeddings else []
         except Exception as e:
             logger.error(f"Failed to call embedding API: {e}")
             raise
@@ -497,18 +497,11 @@ class GraphMixin(BaseEngine):
         """
         validate_table_name(table_name)
 
-        def _fetch() -> dict[str, Any] | None:
-            rows = self.execute_read(
-                f"SELECT * FROM {table_name} WHERE __id = ?",
-                [node_id],
-            )
-            if not rows:
-                return None
-
-            columns = self._get_table_columns(table_name)
-            return dict(zip(columns, rows[0], strict=True))
-
-        return await asyncio.to_thread(_fetch)
+        return await asyncio.to_thread(
+            self.execute_read_record,
+            f"SELECT * FROM {table_name} WHERE __id = ?",
+            [node_id],
+        )
 
     def _get_node_type_by_table(self, table_name: str) -> str | None:
         """根据表名获取节点类型名称。
@@ -1,7 +1,6 @@
 """知识导入能力 Mixin。"""
 
 import asyncio
-import hashlib
 import os
 import shutil
 import uuid
@@ -9,13 +8,53 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import yaml
-from jsonschema import ValidationError, validate
+from jsonschema import validators
+from jsonschema.exceptions import best_match
 
 from duckkb.constants import validate_table_name
 from duckkb.core.base import BaseEngine
-from duckkb.core.mixins.index import SEARCH_CACHE_TABLE, SEARCH_INDEX_TABLE
+from duckkb.core.mixins.index import (
+    FTS_CACHE_INSERT_SQL,
+    INDEX_INSERT_BATCH_SIZE,
+    INDEX_NODE_CONCURRENCY,
+    SEARCH_CACHE_TABLE,
+    SEARCH_INDEX_TABLE,
+    get_search_fields,
+)
+from duckkb.core.models.ontology import NodeType
 from duckkb.logger import logger
+from duckkb.utils.fs import fsync_dir
+from duckkb.utils.hashing import content_hash
+from duckkb.utils.vector import register_vector_batch
+
+DUMP_TABLE_CONCURRENCY = 4
+
+# libyaml 可用时使用 C 实现的安全加载器，解析速度比纯 Python 实现高一个数量级。
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _carry_over_dir(src: Path, dst: Path) -> None:
+    """把未变更表的导出目录搬入影子目录。
+
+    优先使用硬链接，零拷贝；导出总是写临时文件后 rename，不会原地修改，
+    因此新旧目录共享 inode 是安全的。跨设备等无法硬链接时退化为复制。
+
+    Args:
+        src: 当前 data 目录下的表目录。
+        dst: 影子目录下的目标路径。
+    """
+    if not src.exists():
+        return
+
+    def _link_or_copy(s: str, d: str) -> None:
+        try:
+            os.link(s, d)
+        except OSError:
+            shutil.copy2(s, d)
+
+    shutil.copytree(src, dst, copy_function=_link_or_copy)
 
 
 class ImportMixin(BaseEngine):
@@ -31,6 +70,9 @@ class ImportMixin(BaseEngine):
         """初始化导入 Mixin。"""
         super().__init__(*args, **kwargs)
         self._import_lock = asyncio.Lock()
+        # 上次成功导出到 data/cache 的缓存表状态指纹，未变化时直接沿用旧文件。
+        self._persisted_cache_state: tuple | None = None
+        self._bundle_validator: Any = None
 
     async def import_knowledge_bundle(self, temp_file_path: str) -> dict[str, Any]:
         """导入知识包。
@@ -46,7 +88,7 @@ class ImportMixin(BaseEngine):
            - 验证边引用完整性
            - 构建索引（search_index）
            - 提交事务（失败则回滚）
-        4. 异步计算向量嵌入
+        4. 异步计算向量嵌入（与 FTS 索引重建并发执行）
         5. 影子导出
            - 创建影子目录
            - 导出业务数据（JSONL）
@@ -81,23 +123,17 @@ class ImportMixin(BaseEngine):
             shadow_dir = data_dir.parent / f"{data_dir.name}_shadow"
 
             try:
-                content = await self._read_file(path)
-                data = yaml.safe_load(content)
+                data = await asyncio.to_thread(self._load_yaml_file, path)
 
                 if not isinstance(data, list):
                     raise ValueError("YAML file must contain an array at root level")
 
-                get_bundle_schema = getattr(self, "get_bundle_schema", None)
-                if get_bundle_schema is None:
-                    raise RuntimeError("get_bundle_schema method not available")
-                bundle_schema = get_bundle_schema()
-                full_schema = bundle_schema["full_bundle_schema"]
-
-                try:
-                    validate(instance=data, schema=full_schema)
-                except ValidationError as e:
-                    path_str = ".".join(str(p) for p in e.absolute_path)
-                    raise ValueError(f"Validation error at [{path_str}]: {e.message}") from e
+                error = best_match(self._get_bundle_validator().iter_errors(data))
+                if error is not None:
+                    path_str = ".".join(str(p) for p in error.absolute_path)
+                    raise ValueError(
+                        f"Validation error at [{path_str}]: {error.message}"
+                    ) from error
 
                 nodes_data: list[dict[str, Any]] = []
                 edges_data: list[dict[str, Any]] = []
@@ -116,18 +152,21 @@ class ImportMixin(BaseEngine):
                 upserted_ids = result["upserted_ids"]
                 deleted_ids = result["deleted_ids"]
 
-                vector_result = await self._compute_vectors_async(upserted_ids)
-
-                if hasattr(self, "rebuild_fts_index"):
-                    await asyncio.to_thread(self.rebuild_fts_index)
+                # 向量计算受网络约束，FTS 重建受本地 IO/CPU 约束，两者互不依赖，
+                # 并发执行使耗时从两者之和降为两者之最大值。
+                # FTS 重建是全量的，索引内容没有增删时沿用现有 FTS 索引。
+                post_tasks = [self._compute_vectors_async(upserted_ids)]
+                if result["fts_dirty"] and hasattr(self, "rebuild_fts_index"):
+                    post_tasks.append(asyncio.to_thread(self.rebuild_fts_index))
+                vector_result, *_ = await asyncio.gather(*post_tasks)
 
                 dumped = await self._dump_to_shadow_dir(
                     upserted_ids,
                     deleted_ids,
+                    touched_edges={item["type"] for item in edges_data},
                 )
 
-                if dumped:
-                    await self._atomic_replace_data_dir()
+                await self._atomic_replace_data_dir()
 
                 return {
                     "status": "success",
@@ -139,6 +178,7 @@ class ImportMixin(BaseEngine):
                 }
 
             except Exception:
+                self._persisted_cache_state = None
                 if shadow_dir.exists():
                     try:
                         await asyncio.to_thread(shutil.rmtree, shadow_dir)
@@ -152,19 +192,45 @@ class ImportMixin(BaseEngine):
                     except Exception as cleanup_error:
                         logger.warning(f"Failed to cleanup temp file {path}: {cleanup_error}")
 
-    async def _read_file(self, path: Path) -> str:
-        """异步读取文件内容。
+    def _get_bundle_validator(self) -> Any:
+        """获取知识包 Schema 校验器。
+
+        本体在引擎生命周期内不变，元 Schema 检查与校验器构造只在首次调用时执行，
+        之后每次导入直接复用。
+
+        Returns:
+            jsonschema 校验器实例。
+
+        Raises:
+            RuntimeError: 缺少 get_bundle_schema 方法时抛出。
+        """
+        if self._bundle_validator is None:
+            get_bundle_schema = getattr(self, "get_bundle_schema", None)
+            if get_bundle_schema is None:
+                raise RuntimeError("get_bundle_schema method not available")
+            full_schema = get_bundle_schema()["full_bundle_schema"]
+            validator_cls = validators.validator_for(full_schema)
+            validator_cls.check_schema(full_schema)
+            self._bundle_validator = validator_cls(full_schema)
+        return self._bundle_validator
+
+    def _load_yaml_file(self, path: Path) -> Any:
+        """从文件流解析 YAML。
+
+        直接把文件对象交给解析器按块读取，不先整体读入字符串，
+        峰值内存不再额外持有一份完整文件内容。Linux 下提示内核顺序预读，
+        libyaml 可用时使用 CSafeLoader。
 
         Args:
             path: 文件路径。
 
         Returns:
-            文件内容字符串。
+            解析后的 YAML 数据。
         """
-        import aiofiles
-
-        async with aiofiles.open(path, encoding="utf-8") as f:
-            return await f.read()
+        with path.open(encoding="utf-8") as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            return yaml.load(f, Loader=_YAML_LOADER)
 
     async def _unlink_file(self, path: Path) -> None:
         """异步删除文件。
@@ -223,18 +289,16 @@ class ImportMixin(BaseEngine):
         if source_node_def is None or target_node_def is None:
             return
 
+        # 查询语句只取决于节点定义，在循环外构建一次。
+        source_sql = self._identity_lookup_sql(source_node_def)
+        target_sql = self._identity_lookup_sql(target_node_def)
+
         for idx, item in enumerate(items):
             source = item.get("source", {})
             target = item.get("target", {})
 
             source_identity_values = [source.get(f) for f in source_node_def.identity]
-            source_placeholders = " AND ".join(
-                f"{f} = ?" for f in source_node_def.identity
-            )
-            source_row = conn.execute(
-                f"SELECT __id FROM {source_node_def.table} WHERE {source_placeholders}",
-                source_identity_values,
-            ).fetchone()
+            source_row = conn.execute(source_sql, source_identity_values).fetchone()
 
             if not source_row:
                 raise ValueError(
@@ -243,13 +307,7 @@ class ImportMixin(BaseEngine):
                 )
 
             target_identity_values = [target.get(f) for f in target_node_def.identity]
-            target_placeholders = " AND ".join(
-                f"{f} = ?" for f in target_node_def.identity
-            )
-            target_row = conn.execute(
-                f"SELECT __id FROM {target_node_def.table} WHERE {target_placeholders}",
-                target_identity_values,
-            ).fetchone()
+            target_row = conn.execute(target_sql, target_identity_values).fetchone()
 
             if not target_row:
                 raise ValueError(
@@ -297,7 +355,9 @@ class ImportMixin(BaseEngine):
                     if upsert_items:
                         self._validate_edge_references(conn, edge_type, upsert_items)
 
-                indexed_result = self._build_index_for_ids_sync(conn, node_upserted_ids)
+                indexed_result, index_changed = self._build_index_for_ids_sync(
+                    conn, node_upserted_ids
+                )
 
                 return {
                     "nodes": nodes_result,
@@ -305,9 +365,12 @@ class ImportMixin(BaseEngine):
                     "indexed": indexed_result,
                     "upserted_ids": node_upserted_ids,
                     "deleted_ids": node_deleted_ids,
+                    "fts_dirty": index_changed or any(node_deleted_ids.values()),
                 }
 
-        return await asyncio.to_thread(_execute)
+        result = await asyncio.to_thread(_execute)
+        self._invalidate_search_results()
+        return result
 
     def _import_nodes_sync(
         self, conn: Any, data: list[dict[str, Any]]
@@ -464,14 +527,11 @@ class ImportMixin(BaseEngine):
             batch_params,
         )
 
-        identity_placeholders = " AND ".join(f"{f} = ?" for f in node_def.identity)
+        identity_sql = self._identity_lookup_sql(node_def)
         record_ids: list[int] = []
         for record in records:
             identity_values = [record.get(f) for f in node_def.identity]
-            row = conn.execute(
-                f"SELECT __id FROM {table_name} WHERE {identity_placeholders}",
-                identity_values,
-            ).fetchone()
+            row = conn.execute(identity_sql, identity_values).fetchone()
             if row:
                 record_ids.append(row[0])
 
@@ -503,18 +563,7 @@ class ImportMixin(BaseEngine):
         table_name = node_def.table
         validate_table_name(table_name)
 
-        identity_placeholders = " AND ".join(f"{f} = ?" for f in node_def.identity)
-        record_ids: list[int] = []
-        for item in items:
-            record = {k: v for k, v in item.items() if k not in ("type", "action")}
-            identity_values = [record.get(f) for f in node_def.identity]
-            row = conn.execute(
-                f"SELECT __id FROM {table_name} WHERE {identity_placeholders}",
-                identity_values,
-            ).fetchone()
-            if row:
-                record_ids.append(row[0])
-
+        record_ids = self._lookup_node_ids_sync(conn, node_def, items)
         if not record_ids:
             return [], 0
 
@@ -522,14 +571,57 @@ class ImportMixin(BaseEngine):
 
         self._delete_index_for_ids(conn, table_name, record_ids)
 
-        placeholders = ", ".join(["?" for _ in record_ids])
         conn.execute(
-            f"DELETE FROM {table_name} WHERE __id IN ({placeholders})",
-            record_ids,
+            f"DELETE FROM {table_name} WHERE __id IN (SELECT unnest(?::BIGINT[]))",
+            [record_ids],
         )
 
         return record_ids, len(record_ids)
 
+    def _identity_lookup_sql(self, node_def: NodeType) -> str:
+        """构建按业务键查询单个节点 ID 的 SQL。
+
+        Args:
+            node_def: 节点类型定义。
+
+        Returns:
+            以 identity 字段顺序绑定参数的 SELECT 语句。
+        """
+        conditions = " AND ".join(f"{f} = ?" for f in node_def.identity)
+        return f"SELECT __id FROM {node_def.table} WHERE {conditions}"
+
+    def _lookup_node_ids_sync(
+        self, conn: Any, node_def: NodeType, items: list[dict[str, Any]]
+    ) -> list[int]:
+        """按业务键批量查询节点 ID。
+
+        将所有业务键作为列参数展开为一张临时关系，与节点表做一次哈希连接，
+        取代逐条 SELECT 的 N 次往返。
+
+        Args:
+            conn: 数据库连接。
+            node_def: 节点类型定义。
+            items: 包含业务键字段的数据列表。
+
+        Returns:
+            匹配到的节点 ID 列表（去重）。
+        """
+        identity = list(node_def.identity)
+        keys = {tuple(item.get(f) for f in identity) for item in items}
+        keys = {key for key in keys if None not in key}
+        if not keys:
+            return []
+
+        key_columns = [list(column) for column in zip(*keys, strict=True)]
+        key_select = ", ".join(f"unnest(?) AS {f}" for f in identity)
+        join_cond = " AND ".join(f"t.{f} = k.{f}" for f in identity)
+        rows = conn.execute(
+            f"SELECT DISTINCT t.__id FROM {node_def.table} t "
+            f"JOIN (SELECT {key_select}) k ON {join_cond}",
+            key_columns,
+        ).fetchall()
+        return [row[0] for row in rows]
+
     def _delete_edges_for_nodes(self, conn: Any, node_ids: list[int]) -> int:
         """删除与指定节点相关的所有边。
 
@@ -544,7 +636,6 @@ class ImportMixin(BaseEngine):
             return 0
 
         total_deleted = 0
-        placeholders = ", ".join(["?" for _ in node_ids])
 
         for edge_name in self.ontology.edges.keys():
             table_name = f"edge_{edge_name}"
@@ -553,16 +644,13 @@ class ImportMixin(BaseEngine):
             if not self._table_exists_in_conn(conn, table_name):
                 continue
 
-            count_before = self._get_table_count_in_conn(conn, table_name)
-
-            conn.execute(
+            row = conn.execute(
                 f"DELETE FROM {table_name} "
-                f"WHERE __from_id IN ({placeholders}) OR __to_id IN ({placeholders})",
-                node_ids + node_ids,
-            )
-
-            count_after = self._get_table_count_in_conn(conn, table_name)
-            total_deleted += count_before - count_after
+                "WHERE __from_id IN (SELECT unnest(?::BIGINT[])) "
+                "OR __to_id IN (SELECT unnest(?::BIGINT[]))",
+                [node_ids, node_ids],
+            ).fetchone()
+            total_deleted += row[0] if row else 0
 
         return total_deleted
 
@@ -583,20 +671,6 @@ class ImportMixin(BaseEngine):
         ).fetchone()
         return result is not None
 
-    def _get_table_count_in_conn(self, conn: Any, table_name: str) -> int:
-        """获取表的记录数。
-
-        Args:
-            conn: 数据库连接。
-            table_name: 表名。
-
-        Returns:
-            记录数。
-        """
-        validate_table_name(table_name)
-        result = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
-        return result[0] if result else 0
-
     def _delete_index_for_ids(self, conn: Any, table_name: str, record_ids: list[int]) -> int:
         """删除指定记录的索引条目。
 
@@ -616,27 +690,13 @@ class ImportMixin(BaseEngine):
         if not self._table_exists_in_conn(conn, SEARCH_INDEX_TABLE):
             return 0
 
-        placeholders = ", ".join(["?" for _ in record_ids])
-
+        # ID 列表作为单个数组参数绑定，SQL 文本与 ID 数量无关。
         row = conn.execute(
-            f"SELECT COUNT(*) FROM {SEARCH_INDEX_TABLE} WHERE source_table = ?",
-            [table_name],
-        ).fetchone()
-        count_before = row[0] if row else 0
-
-        conn.execute(
             f"DELETE FROM {SEARCH_INDEX_TABLE} "
-            f"WHERE source_table = ? AND source_id IN ({placeholders})",
-            [table_name] + record_ids,
-        )
-
-        row = conn.execute(
-            f"SELECT COUNT(*) FROM {SEARCH_INDEX_TABLE} WHERE source_table = ?",
-            [table_name],
+            "WHERE source_table = ? AND source_id IN (SELECT unnest(?::BIGINT[]))",
+            [table_name, record_ids],
         ).fetchone()
-        count_after = row[0] if row else 0
-
-        return count_before - count_after
+        return row[0] if row else 0
 
     def _upsert_edges_sync(self, conn: Any, edge_type: str, items: list[dict[str, Any]]) -> int:
         """同步 upsert 边（批量优化版）。
@@ -672,6 +732,8 @@ class ImportMixin(BaseEngine):
             raise ValueError(f"Invalid edge definition: {edge_type}")
 
         now = datetime.now(UTC)
+        source_sql = self._identity_lookup_sql(source_node)
+        target_sql = self._identity_lookup_sql(target_node)
 
         records: list[dict[str, Any]] = []
         for item in items:
@@ -679,19 +741,11 @@ class ImportMixin(BaseEngine):
             target = item.get("target", {})
 
             source_identity_values = [source.get(f) for f in source_node.identity]
-            source_placeholders = " AND ".join(f"{f} = ?" for f in source_node.identity)
-            source_row = conn.execute(
-                f"SELECT __id FROM {source_node.table} WHERE {source_placeholders}",
-                source_identity_values,
-            ).fetchone()
+            source_row = conn.execute(source_sql, source_identity_values).fetchone()
             source_id = source_row[0] if source_row else None
 
             target_identity_values = [target.get(f) for f in target_node.identity]
-            target_placeholders = " AND ".join(f"{f} = ?" for f in target_node.identity)
-            target_row = conn.execute(
-                f"SELECT __id FROM {target_node.table} WHERE {target_placeholders}",
-                target_identity_values,
-            ).fetchone()
+            target_row = conn.execute(target_sql, target_identity_values).fetchone()
             target_id = target_row[0] if target_row else None
 
             if source_id is None or target_id is None:
@@ -763,25 +817,20 @@ class ImportMixin(BaseEngine):
         if source_node is None or target_node is None:
             raise ValueError(f"Invalid edge definition: {edge_type}")
 
+        source_sql = self._identity_lookup_sql(source_node)
+        target_sql = self._identity_lookup_sql(target_node)
+
         record_ids: list[int] = []
         for item in items:
             source = item.get("source", {})
             target = item.get("target", {})
 
             source_identity_values = [source.get(f) for f in source_node.identity]
-            source_placeholders = " AND ".join(f"{f} = ?" for f in source_node.identity)
-            source_row = conn.execute(
-                f"SELECT __id FROM {source_node.table} WHERE {source_placeholders}",
-                source_identity_values,
-            ).fetchone()
+            source_row = conn.execute(source_sql, source_identity_values).fetchone()
             source_id = source_row[0] if source_row else None
 
             target_identity_values = [target.get(f) for f in target_node.identity]
-            target_placeholders = " AND ".join(f"{f} = ?" for f in target_node.identity)
-            target_row = conn.execute(
-                f"SELECT __id FROM {target_node.table} WHERE {target_placeholders}",
-                target_identity_values,
-            ).fetchone()
+            target_row = conn.execute(target_sql, target_identity_values).fetchone()
             target_id = target_row[0] if target_row else None
 
             if source_id is None or target_id is None:
@@ -799,10 +848,9 @@ class ImportMixin(BaseEngine):
 
         self._delete_index_for_ids(conn, table_name, record_ids)
 
-        placeholders = ", ".join(["?" for _ in record_ids])
         conn.execute(
-            f"DELETE FROM {table_name} WHERE __id IN ({placeholders})",
-            record_ids,
+            f"DELETE FROM {table_name} WHERE __id IN (SELECT unnest(?::BIGINT[]))",
+            [record_ids],
         )
 
         return len(record_ids)
@@ -811,40 +859,29 @@ class ImportMixin(BaseEngine):
         self,
         conn: Any,
         upserted_ids: dict[str, list[int]],
-    ) -> dict[str, int]:
+    ) -> tuple[dict[str, int], bool]:
         """在事务内为变更的记录构建索引（增量更新）。
 
-        先删除旧索引，再重建，确保 chunk 数量变化时旧索引被清理。
+        按 (记录, 字段, 分片序号) 对比已有索引的分片内容：内容未变化的分片直接跳过，
+        无需重新计算哈希、分词与向量；变化的分片按复合键原地 upsert，
+        chunk 数量减少时只删除多出的旧分片。
 
         Args:
             conn: 数据库连接。
             upserted_ids: 新增/更新的记录 ID。
 
         Returns:
-            索引统计。
+            (索引统计（重建的分片数）, 索引内容是否有增删)。
         """
         if not self._table_exists_in_conn(conn, SEARCH_INDEX_TABLE):
             create_index_tables = getattr(self, "create_index_tables", None)
             if create_index_tables:
                 create_index_tables()
             else:
-                return {}
-
-        for node_type, ids in upserted_ids.items():
-            if not ids:
-                continue
-            node_def = self.ontology.nodes.get(node_type)
-            if node_def is None:
-                continue
-            table_name = node_def.table
-            validate_table_name(table_name)
-            placeholders = ", ".join(["?" for _ in ids])
-            conn.execute(
-                f"DELETE FROM {SEARCH_INDEX_TABLE} WHERE source_table = ? AND source_id IN ({placeholders})",
-                [table_name] + ids,
-            )
+                return {}, False
 
         indexed: dict[str, int] = {}
+        changed_any = False
 
         for node_type, ids in upserted_ids.items():
             if not ids:
@@ -854,80 +891,132 @@ class ImportMixin(BaseEngine):
             if node_def is None:
                 continue
 
-            search_config = getattr(node_def, "search", None)
-            if not search_config:
-                continue
-
-            fts_fields: list[str] = getattr(search_config, "full_text", []) or []
-            vector_fields: list[str] = getattr(search_config, "vectors", []) or []
-            all_fields: set[str] = set(fts_fields) | set(vector_fields)
+            table_name = node_def.table
+            validate_table_name(table_name)
 
-            if not all_fields:
+            fts_fields, vector_fields, field_list = get_search_fields(node_def)
+            # 没有可检索字段的节点类型从不产生索引条目，无需查询现有状态或回读记录。
+            if not field_list:
                 continue
 
-            table_name = node_def.table
-            validate_table_name(table_name)
-            fields_str = ", ".join(all_fields)
-            placeholders = ", ".join(["?" for _ in ids])
+            existing = self._fetch_index_state_sync(conn, table_name, ids)
 
+            fields_str = ", ".join(field_list)
+            placeholders = ", ".join(["?" for _ in ids])
             rows = conn.execute(
                 f"SELECT __id, {fields_str} FROM {table_name} WHERE __id IN ({placeholders})",
                 ids,
             ).fetchall()
 
-            count = 0
-
+            # 与现有索引逐分片比对：内容未变的分片保持原样（连同已有向量），
+            # 只写入新增或变化的分片，多出的旧分片按序号截断删除，
+            # 避免整字段先删后插。
+            pending: list[tuple[int, str, int, str, str]] = []
+            stale: list[tuple[int, str, int]] = []
             for row in rows:
                 source_id = row[0]
-                field_values = row[1:]
-                field_list = list(all_fields)
-
-                for field_idx, field_name in enumerate(field_list):
-                    content = field_values[field_idx]
+                for field_name, content in zip(field_list, row[1:], strict=True):
                     if not content or not isinstance(content, str):
                         continue
 
                     chunks = self._chunk_text_sync(content)
+                    want_fts = field_name in fts_fields
+                    old_chunks, has_fts = existing.pop((source_id, field_name), ([], want_fts))
+                    if len(old_chunks) > len(chunks):
+                        stale.append((source_id, field_name, len(chunks)))
+                    if has_fts != want_fts:
+                        old_chunks = []
 
                     for chunk_seq, chunk in enumerate(chunks):
-                        content_hash = self._compute_hash_sync(chunk)
-
-                        fts_content = None
-                        if field_name in fts_fields:
-                            fts_content = self._get_or_compute_fts_sync(conn, chunk, content_hash)
-
-                        vector = None
-                        if field_name in vector_fields:
-                            vector = self._get_or_compute_vector_sync(conn, chunk, content_hash)
-
-                        conn.execute(
-                            f"INSERT INTO {SEARCH_INDEX_TABLE} "
-                            "(source_table, source_id, source_field, chunk_seq, content, "
-                            "fts_content, vector, content_hash, created_at) "
-                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
-                            "ON CONFLICT (source_table, source_id, source_field, chunk_seq) "
-                            "DO UPDATE SET content = excluded.content, "
-                            "fts_content = excluded.fts_content, "
-                            "vector = excluded.vector, "
-                            "content_hash = excluded.content_hash, "
-                            "created_at = excluded.created_at",
+                        if chunk_seq < len(old_chunks) and old_chunks[chunk_seq] == chunk:
+                            continue
+                        pending.append(
                             (
-                                table_name,
                                 source_id,
                                 field_name,
                                 chunk_seq,
                                 chunk,
-                                fts_content,
-                                vector,
-                                content_hash,
-                                datetime.now(UTC),
-                            ),
+                                self._compute_hash_sync(chunk),
+                            )
                         )
-                        count += 1
 
-            indexed[node_type] = count
+            stale.extend((sid, field, 0) for sid, field in existing)
+            if stale:
+                conn.executemany(
+                    f"DELETE FROM {SEARCH_INDEX_TABLE} "
+                    "WHERE source_table = ? AND source_id = ? AND source_field = ? "
+                    "AND chunk_seq >= ?",
+                    [(table_name, sid, field, keep) for sid, field, keep in stale],
+                )
+            if stale or pending:
+                changed_any = True
+
+            now = datetime.now(UTC)
+
+            # 所有变化分片的缓存查询、未命中分词与缓存回写各只做一次，
+            # 不再逐个分片往返数据库。
+            fts_map, vector_map = self._fetch_cache_entries_sync(
+                conn, [chash for *_, chash in pending]
+            )
+            fts_misses: dict[str, str] = {}
+            for _, field_name, _, chunk, chash in pending:
+                if field_name in fts_fields and chash not in fts_map:
+                    fts_misses.setdefault(chash, chunk)
+            if fts_misses:
+                fts_map.update(self._segment_and_cache_sync(conn, fts_misses))
+
+            # 条目数已知，按位置填入预分配列表，再按列整批 upsert，
+            # 不再逐行执行 INSERT ... ON CONFLICT。
+            entries: list[tuple] = [()] * len(pending)
+            for i, (source_id, field_name, chunk_seq, chunk, chash) in enumerate(pending):
+                entries[i] = (
+                    table_name,
+                    source_id,
+                    field_name,
+                    chunk_seq,
+                    chunk,
+                    fts_map.get(chash) if field_name in fts_fields else None,
+                    vector_map.get(chash) if field_name in vector_fields else None,
+                    chash,
+                    now,
+                )
+            for start in range(0, len(entries), INDEX_INSERT_BATCH_SIZE):
+                self._insert_index_entries_in_conn(
+                    conn, entries[start : start + INDEX_INSERT_BATCH_SIZE]
+                )
+
+            indexed[node_type] = len(entries)
 
-        return indexed
+        return indexed, changed_any
+
+    def _fetch_index_state_sync(
+        self, conn: Any, table_name: str, ids: list[int]
+    ) -> dict[tuple[int, str], tuple[list[str], bool]]:
+        """获取指定记录的现有索引状态。
+
+        Args:
+            conn: 数据库连接。
+            table_name: 源表名。
+            ids: 记录 ID 列表。
+
+        Returns:
+            以 (source_id, source_field) 为键的字典，值为
+            (按 chunk_seq 排序的分片内容列表, 是否包含全文分词)。
+        """
+        # 分片在 DuckDB 内按 (记录, 字段) 聚合为有序列表，每个字段只跨边界返回一行。
+        rows = conn.execute(
+            "SELECT source_id, source_field, list(content ORDER BY chunk_seq), "
+            "bool_or(fts_content IS NOT NULL) "
+            f"FROM {SEARCH_INDEX_TABLE} "
+            "WHERE source_table = ? AND source_id IN (SELECT unnest(?::BIGINT[])) "
+            "GROUP BY source_id, source_field",
+            [table_name, ids],
+        ).fetchall()
+
+        return {
+            (source_id, source_field): (contents, has_fts)
+            for source_id, source_field, contents, has_fts in rows
+        }
 
     def _chunk_text_sync(self, text: str) -> list[str]:
         """将文本切分为多个片段（同步版本）。
@@ -956,70 +1045,66 @@ class ImportMixin(BaseEngine):
         Returns:
             文本哈希值。
         """
-        return hashlib.md5(text.encode("utf-8")).hexdigest()
-
-    def _get_or_compute_fts_sync(self, conn: Any, text: str, content_hash: str) -> str:
-        """获取或计算分词结果（同步版本）。
+        return content_hash(text)
 
-        优先从缓存获取，缓存未命中则计算并存入缓存。
+    def _fetch_cache_entries_sync(
+        self, conn: Any, hashes: list[str]
+    ) -> tuple[dict[str, str], dict[str, list[float]]]:
+        """批量查询缓存中的分词结果与向量（同步版本）。
 
         Args:
             conn: 数据库连接。
-            text: 待分词文本。
-            content_hash: 文本哈希。
+            hashes: 文本哈希列表，允许重复。
 
         Returns:
-            分词结果（空格分隔）。
+            (哈希到分词结果的字典, 哈希到向量的字典)，只包含缓存中非空的值。
         """
-        if not self._table_exists_in_conn(conn, SEARCH_CACHE_TABLE):
-            return self._segment_text_sync(text)
+        if not hashes or not self._table_exists_in_conn(conn, SEARCH_CACHE_TABLE):
+            return {}, {}
 
-        row = conn.execute(
-            f"SELECT fts_content FROM {SEARCH_CACHE_TABLE} WHERE content_hash = ?",
-            [content_hash],
-        ).fetchone()
-
-        if row and row[0]:
-            return row[0]
-
-        fts_content = self._segment_text_sync(text)
-
-        now = datetime.now(UTC)
-        conn.execute(
-            f"INSERT OR REPLACE INTO {SEARCH_CACHE_TABLE} "
-            "(content_hash, fts_content, last_used, created_at) VALUES (?, ?, ?, ?)",
-            [content_hash, fts_content, now, now],
-        )
+        rows = conn.execute(
+            f"SELECT content_hash, fts_content, vector FROM {SEARCH_CACHE_TABLE} "
+            "WHERE content_hash IN (SELECT unnest(?::VARCHAR[]))",
+            [list(set(hashes))],
+        ).fetchall()
 
-        return fts_content
+        fts_map = {chash: fts for chash, fts, _ in rows if fts}
+        vector_map = {chash: vector for chash, _, vector in rows if vector}
+        return fts_map, vector_map
 
-    def _get_or_compute_vector_sync(
-        self, conn: Any, text: str, content_hash: str
-    ) -> list[float] | None:
-        """获取或计算向量嵌入（同步版本）。
-
-        优先从缓存获取，缓存未命中则返回 None（向量化需要异步 API）。
+    def _segment_and_cache_sync(self, conn: Any, texts: dict[str, str]) -> dict[str, str]:
+        """批量分词并写入缓存（同步版本）。
 
         Args:
             conn: 数据库连接。
-            text: 待向量化文本。
-            content_hash: 文本哈希。
+            texts: 哈希到待分词文本的字典。
 
         Returns:
-            向量嵌入，如果无法同步计算则返回 None。
+            哈希到分词结果（空格分隔）的字典。
         """
-        if not self._table_exists_in_conn(conn, SEARCH_CACHE_TABLE):
-            return None
+        hashes = list(texts.keys())
+        segmented = self._segment_texts_sync(list(texts.values()))
 
-        row = conn.execute(
-            f"SELECT vector FROM {SEARCH_CACHE_TABLE} WHERE content_hash = ?",
-            [content_hash],
-        ).fetchone()
+        if self._table_exists_in_conn(conn, SEARCH_CACHE_TABLE):
+            now = datetime.now(UTC)
+            conn.execute(FTS_CACHE_INSERT_SQL, [hashes, segmented, now, now])
+
+        return dict(zip(hashes, segmented, strict=True))
 
-        if row and row[0]:
-            return row[0]
+    def _segment_texts_sync(self, texts: list[str]) -> list[str]:
+        """批量分词处理（同步版本）。
+
+        委托给 TokenizerMixin._segment_batch_sync，大批量时走分词进程池。
+
+        Args:
+            texts: 待分词文本列表。
 
-        return None
+        Returns:
+            与输入顺序一致的分词结果列表。
+        """
+        if hasattr(self, "_segment_batch_sync"):
+            return self._segment_batch_sync(texts)
+        return [self._segment_text_sync(text) for text in texts]
 
     def _segment_text_sync(self, text: str) -> str:
         """分词处理（同步版本）。
@@ -1041,7 +1126,8 @@ class ImportMixin(BaseEngine):
         """异步计算向量嵌入。
 
         在事务提交后执行，为缓存未命中的内容计算向量。
-        使用批量 API 提高效率。
+        每轮交给 embed 的分片数为 batch_size × max_concurrency，使 Embedding 请求并发跑满；
+        各节点类型以 INDEX_NODE_CONCURRENCY 为上限并发处理。
 
         Args:
             upserted_ids: 需要计算向量的记录 ID。
@@ -1052,8 +1138,43 @@ class ImportMixin(BaseEngine):
         if not hasattr(self, "embed"):
             return {}
 
-        vector_result: dict[str, dict[str, int]] = {}
+        async def _vectors_for(
+            table_name: str, ids: list[int], vector_fields: list[str]
+        ) -> dict[str, int]:
+            hashes, texts = await asyncio.to_thread(
+                self._fetch_pending_vector_chunks, table_name, ids, vector_fields
+            )
+
+            # 每轮交给 embed 的文本数恰好能让 max_concurrency 个 batch_size 请求同时在途，
+            # 逐轮写入索引，失败只影响当轮，内存占用也不随待向量化分片总数增长。
+            batch_size = self.embedding_batch_size * self.embedding_max_concurrency
+            success_count = 0
+            failed_count = 0
+
+            for i in range(0, len(hashes), batch_size):
+                batch_hashes = hashes[i : i + batch_size]
 
+                # embed 返回的向量直接按哈希写入索引，不依赖缓存写入是否成功；
+                # 写入索引失败的批次计为失败，分片保持无向量，下次导入时重试。
+                try:
+                    vectors = await self.embed(texts[i : i + batch_size], batch_hashes)
+                    written = await asyncio.to_thread(
+                        self._write_vectors_to_index,
+                        table_name,
+                        ids,
+                        vector_fields,
+                        batch_hashes,
+                        vectors,
+                    )
+                    success_count += written
+                    failed_count += len(batch_hashes) - written
+                except Exception as e:
+                    logger.error(f"Failed to compute vectors batch for {table_name}: {e}")
+                    failed_count += len(batch_hashes)
+
+            return {"success": success_count, "failed": failed_count}
+
+        jobs: dict[str, tuple[str, list[int], list[str]]] = {}
         for node_type, ids in upserted_ids.items():
             if not ids:
                 continue
@@ -1062,188 +1183,128 @@ class ImportMixin(BaseEngine):
             if node_def is None:
                 continue
 
-            search_config = getattr(node_def, "search", None)
-            if not search_config:
-                continue
-
-            vector_fields: list[str] = getattr(search_config, "vectors", []) or []
+            _, vector_fields, _ = get_search_fields(node_def)
             if not vector_fields:
                 continue
 
-            table_name = node_def.table
-            validate_table_name(table_name)
-            fields_str = ", ".join(vector_fields)
-            placeholders = ", ".join(["?" for _ in ids])
-
-            records = await asyncio.to_thread(
-                self._fetch_records_for_vector,
-                table_name,
-                fields_str,
-                placeholders,
-                ids,
-            )
-
-            chunks_to_embed: list[tuple[str, str, int, str, int]] = []
-            for record in records:
-                source_id = record[0]
-                field_values = record[1:]
+            validate_table_name(node_def.table)
+            jobs[node_type] = (node_def.table, ids, vector_fields)
 
-                for field_idx, field_name in enumerate(vector_fields):
-                    content = field_values[field_idx]
-                    if not content or not isinstance(content, str):
-                        continue
-
-                    text_chunks = self._chunk_text_sync(content)
-
-                    for chunk_seq, chunk in enumerate(text_chunks):
-                        content_hash = self._compute_hash_sync(chunk)
-
-                        existing_vector = await asyncio.to_thread(
-                            self._check_vector_cache,
-                            content_hash,
-                        )
-                        if existing_vector:
-                            continue
+        # 各节点类型的向量化互不依赖，以有限并发同时进行，
+        # 使不同表的 API 请求与回填写入重叠。
+        semaphore = asyncio.Semaphore(INDEX_NODE_CONCURRENCY)
 
-                        chunks_to_embed.append(
-                            (content_hash, chunk, source_id, field_name, chunk_seq)
-                        )
+        async def _guarded(job: tuple[str, list[int], list[str]]) -> dict[str, int]:
+            async with semaphore:
+                return await _vectors_for(*job)
 
-            if not chunks_to_embed:
-                vector_result[node_type] = {"success": 0, "failed": 0}
-                continue
+        results = await asyncio.gather(*(_guarded(job) for job in jobs.values()))
+        return dict(zip(jobs, results, strict=True))
 
-            batch_size = 100
-            success_count = 0
-            failed_count = 0
-
-            for i in range(0, len(chunks_to_embed), batch_size):
-                batch = chunks_to_embed[i : i + batch_size]
-                hashes = [item[0] for item in batch]
-                texts = [item[1] for item in batch]
-                metas = [(item[2], item[3], item[4]) for item in batch]
-
-                try:
-                    vectors = await self.embed(texts)
-
-                    save_tasks = []
-                    for j, (content_hash, vector, (source_id, field_name, chunk_seq)) in enumerate(
-                        zip(hashes, vectors, metas)
-                    ):
-                        save_tasks.append(
-                            asyncio.to_thread(
-                                self._save_vector_to_cache,
-                                content_hash,
-                                vector,
-                                table_name,
-                                source_id,
-                                field_name,
-                                chunk_seq,
-                            )
-                        )
-
-                    await asyncio.gather(*save_tasks)
-                    success_count += len(batch)
-
-                except Exception as e:
-                    logger.error(f"Failed to compute vectors batch for {table_name}: {e}")
-                    failed_count += len(batch)
-
-            vector_result[node_type] = {"success": success_count, "failed": failed_count}
-
-        return vector_result
-
-    def _fetch_records_for_vector(
+    def _fetch_pending_vector_chunks(
         self,
         table_name: str,
-        fields_str: str,
-        placeholders: str,
         ids: list[int],
-    ) -> list[tuple]:
-        """获取需要计算向量的记录。
-
-        Args:
-            table_name: 表名。
-            fields_str: 字段列表字符串。
-            placeholders: 占位符字符串。
-            ids: 记录 ID 列表。
-
-        Returns:
-            记录列表。
-        """
-        validate_table_name(table_name)
-        return self.execute_read(
-            f"SELECT __id, {fields_str} FROM {table_name} WHERE __id IN ({placeholders})",
-            ids,
-        )
+        vector_fields: list[str],
+    ) -> tuple[list[str], list[str]]:
+        """获取尚无向量的索引分片。
 
-    def _check_vector_cache(self, content_hash: str) -> list[float] | None:
-        """检查向量缓存。
+        索引构建时已完成切片与哈希，并从缓存回填了已有向量，这里直接取回
+        向量仍为空的分片，无需重新读取记录、切片和计算哈希；此前向量化失败的
+        分片也会在下次导入时重试。结果按列取回，不逐行构造元组再拆分。
 
         Args:
-            content_hash: 内容哈希。
+            table_name: 源表名。
+            ids: 记录 ID 列表。
+            vector_fields: 需要向量的字段。
 
         Returns:
-            缓存的向量，如果不存在则返回 None。
+            (content_hash 列表, content 列表)，两者一一对应。
         """
-        rows = self.execute_read(
-            f"SELECT vector FROM {SEARCH_CACHE_TABLE} WHERE content_hash = ?",
-            [content_hash],
+        columns = self._run_read(
+            f"SELECT content_hash, content FROM {SEARCH_INDEX_TABLE} "
+            "WHERE source_table = ? AND vector IS NULL "
+            "AND source_id IN (SELECT unnest(?::BIGINT[])) "
+            "AND source_field IN (SELECT unnest(?::VARCHAR[])) "
+            "ORDER BY source_id, source_field, chunk_seq",
+            [table_name, ids, vector_fields],
+            None,
+            lambda conn: conn.fetchnumpy(),
         )
-        return rows[0][0] if rows else None
+        return columns["content_hash"].tolist(), columns["content"].tolist()
 
-    def _save_vector_to_cache(
+    def _write_vectors_to_index(
         self,
-        content_hash: str,
-        vector: list[float],
         table_name: str,
-        source_id: int,
-        field_name: str,
-        chunk_seq: int,
-    ) -> None:
-        """保存向量到缓存并更新索引。
+        ids: list[int],
+        vector_fields: list[str],
+        hashes: list[str],
+        vectors: list[list[float]],
+    ) -> int:
+        """将向量按内容哈希写入尚无向量的索引分片。
 
-        使用事务确保缓存和索引的一致性。
+        向量以列式 NumPy 缓冲区注册为视图，一条 ``UPDATE ... FROM`` 按哈希整批写入，
+        相同内容的分片共享同一个向量。
 
         Args:
-            content_hash: 内容哈希。
-            vector: 向量嵌入。
-            table_name: 表名。
-            source_id: 源记录 ID。
-            field_name: 字段名。
-            chunk_seq: 分片序号。
+            table_name: 源表名。
+            ids: 记录 ID 列表。
+            vector_fields: 需要向量的字段。
+            hashes: 内容哈希列表。
+            vectors: 与 hashes 一一对应的向量，空向量表示未取得。
+
+        Returns:
+            取得向量的分片数（按 hashes 计，含重复）。
         """
         validate_table_name(table_name)
-        now = datetime.now(UTC)
 
+        unique = {h: v for h, v in zip(hashes, vectors, strict=True) if v}
+        if not unique:
+            return 0
+
+        keys = {
+            "row": np.arange(len(unique), dtype=np.int64),
+            "content_hash": np.array(list(unique), dtype=object),
+        }
         with self.write_transaction() as conn:
-            conn.execute(
-                f"INSERT OR REPLACE INTO {SEARCH_CACHE_TABLE} "
-                "(content_hash, vector, last_used, created_at) VALUES (?, ?, ?, ?)",
-                [content_hash, vector, now, now],
-            )
-            conn.execute(
-                f"UPDATE {SEARCH_INDEX_TABLE} SET vector = ? "
-                f"WHERE source_table = ? AND source_id = ? AND "
-                f"source_field = ? AND chunk_seq = ?",
-                [vector, table_name, source_id, field_name, chunk_seq],
-            )
+            vectors_sql = register_vector_batch(conn, "_index_vectors", list(unique.values()))
+            conn.register("_index_vector_keys", keys)
+            try:
+                conn.execute(
+                    f"UPDATE {SEARCH_INDEX_TABLE} AS i SET vector = v.vector "
+                    f"FROM (SELECT k.content_hash, b.vector FROM _index_vector_keys k "
+                    f"JOIN {vectors_sql} b USING (row)) AS v "
+                    "WHERE i.content_hash = v.content_hash "
+                    "AND i.source_table = ? AND i.vector IS NULL "
+                    "AND i.source_id IN (SELECT unnest(?::BIGINT[])) "
+                    "AND i.source_field IN (SELECT unnest(?::VARCHAR[]))",
+                    [table_name, ids, vector_fields],
+                )
+            finally:
+                conn.unregister("_index_vector_keys")
+                conn.unregister("_index_vectors")
+        self._invalidate_search_results()
+        return sum(1 for h in hashes if h in unique)
 
     async def _dump_to_shadow_dir(
         self,
         upserted_ids: dict[str, list[int]],
         deleted_ids: dict[str, list[int]],
+        touched_edges: set[str] | None = None,
     ) -> dict[str, int]:
         """导出数据到影子目录。
 
-        导出所有节点类型和边类型的数据，确保原子替换后数据完整。
+        只重新导出本次导入涉及的表；未涉及的表直接从当前 data 目录以硬链接
+        （跨设备时退化为复制）搬入影子目录，确保原子替换后数据完整。
+        删除节点会级联删除任意边表中的关联边，因此存在删除时所有边表都视为已变更。
 
         Args:
             upserted_ids: 新增/更新的 ID 列表。
             deleted_ids: 删除的 ID 列表。
+            touched_edges: 本次导入涉及的边类型，None 表示全部边表。
 
         Returns:
-            导出统计。
+            导出统计，仅包含重新导出的表。
         """
         data_dir = self.config.storage.data_dir
         shadow_dir = data_dir.parent / f"{data_dir.name}_shadow"
@@ -1255,30 +1316,51 @@ class ImportMixin(BaseEngine):
 
         await asyncio.to_thread(_prepare_shadow_dir)
 
-        dumped: dict[str, int] = {}
+        all_edges_touched = touched_edges is None or any(deleted_ids.values())
+        storage = self.config.storage
+        # 各表导出互不依赖，COPY 走只读游标可并发执行，以有限并发重叠各表的导出与刷盘。
+        semaphore = asyncio.Semaphore(DUMP_TABLE_CONCURRENCY)
+
+        async def _dump_one(name: str, table_name: str, output_dir: Path) -> tuple[str, int]:
+            async with semaphore:
+                count = await self.dump_table(
+                    table_name=table_name,
+                    output_dir=output_dir,
+                    partition_by_date=storage.partition_by_date,
+                    max_rows_per_file=storage.max_rows_per_file,
+                )
+            return name, count
+
+        async def _carry_over_one(src: Path, dst: Path) -> None:
+            async with semaphore:
+                await asyncio.to_thread(_carry_over_dir, src, dst)
 
+        tasks = []
         for node_type, node_def in self.ontology.nodes.items():
             output_dir = shadow_dir / "nodes" / node_def.table
-            count = await self.dump_table(
-                table_name=node_def.table,
-                output_dir=output_dir,
-                partition_by_date=self.config.storage.partition_by_date,
-                max_rows_per_file=self.config.storage.max_rows_per_file,
-            )
-            if count > 0:
-                dumped[node_type] = count
+            if node_type not in upserted_ids and node_type not in deleted_ids:
+                tasks.append(_carry_over_one(data_dir / "nodes" / node_def.table, output_dir))
+            else:
+                tasks.append(_dump_one(node_type, node_def.table, output_dir))
 
         for edge_name in self.ontology.edges.keys():
-            table_name = f"edge_{edge_name}"
             output_dir = shadow_dir / "edges" / edge_name.lower()
-            count = await self.dump_table(
-                table_name=table_name,
-                output_dir=output_dir,
-                partition_by_date=self.config.storage.partition_by_date,
-                max_rows_per_file=self.config.storage.max_rows_per_file,
-            )
+            if not all_edges_touched and edge_name not in touched_edges:
+                tasks.append(_carry_over_one(data_dir / "edges" / edge_name.lower(), output_dir))
+            else:
+                tasks.append(_dump_one(edge_name, f"edge_{edge_name}", output_dir))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        dumped: dict[str, int] = {}
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            if result is None:
+                continue
+            name, count = result
             if count > 0:
-                dumped[edge_name] = count
+                dumped[name] = count
 
         cache_count = await self._dump_cache_to_parquet(shadow_dir)
         if cache_count > 0:
@@ -1289,26 +1371,50 @@ class ImportMixin(BaseEngine):
     async def _dump_cache_to_parquet(self, shadow_dir: Path) -> int:
         """导出搜索缓存到 Parquet 文件。
 
+        缓存表的所有写入都会刷新 last_used 或 created_at，因此以
+        (条目数, MAX(last_used), MAX(created_at)) 作为状态指纹：与上次成功导出时相同
+        则把现有文件以硬链接搬入影子目录，不再全量重写。
+
         Args:
             shadow_dir: 影子目录路径。
 
         Returns:
-            导出的缓存条目数。
+            重新导出的缓存条目数，沿用旧文件或缓存为空时为 0。
         """
         cache_dir = shadow_dir / "cache"
-        await asyncio.to_thread(cache_dir.mkdir, parents=True, exist_ok=True)
+        current_dir = self.config.storage.data_dir / "cache"
         cache_path = cache_dir / "search_cache.parquet"
 
-        def _execute_dump() -> int:
-            rows = self.execute_read(f"SELECT COUNT(*) FROM {SEARCH_CACHE_TABLE}")
-            count = rows[0][0] if rows else 0
+        def _consume(conn: Any) -> int:
+            row = conn.fetchone()
+            state = tuple(row) if row else (0, None, None)
+            count = state[0]
 
             if count == 0:
+                self._persisted_cache_state = state
+                return 0
+
+            if (
+                state == self._persisted_cache_state
+                and (current_dir / "search_cache.parquet").is_file()
+            ):
+                _carry_over_dir(current_dir, cache_dir)
                 return 0
 
-            self.execute_write(f"COPY {SEARCH_CACHE_TABLE} TO '{cache_path}' (FORMAT PARQUET)")
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            conn.execute(f"COPY {SEARCH_CACHE_TABLE} TO '{cache_path}' (FORMAT PARQUET)")
+            self._persisted_cache_state = state
             return count
 
+        def _execute_dump() -> int:
+            # 取指纹与 COPY 在同一只读事务的快照内完成，不阻塞并发写入。
+            return self._run_read(
+                f"SELECT COUNT(*), MAX(last_used), MAX(created_at) FROM {SEARCH_CACHE_TABLE}",
+                None,
+                None,
+                _consume,
+            )
+
         return await asyncio.to_thread(_execute_dump)
 
     async def _atomic_replace_data_dir(self) -> None:
@@ -1316,6 +1422,7 @@ class ImportMixin(BaseEngine):
 
         使用操作系统级别的 rename 操作，确保原子性。
         使用时间戳 + UUID 命名 backup 目录，避免删除操作带来的竞态条件。
+        切换后刷盘父目录，保证 rename 本身持久化。
         """
         data_dir = self.config.storage.data_dir
         shadow_dir = data_dir.parent / f"{data_dir.name}_shadow"
@@ -1327,6 +1434,7 @@ class ImportMixin(BaseEngine):
                 os.rename(str(data_dir), str(backup_dir))
 
             os.rename(str(shadow_dir), str(data_dir))
+            fsync_dir(data_dir.parent)
 
             try:
                 if backup_dir.exists():
@@ -1,17 +1,56 @@
 """搜索索引管理 Mixin。"""
 
 import asyncio
-import hashlib
+import os
+import uuid
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from itertools import batched
 from pathlib import Path
+from typing import Any
+
+import duckdb
+import numpy as np
 
 from duckkb.constants import validate_table_name
 from duckkb.core.base import BaseEngine
 from duckkb.exceptions import FTSError
 from duckkb.logger import logger
+from duckkb.utils.hashing import content_hash
+from duckkb.utils.vector import register_vector_batch
 
 SEARCH_INDEX_TABLE = "_sys_search_index"
 SEARCH_CACHE_TABLE = "_sys_search_cache"
+INDEX_PIPELINE_DEPTH = 4
+INDEX_NODE_CONCURRENCY = 3
+INDEX_INSERT_BATCH_SIZE = 10_000
+
+# 表名均为常量，语句在模块加载时拼好一次，调用处直接复用。
+# 批量写入分词缓存：参数依次为哈希数组、分词结果数组、last_used、created_at。
+FTS_CACHE_INSERT_SQL = (
+    f"INSERT OR REPLACE INTO {SEARCH_CACHE_TABLE} "
+    "(content_hash, fts_content, last_used, created_at) "
+    "SELECT unnest(?::VARCHAR[]), unnest(?::VARCHAR[]), ?, ?"
+)
+_CREATE_FTS_INDEX_SQL = (
+    f"PRAGMA create_fts_index('{SEARCH_INDEX_TABLE}', 'id', 'fts_content', overwrite=1)"
+)
+
+
+def get_search_fields(node_def: Any) -> tuple[list[str], list[str], list[str]]:
+    """解析节点定义的搜索字段。
+
+    Args:
+        node_def: 节点类型定义。
+
+    Returns:
+        (全文字段, 向量字段, 两者去重合并后的字段列表)；合并列表顺序固定，
+        可直接用于拼接 SELECT 列并与结果行逐列对应。
+    """
+    search_config = getattr(node_def, "search", None)
+    fts_fields: list[str] = getattr(search_config, "full_text", []) or []
+    vector_fields: list[str] = getattr(search_config, "vectors", []) or []
+    return fts_fields, vector_fields, list(dict.fromkeys(fts_fields + vector_fields))
 
 
 class IndexMixin(BaseEngine):
@@ -74,14 +113,15 @@ class IndexMixin(BaseEngine):
         使用 fts_content（分词后的内容）建立全文索引。
         DuckDB FTS 按空格分词，中文需要先分词才能正确搜索。
         """
-        try:
-            self.execute_write(f"PRAGMA drop_fts_index('{SEARCH_INDEX_TABLE}')")
-        except Exception:
-            pass
-
-        self.execute_write(f"PRAGMA create_fts_index('{SEARCH_INDEX_TABLE}', 'id', 'fts_content')")
+        self.execute_write(_CREATE_FTS_INDEX_SQL)
+        self._invalidate_search_results()
         logger.info("FTS index created successfully")
 
+    def _invalidate_search_results(self) -> None:
+        """搜索索引变更后清空检索结果缓存（由 SearchMixin 提供）。"""
+        if hasattr(self, "clear_search_cache"):
+            self.clear_search_cache()
+
     def rebuild_fts_index(self) -> None:
         """重建 FTS 索引。
 
@@ -120,6 +160,9 @@ class IndexMixin(BaseEngine):
         3. 分词处理
         4. 向量化
         5. 写入 search_index 表
+        6. 全部节点类型写入完成后统一重建一次 FTS 索引
+
+        各节点类型相互独立，以有限并发同时构建，使不同表的向量化请求与写入重叠。
 
         Args:
             node_type: 节点类型名称，None 表示所有节点。
@@ -137,15 +180,43 @@ class IndexMixin(BaseEngine):
         else:
             node_types = list(self.ontology.nodes.keys())
 
-        for nt in node_types:
-            indexed = await self._build_node_index(nt, batch_size)
-            total_indexed += indexed
+        semaphore = asyncio.Semaphore(INDEX_NODE_CONCURRENCY)
+
+        async def build_one(nt: str) -> int:
+            async with semaphore:
+                return await self._build_node_index(nt, batch_size)
+
+        results = await asyncio.gather(
+            *[build_one(nt) for nt in node_types], return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            total_indexed += result
+
+        if total_indexed:
+            await asyncio.to_thread(self._try_create_fts_index)
 
         logger.info(f"Built search index: {total_indexed} entries")
         return total_indexed
 
-    async def _build_node_index(self, node_type: str, batch_size: int) -> int:
-        """为单个节点类型构建索引。"""
+    async def _build_node_index(
+        self,
+        node_type: str,
+        batch_size: int,
+        replace: bool = False,
+    ) -> int:
+        """为单个节点类型构建索引。
+
+        Args:
+            node_type: 节点类型名称。
+            batch_size: 批处理大小。
+            replace: 为 True 时先在内存中暂存全部条目，再在同一写事务内删除该表的
+                旧索引并整体写入，查询方不会看到索引被清空的中间状态。
+
+        Returns:
+            构建的索引条目数。
+        """
         node_def = self.ontology.nodes.get(node_type)
         if node_def is None:
             raise ValueError(f"Unknown node type: {node_type}")
@@ -156,34 +227,60 @@ class IndexMixin(BaseEngine):
         search_config = getattr(node_def, "search", None)
         if not search_config:
             logger.warning(f"No search config for node type: {node_type}")
+            if replace:
+                await asyncio.to_thread(self._replace_index_entries, table_name, [])
             return 0
 
-        fts_fields: list[str] = getattr(search_config, "full_text", []) or []
-        vector_fields: list[str] = getattr(search_config, "vectors", []) or []
+        fts_fields, vector_fields, field_list = get_search_fields(node_def)
 
-        if not fts_fields and not vector_fields:
+        if not field_list:
             logger.warning(f"No searchable fields for node type: {node_type}")
+            if replace:
+                await asyncio.to_thread(self._replace_index_entries, table_name, [])
             return 0
 
-        all_fields: set[str] = set(fts_fields) | set(vector_fields)
-
         def _fetch_records() -> list[tuple]:
-            fields_str = ", ".join(all_fields)
+            fields_str = ", ".join(field_list)
             return self.execute_read(f"SELECT __id, {fields_str} FROM {table_name}")
 
         records = await asyncio.to_thread(_fetch_records)
         indexed = 0
 
-        for i in range(0, len(records), batch_size):
-            batch = records[i : i + batch_size]
-            batch_entries = await self._process_batch(
-                batch, table_name, all_fields, set(fts_fields), set(vector_fields)
-            )
+        # 分词/向量化与写库是两个独立阶段：生产者处理下一批的同时，消费者写入上一批。
+        # 有界队列提供背压，避免生产者远远领先导致条目在内存中堆积。
+        queue: asyncio.Queue[list[tuple] | None] = asyncio.Queue(maxsize=INDEX_PIPELINE_DEPTH)
 
-            if batch_entries:
-                await asyncio.to_thread(self._insert_index_entries, batch_entries)
+        async def _produce() -> None:
+            fts_set, vector_set = set(fts_fields), set(vector_fields)
+            for i in range(0, len(records), batch_size):
+                batch_entries = await self._process_batch(
+                    records[i : i + batch_size], table_name, field_list, fts_set, vector_set
+                )
+                if batch_entries:
+                    await queue.put(batch_entries)
+            await queue.put(None)
+
+        staged: list[tuple] = []
+
+        async def _consume() -> None:
+            nonlocal indexed
+            while (batch_entries := await queue.get()) is not None:
+                if replace:
+                    staged.extend(batch_entries)
+                else:
+                    await asyncio.to_thread(self._insert_index_entries, batch_entries)
                 indexed += len(batch_entries)
 
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_produce())
+                tg.create_task(_consume())
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+
+        if replace:
+            await asyncio.to_thread(self._replace_index_entries, table_name, staged)
+
         logger.info(f"Indexed {indexed} entries for {node_type}")
         return indexed
 
@@ -191,13 +288,24 @@ class IndexMixin(BaseEngine):
         self,
         records: list[tuple],
         table_name: str,
-        all_fields: set[str],
+        field_list: list[str],
         fts_fields: set[str],
         vector_fields: set[str],
     ) -> list[tuple]:
-        """处理一批记录，生成索引条目。"""
-        entries = []
-        field_list = list(all_fields)
+        """处理一批记录，生成索引条目。
+
+        先收集整批分片，再把所有向量字段的分片合并为一次 embed 调用
+        （其内部按 batch_size 分批请求 API），避免逐分片请求的 N 次往返；
+        全文字段的分片同样整批查缓存、整批分词，并与向量化并发进行。
+        """
+        entries: list[list[Any]] = []
+        fts_slots: list[int] = []
+        fts_texts: list[str] = []
+        fts_hashes: list[str] = []
+        vector_slots: list[int] = []
+        vector_texts: list[str] = []
+        vector_hashes: list[str] = []
+        now = datetime.now(UTC)
 
         for record in records:
             source_id = record[0]
@@ -213,29 +321,51 @@ class IndexMixin(BaseEngine):
                 for chunk_seq, chunk in enumerate(chunks):
                     content_hash = self._compute_hash(chunk)
 
-                    fts_content = None
                     if field_name in fts_fields:
-                        fts_content = await self._get_or_compute_fts(chunk, content_hash)
+                        fts_slots.append(len(entries))
+                        fts_texts.append(chunk)
+                        fts_hashes.append(content_hash)
 
-                    vector = None
                     if field_name in vector_fields:
-                        vector = await self._get_or_compute_vector(chunk, content_hash)
+                        vector_slots.append(len(entries))
+                        vector_texts.append(chunk)
+                        vector_hashes.append(content_hash)
 
                     entries.append(
-                        (
+                        [
                             table_name,
                             source_id,
                             field_name,
                             chunk_seq,
                             chunk,
-                            fts_content,
-                            vector,
+                            None,
+                            None,
                             content_hash,
-                            datetime.now(UTC),
-                        )
+                            now,
+                        ]
                     )
 
-        return entries
+        async def _fts() -> list[str]:
+            if not fts_texts:
+                return []
+            return await self._get_or_compute_fts_batch(fts_texts, fts_hashes)
+
+        async def _vectors() -> list[list[float]] | None:
+            if not vector_texts:
+                return None
+            return await self._embed_with_retry(vector_texts, hashes=vector_hashes)
+
+        # 分词是本地 CPU 计算，向量化主要等待远端 API，两者互不依赖，并发执行。
+        fts_contents, vectors = await asyncio.gather(_fts(), _vectors())
+
+        for slot, fts_content in zip(fts_slots, fts_contents, strict=True):
+            entries[slot][5] = fts_content
+
+        if vectors is not None:
+            for slot, vector in zip(vector_slots, vectors, strict=True):
+                entries[slot][6] = vector or None
+
+        return [tuple(entry) for entry in entries]
 
     def _chunk_text(self, text: str) -> list[str]:
         """将文本切分为多个片段。
@@ -257,110 +387,92 @@ class IndexMixin(BaseEngine):
 
     def _compute_hash(self, text: str) -> str:
         """计算文本哈希。"""
-        return hashlib.md5(text.encode("utf-8")).hexdigest()
+        return content_hash(text)
 
-    async def _get_or_compute_fts(self, text: str, content_hash: str) -> str:
-        """获取或计算分词结果。
+    async def _get_or_compute_fts_batch(self, texts: list[str], hashes: list[str]) -> list[str]:
+        """批量获取或计算分词结果。
 
-        优先从缓存获取，缓存未命中则计算并存入缓存。
+        一次查询取回全部缓存命中，未命中的文本去重后通过一次 segment_batch 分词，
+        并在同一次写入中存入缓存。
 
         Args:
-            text: 待分词文本。
-            content_hash: 文本哈希。
+            texts: 待分词文本列表。
+            hashes: 与 texts 一一对应的文本哈希列表。
 
         Returns:
-            分词结果（空格分隔）。
+            与输入顺序一致的分词结果（空格分隔）列表。
         """
 
-        def _get_cached() -> str | None:
+        def _get_cached() -> dict[str, str]:
             rows = self.execute_read(
-                f"SELECT fts_content FROM {SEARCH_CACHE_TABLE} WHERE content_hash = ?",
-                [content_hash],
+                f"SELECT content_hash, fts_content FROM {SEARCH_CACHE_TABLE} "
+                "WHERE content_hash IN (SELECT unnest(?::VARCHAR[])) "
+                "AND fts_content IS NOT NULL",
+                [list(set(hashes))],
             )
-            return rows[0][0] if rows else None
+            return {row[0]: row[1] for row in rows if row[1]}
 
-        cached = await asyncio.to_thread(_get_cached)
-        if cached:
-            return cached
+        fts_map = await asyncio.to_thread(_get_cached)
 
-        fts_content = await self._segment_text(text)
+        misses: dict[str, str] = {}
+        for text, chash in zip(texts, hashes, strict=True):
+            if chash not in fts_map:
+                misses.setdefault(chash, text)
 
-        def _cache_it() -> None:
-            now = datetime.now(UTC)
-            self.execute_write(
-                f"INSERT OR REPLACE INTO {SEARCH_CACHE_TABLE} "
-                "(content_hash, fts_content, last_used, created_at) VALUES (?, ?, ?, ?)",
-                [content_hash, fts_content, now, now],
-            )
+        if misses:
+            segmented = await self._segment_texts(list(misses.values()))
+            fts_map.update(zip(misses.keys(), segmented, strict=True))
+
+            def _cache_it() -> None:
+                now = datetime.now(UTC)
+                self.execute_write(FTS_CACHE_INSERT_SQL, [list(misses.keys()), segmented, now, now])
+
+            await asyncio.to_thread(_cache_it)
 
-        await asyncio.to_thread(_cache_it)
-        return fts_content
+        return [fts_map[chash] for chash in hashes]
 
-    async def _get_or_compute_vector(
-        self, text: str, content_hash: str, max_retries: int = 3, retry_delay: float = 1.0
-    ) -> list[float] | None:
-        """获取或计算向量嵌入。
+    async def _embed_with_retry(
+        self,
+        texts: list[str],
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        hashes: list[str] | None = None,
+    ) -> list[list[float]] | None:
+        """批量计算向量嵌入，失败时重试。
 
-        优先从缓存获取，缓存未命中则计算并存入缓存。
-        支持重试机制以提高容错性。
+        embed 每完成一批即写入缓存，因此重试只会重新请求失败的批次。
 
         Args:
-            text: 待向量化文本。
-            content_hash: 文本哈希。
+            texts: 待向量化文本列表。
             max_retries: 最大重试次数，默认 3 次。
             retry_delay: 重试间隔秒数，默认 1.0 秒。
+            hashes: 与 texts 对应的已算好的内容哈希，透传给 embed。
 
         Returns:
-            向量嵌入。
+            与输入顺序一致的向量列表，重试耗尽仍失败时返回 None。
         """
-
-        def _get_cached() -> list[float] | None:
-            rows = self.execute_read(
-                f"SELECT vector FROM {SEARCH_CACHE_TABLE} WHERE content_hash = ?",
-                [content_hash],
-            )
-            return rows[0][0] if rows else None
-
-        cached = await asyncio.to_thread(_get_cached)
-        if cached:
-            return cached
+        if not hasattr(self, "embed"):
+            raise NotImplementedError("EmbeddingMixin not available")
 
         for attempt in range(max_retries):
             try:
-                vector = await self._compute_embedding(text)
-
-                def _cache_it(v: list[float] = vector) -> None:
-                    now = datetime.now(UTC)
-                    self.execute_write(
-                        f"INSERT OR REPLACE INTO {SEARCH_CACHE_TABLE} "
-                        "(content_hash, vector, last_used, created_at) VALUES (?, ?, ?, ?)",
-                        [content_hash, v, now, now],
-                    )
-
-                await asyncio.to_thread(_cache_it)
-                return vector
+                return await self.embed(texts, hashes)
             except Exception as e:
                 if attempt < max_retries - 1:
                     logger.warning(
-                        f"Failed to compute embedding (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {retry_delay}s..."
+                        f"Failed to compute embeddings (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {retry_delay}s..."
                     )
                     await asyncio.sleep(retry_delay)
                 else:
-                    logger.error(f"Failed to compute embedding after {max_retries} attempts: {e}")
+                    logger.error(f"Failed to compute embeddings after {max_retries} attempts: {e}")
 
         return None
 
-    async def _segment_text(self, text: str) -> str:
-        """分词处理（由 TokenizerMixin 提供）。"""
-        if hasattr(self, "segment"):
-            return await self.segment(text)
-        return text
-
-    async def _compute_embedding(self, text: str) -> list[float]:
-        """计算向量嵌入（由 EmbeddingMixin 提供）。"""
-        if hasattr(self, "embed_single"):
-            return await self.embed_single(text)
-        raise NotImplementedError("EmbeddingMixin not available")
+    async def _segment_texts(self, texts: list[str]) -> list[str]:
+        """批量分词处理（由 TokenizerMixin 提供）。"""
+        if hasattr(self, "segment_batch"):
+            return await self.segment_batch(texts)
+        return list(texts)
 
     def _insert_index_entries(self, entries: list[tuple]) -> None:
         """插入索引条目。
@@ -369,23 +481,105 @@ class IndexMixin(BaseEngine):
         ID 列自动生成，不需要手动指定。
         """
         with self.write_transaction() as conn:
-            conn.executemany(
-                f"INSERT INTO {SEARCH_INDEX_TABLE} "
-                "(source_table, source_id, source_field, chunk_seq, content, "
-                "fts_content, vector, content_hash, created_at) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
-                "ON CONFLICT (source_table, source_id, source_field, chunk_seq) "
-                "DO UPDATE SET content = excluded.content, "
-                "fts_content = excluded.fts_content, "
-                "vector = excluded.vector, "
-                "content_hash = excluded.content_hash, "
-                "created_at = excluded.created_at",
-                entries,
+            self._insert_index_entries_in_conn(conn, entries)
+        self._invalidate_search_results()
+
+    def _insert_index_entries_in_conn(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        entries: list[tuple],
+    ) -> None:
+        """在给定连接中批量写入索引条目。
+
+        条目按列拆成 NumPy 数组注册为视图，向量经 register_vector_batch 注册，
+        再用一条 ``INSERT ... SELECT`` 整体写入，避免 executemany 逐行绑定参数。
+
+        Args:
+            conn: 处于写事务中的数据库连接。
+            entries: 条目元组列表，字段顺序为 (source_table, source_id,
+                source_field, chunk_seq, content, fts_content, vector,
+                content_hash, created_at)，vector 可为 None。
+        """
+        if not entries:
+            return
+
+        columns = list(zip(*entries, strict=True))
+        vector_slots = np.full(len(entries), -1, dtype=np.int64)
+        vectors: list[list[float]] = []
+        for i, vector in enumerate(columns[6]):
+            if vector:
+                vector_slots[i] = len(vectors)
+                vectors.append(vector)
+
+        conn.register(
+            "_index_rows",
+            {
+                "source_table": np.array(columns[0], dtype=object),
+                "source_id": np.array(columns[1], dtype=np.int64),
+                "source_field": np.array(columns[2], dtype=object),
+                "chunk_seq": np.array(columns[3], dtype=np.int64),
+                "content": np.array(columns[4], dtype=object),
+                "fts_content": np.array(columns[5], dtype=object),
+                "vector_slot": vector_slots,
+                "content_hash": np.array(columns[7], dtype=object),
+                "created_at": np.array(columns[8], dtype=object),
+            },
+        )
+        try:
+            if vectors:
+                vector_source = register_vector_batch(conn, "_index_vectors", vectors)
+            else:
+                vector_source = "(SELECT NULL::BIGINT AS row, NULL::FLOAT[] AS vector LIMIT 0)"
+            try:
+                conn.execute(
+                    f"INSERT INTO {SEARCH_INDEX_TABLE} "
+                    "(source_table, source_id, source_field, chunk_seq, content, "
+                    "fts_content, vector, content_hash, created_at) "
+                    "SELECT r.source_table, r.source_id, r.source_field, r.chunk_seq, "
+                    "r.content, r.fts_content::VARCHAR, v.vector, r.content_hash, "
+                    "r.created_at::TIMESTAMP "
+                    f"FROM _index_rows r LEFT JOIN {vector_source} v ON v.row = r.vector_slot "
+                    "ON CONFLICT (source_table, source_id, source_field, chunk_seq) "
+                    "DO UPDATE SET content = excluded.content, "
+                    "fts_content = excluded.fts_content, "
+                    "vector = excluded.vector, "
+                    "content_hash = excluded.content_hash, "
+                    "created_at = excluded.created_at"
+                )
+            finally:
+                if vectors:
+                    conn.unregister("_index_vectors")
+        finally:
+            conn.unregister("_index_rows")
+
+    def _replace_index_entries(self, table_name: str, entries: list[tuple]) -> None:
+        """在同一写事务内替换指定表的全部索引条目。
+
+        条目按 INDEX_INSERT_BATCH_SIZE 分批写入，列式缓冲区的峰值内存与批大小相关，
+        与表规模无关。
+
+        Args:
+            table_name: 源表名。
+            entries: 新的索引条目列表。
+        """
+        with self.write_transaction() as conn:
+            conn.execute(
+                f"DELETE FROM {SEARCH_INDEX_TABLE} WHERE source_table = ?",
+                [table_name],
             )
+            for start in range(0, len(entries), INDEX_INSERT_BATCH_SIZE):
+                self._insert_index_entries_in_conn(
+                    conn, entries[start : start + INDEX_INSERT_BATCH_SIZE]
+                )
+        self._invalidate_search_results()
 
     async def rebuild_index(self, node_type: str) -> int:
         """重建指定节点类型的索引。
 
+        新条目全部生成后，与旧条目的删除在同一事务内完成替换，
+        构建期间（含向量请求）查询仍能命中旧索引。替换前后该表都没有索引条目时
+        FTS 索引不受影响，否则替换完成后重建一次。
+
         Args:
             node_type: 节点类型名称。
 
@@ -396,16 +590,19 @@ class IndexMixin(BaseEngine):
         if node_def is None:
             raise ValueError(f"Unknown node type: {node_type}")
 
-        table_name = node_def.table
-
-        def _delete_old() -> None:
-            self.execute_write(
-                f"DELETE FROM {SEARCH_INDEX_TABLE} WHERE source_table = ?",
-                [table_name],
-            )
+        had_entries = await asyncio.to_thread(self._has_index_entries, node_def.table)
+        indexed = await self._build_node_index(node_type, batch_size=100, replace=True)
+        if indexed or had_entries:
+            await asyncio.to_thread(self._try_create_fts_index)
+        return indexed
 
-        await asyncio.to_thread(_delete_old)
-        return await self._build_node_index(node_type, batch_size=100)
+    def _has_index_entries(self, table_name: str) -> bool:
+        """判断指定源表当前是否有索引条目。"""
+        rows = self.execute_read(
+            f"SELECT EXISTS (SELECT 1 FROM {SEARCH_INDEX_TABLE} WHERE source_table = ?)",
+            [table_name],
+        )
+        return bool(rows and rows[0][0])
 
     async def load_cache_from_parquet(self, path: Path) -> int:
         """从 Parquet 文件加载搜索缓存。
@@ -436,6 +633,9 @@ class IndexMixin(BaseEngine):
     async def save_cache_to_parquet(self, path: Path) -> int:
         """保存搜索缓存到 Parquet 文件。
 
+        先写入同目录的临时文件再以 ``os.replace`` 原子替换，
+        写入中途失败不会留下半截的缓存文件。
+
         Args:
             path: Parquet 文件路径。
 
@@ -448,7 +648,12 @@ class IndexMixin(BaseEngine):
             rows = self.execute_read(f"SELECT COUNT(*) FROM {SEARCH_CACHE_TABLE}")
             count = rows[0][0] if rows else 0
 
-            self.execute_write(f"COPY {SEARCH_CACHE_TABLE} TO '{path}' (FORMAT PARQUET)")
+            tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+            try:
+                self.execute_write(f"COPY {SEARCH_CACHE_TABLE} TO '{tmp_path}' (FORMAT PARQUET)")
+                os.replace(tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
             return count
 
         count = await asyncio.to_thread(_save)
@@ -476,122 +681,132 @@ class IndexMixin(BaseEngine):
         logger.info(f"Cleaned {deleted} expired cache entries")
         return deleted
 
-    async def _rebuild_index_from_cache(self) -> None:
+    async def _rebuild_index_from_cache(self) -> int:
         """从缓存重建搜索索引。
 
         扫描所有节点数据，使用缓存中的向量和分词结果重建索引。
-        采用批量查询缓存的方式优化性能。
-        """
-        for node_type, node_def in self.ontology.nodes.items():
-            search_config = getattr(node_def, "search", None)
-            if not search_config:
-                continue
+        采用批量查询缓存的方式优化性能；各节点类型相互独立，以有限并发同时重建。
 
-            fts_fields: list[str] = getattr(search_config, "full_text", []) or []
-            vector_fields: list[str] = getattr(search_config, "vectors", []) or []
-            all_fields: set[str] = set(fts_fields) | set(vector_fields)
+        Returns:
+            写入的索引条目总数。
+        """
+        semaphore = asyncio.Semaphore(INDEX_NODE_CONCURRENCY)
+
+        async def rebuild_one(node_type: str, node_def: Any) -> int:
+            async with semaphore:
+                return await self._rebuild_node_index_from_cache(node_type, node_def)
+
+        results = await asyncio.gather(
+            *[rebuild_one(nt, nd) for nt, nd in self.ontology.nodes.items()],
+            return_exceptions=True,
+        )
+        total = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            total += result
+        return total
+
+    async def _rebuild_node_index_from_cache(self, node_type: str, node_def: Any) -> int:
+        """从缓存重建单个节点类型的搜索索引。
 
-            if not all_fields:
-                continue
+        Args:
+            node_type: 节点类型名称。
+            node_def: 节点定义。
 
-            table_name = node_def.table
-            validate_table_name(table_name)
-            fields_str = ", ".join(all_fields)
+        Returns:
+            写入的索引条目数。
+        """
+        fts_fields, vector_fields, field_list = get_search_fields(node_def)
+        if not field_list:
+            return 0
 
-            def _fetch_records() -> list[tuple]:
-                return self.execute_read(f"SELECT __id, {fields_str} FROM {table_name}")
+        table_name = node_def.table
+        validate_table_name(table_name)
+        # 字段顺序、字段归属在每条记录上都相同，只需计算一次。
+        field_flags = [
+            (field_name, field_name in fts_fields, field_name in vector_fields)
+            for field_name in field_list
+        ]
+        fields_str = ", ".join(field_list)
 
-            records = await asyncio.to_thread(_fetch_records)
-            if not records:
-                continue
+        def _fetch_records() -> list[tuple]:
+            return self.execute_read(f"SELECT __id, {fields_str} FROM {table_name}")
 
-            entries = []
-            content_hashes = set()
+        records = await asyncio.to_thread(_fetch_records)
+        if not records:
+            return 0
 
+        # (source_id, field_name, chunk_seq, chunk, content_hash, is_fts, is_vector)
+        def _iter_chunks() -> Iterator[tuple[int, str, int, str, str, bool, bool]]:
             for record in records:
                 source_id = record[0]
-                field_values = record[1:]
-                field_list = list(all_fields)
-
-                for field_idx, field_name in enumerate(field_list):
-                    content = field_values[field_idx]
+                for (field_name, is_fts, is_vector), content in zip(
+                    field_flags, record[1:], strict=True
+                ):
                     if not content or not isinstance(content, str):
                         continue
+                    for chunk_seq, chunk in enumerate(self._chunk_text(content)):
+                        yield (
+                            source_id,
+                            field_name,
+                            chunk_seq,
+                            chunk,
+                            self._compute_hash(chunk),
+                            is_fts,
+                            is_vector,
+                        )
 
-                    chunks = self._chunk_text(content)
-
-                    for chunk_seq, chunk in enumerate(chunks):
-                        content_hash = self._compute_hash(chunk)
-                        content_hashes.add(content_hash)
-
+        def _rebuild() -> int:
+            # 分片、查缓存、写入按 INDEX_INSERT_BATCH_SIZE 逐批流水进行，同一事务内提交；
+            # 内存中只保留一批分片及其缓存向量，而非整表。
+            now = datetime.now(UTC)
+            total = 0
+            with self.write_transaction() as conn:
+                for batch in batched(_iter_chunks(), INDEX_INSERT_BATCH_SIZE):
+                    cache_map = self._fetch_cache_entries_in_conn(conn, [c[4] for c in batch])
+                    entries = []
+                    for source_id, field_name, chunk_seq, chunk, chash, is_fts, is_vector in batch:
+                        cached_fts, cached_vector = cache_map.get(chash, (None, None))
                         entries.append(
-                            {
-                                "table_name": table_name,
-                                "source_id": source_id,
-                                "field_name": field_name,
-                                "chunk_seq": chunk_seq,
-                                "chunk": chunk,
-                                "content_hash": content_hash,
-                                "fts_field": field_name in fts_fields,
-                                "vector_field": field_name in vector_fields,
-                            }
+                            (
+                                table_name,
+                                source_id,
+                                field_name,
+                                chunk_seq,
+                                chunk,
+                                cached_fts if is_fts else None,
+                                cached_vector if is_vector else None,
+                                chash,
+                                now,
+                            )
                         )
+                    self._insert_index_entries_in_conn(conn, entries)
+                    total += len(entries)
+            if total:
+                self._invalidate_search_results()
+            return total
+
+        total = await asyncio.to_thread(_rebuild)
+        if total:
+            logger.info(f"Rebuilt index for {node_type}: {total} entries")
+        return total
+
+    def _fetch_cache_entries_in_conn(
+        self, conn: duckdb.DuckDBPyConnection, hashes: list[str]
+    ) -> dict[str, tuple[str | None, list[float] | None]]:
+        """在给定连接中批量查询缓存的分词结果与向量。
 
-            if not entries:
-                continue
-
-            def _batch_fetch_cache() -> dict[str, tuple[str | None, list[float] | None]]:
-                placeholders = ", ".join(["?" for _ in content_hashes])
-                rows = self.execute_read(
-                    f"SELECT content_hash, fts_content, vector FROM {SEARCH_CACHE_TABLE} "
-                    f"WHERE content_hash IN ({placeholders})",
-                    list(content_hashes),
-                )
-                return {row[0]: (row[1], row[2]) for row in rows}
-
-            cache_map = await asyncio.to_thread(_batch_fetch_cache)
-
-            index_entries = []
-            for entry in entries:
-                fts_content = None
-                vector = None
-                cached = cache_map.get(entry["content_hash"])
-
-                if cached:
-                    if entry["fts_field"]:
-                        fts_content = cached[0]
-                    if entry["vector_field"]:
-                        vector = cached[1]
-
-                index_entries.append(
-                    (
-                        entry["table_name"],
-                        entry["source_id"],
-                        entry["field_name"],
-                        entry["chunk_seq"],
-                        entry["chunk"],
-                        fts_content,
-                        vector,
-                        entry["content_hash"],
-                        datetime.now(UTC),
-                    )
-                )
-
-            def _insert() -> None:
-                with self.write_transaction() as conn:
-                    conn.executemany(
-                        f"INSERT INTO {SEARCH_INDEX_TABLE} "
-                        "(source_table, source_id, source_field, chunk_seq, content, "
-                        "fts_content, vector, content_hash, created_at) "
-                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
-                        "ON CONFLICT (source_table, source_id, source_field, chunk_seq) "
-                        "DO UPDATE SET content = excluded.content, "
-                        "fts_content = excluded.fts_content, "
-                        "vector = excluded.vector, "
-                        "content_hash = excluded.content_hash, "
-                        "created_at = excluded.created_at",
-                        index_entries,
-                    )
+        Args:
+            conn: 数据库连接。
+            hashes: 文本哈希列表，可含重复。
 
-            await asyncio.to_thread(_insert)
-            logger.info(f"Rebuilt index for {node_type}: {len(index_entries)} entries")
+        Returns:
+            以 content_hash 为键、(fts_content, vector) 为值的字典，仅含命中的条目。
+        """
+        rows = conn.execute(
+            f"SELECT content_hash, fts_content, vector FROM {SEARCH_CACHE_TABLE} "
+            "WHERE content_hash IN (SELECT unnest(?::VARCHAR[]))",
+            [list(set(hashes))],
+        ).fetchall()
+        return {row[0]: (row[1], row[2]) for row in rows}
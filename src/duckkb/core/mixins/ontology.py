@@ -64,6 +64,8 @@ class OntologyMixin(BaseEngine):
         """初始化本体 Mixin。"""
         super().__init__(*args, **kwargs)
         self._ontology: Ontology | None = None
+        self._bundle_schema: dict[str, Any] | None = None
+        self._bundle_schema_json: str | None = None
 
     @property
     def ontology(self) -> Ontology:
@@ -219,9 +221,14 @@ class OntologyMixin(BaseEngine):
         根据当前本体定义，动态生成 JSON Schema Draft 7 格式的校验规则。
         用于验证 import_knowledge_bundle 的输入数据。
 
+        本体在引擎生命周期内不变，结果首次生成后缓存复用，调用方不应修改返回值。
+
         Returns:
             包含 full_bundle_schema 和 example_yaml 的字典。
         """
+        if self._bundle_schema is not None:
+            return self._bundle_schema
+
         one_of_schemas: list[dict[str, Any]] = []
         example_items: list[str] = []
 
@@ -240,7 +247,11 @@ class OntologyMixin(BaseEngine):
             "items": {"oneOf": one_of_schemas},
         }
 
-        return {"full_bundle_schema": full_bundle_schema, "example_yaml": "\n".join(example_items)}
+        self._bundle_schema = {
+            "full_bundle_schema": full_bundle_schema,
+            "example_yaml": "\n".join(example_items),
+        }
+        return self._bundle_schema
 
     def _generate_node_schema(self, node_name: str, node_def: NodeType) -> dict[str, Any]:
         """生成节点类型的 JSON Schema。
@@ -428,7 +439,11 @@ class OntologyMixin(BaseEngine):
             导入数据格式的 Markdown 片段。
         """
         bundle_schema = self.get_bundle_schema()
-        schema_json = json.dumps(bundle_schema["full_bundle_schema"], ensure_ascii=False, indent=2)
+        if self._bundle_schema_json is None:
+            self._bundle_schema_json = json.dumps(
+                bundle_schema["full_bundle_schema"], ensure_ascii=False, indent=2
+            )
+        schema_json = self._bundle_schema_json
         example_yaml = bundle_schema["example_yaml"]
 
         return f"""## 导入数据格式
@@ -1,18 +1,133 @@
 """检索能力 Mixin。"""
 
 import asyncio
+import functools
 import re
-from typing import Any
+import threading
+from typing import Any, NamedTuple
 
 import numpy as np
 import orjson
 
-from duckkb.constants import QUERY_DEFAULT_LIMIT, QUERY_RESULT_SIZE_LIMIT, validate_table_name
+from duckkb.constants import (
+    QUERY_DEFAULT_LIMIT,
+    QUERY_RESULT_SIZE_LIMIT,
+    QUERY_VECTOR_CACHE_SIZE,
+    SEARCH_RESULT_CACHE_SIZE,
+    SEARCH_RESULT_CACHE_TTL,
+    validate_table_name,
+)
 from duckkb.core.base import BaseEngine
 from duckkb.exceptions import DatabaseError, FTSError
 from duckkb.logger import logger
+from duckkb.utils.lru import LRUCache
+from duckkb.utils.vector import normalize_vectors
 
 SEARCH_INDEX_TABLE = "_sys_search_index"
+_SELECTED_IDS_VIEW = "_selected_ids"
+_RAW_SQL_FETCH_SIZE = 1024
+# 最小的单行 JSON 为 {"":0}，加上行间逗号共 7 字节。
+_MIN_JSON_ROW_BYTES = 7
+
+_FORBIDDEN_SQL_KEYWORDS = frozenset(
+    {
+        "INSERT",
+        "UPDATE",
+        "DELETE",
+        "DROP",
+        "ALTER",
+        "CREATE",
+        "TRUNCATE",
+        "GRANT",
+        "REVOKE",
+        "EXEC",
+        "EXECUTE",
+        "CALL",
+    }
+)
+# 单次扫描只切出长度落在关键字长度区间内的纯字母单词，再查集合；
+# 扫描代价与关键字数量无关，也不会因多分支交替而回溯。
+_FORBIDDEN_CANDIDATE_RE = re.compile(
+    rf"\b[A-Za-z]{{{min(map(len, _FORBIDDEN_SQL_KEYWORDS))},"
+    rf"{max(map(len, _FORBIDDEN_SQL_KEYWORDS))}}}\b"
+)
+_LIMIT_RE = re.compile(r"\bLIMIT\s+\d+", re.IGNORECASE)
+# 字符串字面量、带引号标识符与注释合成一次扫描：先匹配到的字面量会整体跳过，
+# 其中的 -- 不会被当作注释。
+_SQL_COMMENTS_AND_STRINGS_RE = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/", re.DOTALL
+)
+# 只有以这些关键字开头的语句才能作为子查询包一层外层 LIMIT（EXPLAIN 等不能）。
+_ROW_QUERY_RE = re.compile(r"\s*\(*\s*(?:SELECT|WITH|FROM|VALUES|TABLE)\b", re.IGNORECASE)
+
+
+def _keep_sql_literal(match: re.Match[str]) -> str:
+    """保留字符串字面量与带引号标识符，注释替换为空格。"""
+    token = match.group()
+    return token if token[0] in "'\"" else " "
+
+
+def _keep_sql_identifier(match: re.Match[str]) -> str:
+    """保留带引号标识符，字符串字面量与注释替换为空格。"""
+    token = match.group()
+    return token if token[0] == '"' else " "
+
+
+_RESULT_COLUMNS = ("source_table", "source_id", "source_field", "chunk_seq", "content", "score")
+
+
+class _VectorMatrix(NamedTuple):
+    """常驻内存的索引向量快照，matrix 的行与 ids、tables 一一对应。"""
+
+    dim: int
+    ids: np.ndarray
+    tables: np.ndarray
+    matrix: np.ndarray
+
+
+# 检索 SQL 只随过滤条件变化，按过滤条件缓存模板，每次检索只需组装参数。
+@functools.lru_cache(maxsize=4)
+def _text_recall_sql(table_filter: str) -> str:
+    """全文召回 SQL 模板，参数为 (查询文本, *过滤参数, 召回条数)。"""
+    return f"""
+            SELECT id, rank() OVER (ORDER BY score DESC) AS rnk
+            FROM (
+                SELECT id, fts_main_{SEARCH_INDEX_TABLE}.match_bm25(id, ?) AS score
+                FROM {SEARCH_INDEX_TABLE}
+                WHERE fts_content IS NOT NULL {table_filter}
+            )
+            WHERE score IS NOT NULL
+            ORDER BY score DESC
+            LIMIT ?
+        """
+
+
+@functools.lru_cache(maxsize=4)
+def _fts_search_sql(table_filter: str) -> str:
+    """全文检索 SQL 模板，参数为 (查询文本, *过滤参数, 返回条数)。
+
+    BM25 分数在子查询中只计算一次，外层按别名过滤空分数。
+    """
+    return f"""
+        SELECT source_table, source_id, source_field, chunk_seq, content, score
+        FROM (
+            SELECT source_table, source_id, source_field, chunk_seq, content,
+                   fts_main_{SEARCH_INDEX_TABLE}.match_bm25(id, ?) AS score
+            FROM {SEARCH_INDEX_TABLE}
+            WHERE fts_content IS NOT NULL {table_filter}
+        )
+        WHERE score IS NOT NULL
+        ORDER BY score DESC
+        LIMIT ?
+        """
+
+
+# 按选中 ID 视图回表取结果行，按视图中的 pos 保持融合排序。
+_HYDRATE_SQL = (
+    "SELECT s.source_table, s.source_id, s.source_field, s.chunk_seq, s.content, k.score "
+    f"FROM {_SELECTED_IDS_VIEW} k JOIN {SEARCH_INDEX_TABLE} s ON s.id = k.id "
+    "ORDER BY k.pos"
+)
 
 
 class SearchMixin(BaseEngine):
@@ -28,6 +143,12 @@ class SearchMixin(BaseEngine):
         _max_k: k 值上限。
         _thresholds: 自适应阈值配置。
         _strategy: 自适应策略。
+        _query_vector_cache: 查询向量 LRU 缓存，键为 (嵌入模型, 查询文本)。
+        _search_result_cache: 混合检索结果的 TTL + LRU 缓存，索引变更时清空。
+        _search_result_epoch: 结果缓存纪元，每次清空缓存时递增，用于丢弃读到旧索引的检索结果。
+        _search_inflight: 进行中的混合检索任务及其发起时的缓存纪元，键与结果缓存相同，
+            用于合并并发的相同请求，只在事件循环中读写。
+        _vector_matrix: 向量召回使用的内存矩阵快照，索引变更时清空。
     """
 
     def __init__(self, *args, **kwargs) -> None:
@@ -62,6 +183,14 @@ class SearchMixin(BaseEngine):
             self._config_k = None
 
         self._cached_k = None
+        self._query_vector_cache = LRUCache(QUERY_VECTOR_CACHE_SIZE)
+        self._search_result_cache = LRUCache(SEARCH_RESULT_CACHE_SIZE, ttl=SEARCH_RESULT_CACHE_TTL)
+        self._search_result_epoch = 0
+        self._search_result_lock = threading.Lock()
+        self._search_inflight: dict[tuple, tuple[int, asyncio.Future]] = {}
+        self._vector_matrix: _VectorMatrix | None = None
+        self._vector_matrix_lock = threading.Lock()
+        self._vector_matrix_generation = 0
 
         logger.info(
             f"SearchMixin initialized: auto_k={self._auto_k}, "
@@ -120,7 +249,7 @@ class SearchMixin(BaseEngine):
         # 应用范围限制
         k = max(self._min_k, min(self._max_k, k))
 
-        logger.debug(f"Auto-calculated k={k} for {total_docs} documents")
+        logger.debug("Auto-calculated k=%d for %d documents", k, total_docs)
         return k
 
     async def _get_total_documents(self) -> int:
@@ -167,7 +296,8 @@ class SearchMixin(BaseEngine):
             alpha: 向量搜索权重 (0.0-1.0)。
 
         Returns:
-            排序后的结果列表，包含原始字段和分数。
+            排序后的结果列表，包含原始字段和分数。相同参数的重复调用在 TTL 内
+            直接命中结果缓存，不再请求向量或查询数据库；索引变更时缓存清空。
 
         Raises:
             ValueError: limit 参数为负数时抛出。
@@ -178,26 +308,102 @@ class SearchMixin(BaseEngine):
         if not query:
             return []
 
+        cache_key = (query, node_type, limit, alpha)
+        cached = self._search_result_cache.get(cache_key)
+        if cached is not None:
+            return [dict(row) for row in cached]
+
+        # 相同参数的并发请求合并为一次检索，其余请求等待同一个任务的结果；
+        # 索引变更（纪元变化）前发起的检索可能读到旧数据，不再合并到其上。
+        epoch = self._search_result_epoch
+        entry = self._search_inflight.get(cache_key)
+        if entry is not None and entry[0] == epoch:
+            inflight = entry[1]
+        else:
+            inflight = asyncio.ensure_future(
+                self._search_uncached(cache_key, epoch, query, node_type, limit, alpha)
+            )
+            self._search_inflight[cache_key] = (epoch, inflight)
+
+            def _forget(task: asyncio.Future) -> None:
+                current = self._search_inflight.get(cache_key)
+                if current is not None and current[1] is task:
+                    self._search_inflight.pop(cache_key, None)
+
+            inflight.add_done_callback(_forget)
+
+        results = await asyncio.shield(inflight)
+        return [dict(row) for row in results]
+
+    async def _search_uncached(
+        self,
+        cache_key: tuple,
+        epoch: int,
+        query: str,
+        node_type: str | None,
+        limit: int,
+        alpha: float,
+    ) -> list[dict[str, Any]]:
+        """执行一次未命中缓存的混合检索，并写入结果缓存。
+
+        检索期间索引发生变更（缓存纪元已变化）时，结果可能来自旧索引，只返回不缓存。
+
+        Args:
+            cache_key: 结果缓存键。
+            epoch: 发起检索前的缓存纪元。
+            query: 搜索查询文本。
+            node_type: 节点类型过滤器。
+            limit: 返回结果数量。
+            alpha: 向量搜索权重。
+
+        Returns:
+            检索结果。调用方共享同一列表，须各自复制后再返回给用户。
+        """
         query_vector = await self._get_query_vector(query)
-        if not query_vector:
+        if query_vector is None:
             logger.warning("Failed to generate query embedding")
             return []
 
-        return await self._execute_hybrid_search(
+        results = await self._execute_hybrid_search(
             query=query,
             query_vector=query_vector,
             node_type=node_type,
             limit=limit,
             alpha=alpha,
         )
+        with self._search_result_lock:
+            if epoch == self._search_result_epoch:
+                self._search_result_cache.put(cache_key, [dict(row) for row in results])
+        return results
+
+    def clear_search_cache(self) -> None:
+        """清空检索结果缓存与向量矩阵。
 
-    async def _get_query_vector(self, query: str) -> list[float] | None:
+        搜索索引写入后调用，保证后续检索能看到最新数据；
+        进行中的检索可能读到旧数据，其结果不再写入缓存，之后的请求也不再合并到这些检索上。
+        """
+        with self._search_result_lock:
+            self._search_result_epoch += 1
+            self._search_result_cache.clear()
+        with self._vector_matrix_lock:
+            self._vector_matrix_generation += 1
+            self._vector_matrix = None
+
+    async def _get_query_vector(self, query: str) -> np.ndarray | None:
         """获取查询向量并校验维度。
 
+        结果按 (嵌入模型, 查询文本) 缓存在进程内 LRU 中，重复查询（翻页、热门词）
+        不再经过哈希、缓存表查询或 Embedding API。切换模型后旧条目自然失效。
+        向量归一化后以 float32 NumPy 数组缓存，与索引列精度一致，可直接注册给 DuckDB。
+
         Returns:
-            校验通过的查询向量，校验失败返回 None。
+            校验通过并归一化的 float32 查询向量，失败或为空时返回 None。调用方不得修改返回的数组。
         """
         if hasattr(self, "embed_single"):
+            cache_key = (getattr(self, "embedding_model", None), query)
+            cached = self._query_vector_cache.get(cache_key)
+            if cached is not None:
+                return cached
             try:
                 vector = await self.embed_single(query)
                 if hasattr(self, "embedding_dim"):
@@ -208,26 +414,140 @@ class SearchMixin(BaseEngine):
                             f"Vector dimension mismatch: expected {expected_dim}, got {actual_dim}"
                         )
                         return None
-                return vector
+                if not len(vector):
+                    return None
+                array = normalize_vectors([vector])[0]
+                self._query_vector_cache.put(cache_key, array)
+                return array
             except Exception as e:
                 logger.error(f"Failed to embed query: {e}")
         return None
 
+    def _get_vector_matrix(self, dim: int) -> _VectorMatrix:
+        """取得维度为 dim 的向量矩阵，必要时从索引表重建。
+
+        索引向量整体以 (N, dim) 的 float32 连续矩阵常驻内存，召回时一次矩阵-向量乘
+        即可为全部条目打分，不再逐行经过 DuckDB。向量按展开后的一维数组整块取回，
+        元数据与向量在同一只读事务中读取。维度与查询不同的向量被忽略。
+        缓存表、持久化文件或非 OpenAI 端点写入的向量未必是单位长度，构建时统一按行归一化，
+        内积打分即等于余弦相似度。
+
+        索引写入后由 clear_search_cache 在同一把锁内失效，下一次召回时重建；
+        重建期间发生的失效会等待重建结束，不会留下旧矩阵。
+
+        Args:
+            dim: 查询向量维度。
+
+        Returns:
+            向量矩阵快照。
+        """
+        with self._vector_matrix_lock:
+            cached = self._vector_matrix
+            if cached is not None and cached.dim == dim:
+                return cached
+            generation = self._vector_matrix_generation
+
+            def consume(conn) -> tuple[dict[str, np.ndarray], np.ndarray]:
+                meta = conn.fetchnumpy()
+                conn.execute(
+                    f"SELECT unnest(vector) AS val FROM ("
+                    f"SELECT vector FROM {SEARCH_INDEX_TABLE} "
+                    "WHERE vector IS NOT NULL AND len(vector) = ? ORDER BY id)",
+                    [dim],
+                )
+                return meta, conn.fetchnumpy()["val"]
+
+            meta, values = self._run_read(
+                f"SELECT id, source_table FROM {SEARCH_INDEX_TABLE} "
+                "WHERE vector IS NOT NULL AND len(vector) = ? ORDER BY id",
+                [dim],
+                None,
+                consume,
+            )
+            ids = np.asarray(meta["id"], dtype=np.int64)
+            built = _VectorMatrix(
+                dim=dim,
+                ids=ids,
+                tables=np.asarray(meta["source_table"], dtype=object),
+                matrix=normalize_vectors(
+                    np.asarray(values, dtype=np.float32).reshape(len(ids), dim)
+                ),
+            )
+            if generation == self._vector_matrix_generation:
+                self._vector_matrix = built
+            return built
+
+    def _vector_candidates(
+        self,
+        query_vector: Any,
+        source_table: str | None,
+        k: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """在向量矩阵上召回内积最高的 k 个条目。
+
+        Args:
+            query_vector: 归一化的查询向量。
+            source_table: 源表过滤，None 表示不过滤。
+            k: 召回条数。
+
+        Returns:
+            (ids, scores)，按分数降序排列。
+        """
+        query = np.ascontiguousarray(query_vector, dtype=np.float32)
+        vectors = self._get_vector_matrix(len(query))
+        ids, scores = vectors.ids, vectors.matrix @ query
+        if source_table is not None:
+            mask = vectors.tables == source_table
+            ids, scores = ids[mask], scores[mask]
+
+        if k <= 0 or not len(scores):
+            return ids[:0], scores[:0]
+        if len(scores) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return ids[top], scores[top]
+
+    def _vector_recall(
+        self,
+        query_vector: Any,
+        source_table: str | None,
+        prefetch_limit: int,
+    ) -> list[tuple[int, int]]:
+        """向量召回，返回 (id, rnk)，分数并列的条目名次相同。"""
+        ids, scores = self._vector_candidates(query_vector, source_table, prefetch_limit)
+        ranks = np.searchsorted(-scores, -scores, side="left") + 1
+        return list(zip(ids.tolist(), ranks.tolist(), strict=True))
+
+    def query_vector_cache_stats(self) -> dict[str, Any]:
+        """查询向量缓存的统计信息。
+
+        Returns:
+            包含 size、maxsize、hits、misses、hit_rate 的字典。
+        """
+        return self._query_vector_cache.stats()
+
     async def _execute_hybrid_search(
         self,
         query: str,
-        query_vector: list[float],
+        query_vector: Any,
         node_type: str | None,
         limit: int,
         alpha: float,
     ) -> list[dict[str, Any]]:
-        """执行混合检索。"""
+        """执行混合检索。
+
+        向量召回在内存向量矩阵上完成，全文召回查询 DuckDB，两路并发执行，
+        总耗时取两者较慢者；在 Python 侧按 RRF 融合排名，最后仅为入选条目回捞内容。
+        """
         # 在执行搜索前，确保 k 值已被计算（如果是自适应模式）
         if self._auto_k and self._strategy == "document_count":
             # 重新计算 k 值，覆盖可能的同步访问结果
             optimal_k = await self._calculate_optimal_k()
             self._cached_k = optimal_k
 
+        source_table: str | None = None
         table_filter = ""
         params: list[Any] = []
 
@@ -235,77 +555,20 @@ class SearchMixin(BaseEngine):
             node_def = self.ontology.nodes.get(node_type)
             if node_def is None:
                 raise ValueError(f"Unknown node type: {node_type}")
+            source_table = node_def.table
             table_filter = "AND source_table = ?"
-            params.append(node_def.table)
+            params.append(source_table)
 
-        vector_dim = len(query_vector)
-        vector_literal = self._format_vector_for_sql(query_vector)
         prefetch_limit = limit * 3
-
-        fts_params = params + [query, query, query] + params
+        text_sql, text_params = self._build_text_query(query, table_filter, params, prefetch_limit)
 
         try:
-            sql = f"""
-            WITH
-            vector_search AS (
-                SELECT 
-                    id,
-                    source_table,
-                    source_id,
-                    source_field,
-                    chunk_seq,
-                    array_cosine_similarity(vector::DOUBLE[{vector_dim}], {vector_literal}) as score,
-                    rank() OVER (ORDER BY array_cosine_similarity(vector::DOUBLE[{vector_dim}], {vector_literal}) DESC) as rnk
-                FROM {SEARCH_INDEX_TABLE}
-                WHERE vector IS NOT NULL {table_filter.replace("s.", "")}
-                ORDER BY score DESC
-                LIMIT {prefetch_limit}
-            ),
-            fts_search AS (
-                SELECT 
-                    id,
-                    source_table,
-                    source_id,
-                    source_field,
-                    chunk_seq,
-                    fts_main_{SEARCH_INDEX_TABLE}.match_bm25(id, ?) as score,
-                    rank() OVER (ORDER BY fts_main_{SEARCH_INDEX_TABLE}.match_bm25(id, ?) DESC) as rnk
-                FROM {SEARCH_INDEX_TABLE}
-                WHERE fts_content IS NOT NULL
-                  AND fts_main_{SEARCH_INDEX_TABLE}.match_bm25(id, ?) IS NOT NULL
-                {table_filter.replace("s.", "")}
-                ORDER BY score DESC
-                LIMIT {prefetch_limit}
-            ),
-            rrf_scores AS (
-                SELECT 
-                    COALESCE(v.id, f.id) as id,
-                    COALESCE(v.source_table, f.source_table) as source_table,
-                    COALESCE(v.source_id, f.source_id) as source_id,
-                    COALESCE(v.source_field, f.source_field) as source_field,
-                    COALESCE(v.chunk_seq, f.chunk_seq) as chunk_seq,
-                    (
-                        COALESCE(1.0 / ({self.rrf_k} + v.rnk), 0.0) * {alpha} 
-                        + COALESCE(1.0 / ({self.rrf_k} + f.rnk), 0.0) * {1 - alpha}
-                    ) * ({self.rrf_k} + 1) as rrf_score
-                FROM vector_search v
-                FULL OUTER JOIN fts_search f 
-                  ON v.id = f.id
+            vector_rows, text_rows = await asyncio.gather(
+                asyncio.to_thread(self._vector_recall, query_vector, source_table, prefetch_limit),
+                asyncio.to_thread(self.execute_read, text_sql, text_params),
             )
-            SELECT 
-                r.source_table,
-                r.source_id,
-                r.source_field,
-                r.chunk_seq,
-                i.content,
-                r.rrf_score as score
-            FROM rrf_scores r
-            JOIN {SEARCH_INDEX_TABLE} i 
-              ON r.id = i.id
-            ORDER BY rrf_score DESC
-            LIMIT {limit}
-            """
-            rows = await asyncio.to_thread(self.execute_read, sql, fts_params)
+            fused = self._fuse_rrf(vector_rows, text_rows, alpha, limit)
+            rows = await asyncio.to_thread(self._hydrate_search_rows, fused)
             return self._process_results(rows)
         except Exception as e:
             if "match_bm25" in str(e).lower() or "fts" in str(e).lower():
@@ -315,6 +578,90 @@ class SearchMixin(BaseEngine):
             logger.error(f"Hybrid search failed: {e}")
             raise DatabaseError(f"Hybrid search failed: {e}") from e
 
+    def _build_text_query(
+        self,
+        query: str,
+        table_filter: str,
+        params: list[Any],
+        prefetch_limit: int,
+    ) -> tuple[str, list[Any]]:
+        """构建全文召回查询，返回 (id, rnk)。
+
+        Args:
+            query: 查询文本。
+            table_filter: 源表过滤条件。
+            params: 过滤条件参数。
+            prefetch_limit: 召回条数。
+
+        Returns:
+            (SQL, 参数列表)。
+        """
+        return _text_recall_sql(table_filter), [query, *params, prefetch_limit]
+
+    def _fuse_rrf(
+        self,
+        vector_rows: list[tuple[int, int]],
+        text_rows: list[tuple[int, int]],
+        alpha: float,
+        limit: int,
+    ) -> list[tuple[int, float]]:
+        """按 RRF 融合两路召回的排名。
+
+        两路结果拼成 NumPy 数组，按 id 归并求和后用 argpartition 取前 limit 条，
+        避免逐行字典累加与全量排序。
+
+        Args:
+            vector_rows: 向量召回的 (id, rnk) 列表。
+            text_rows: 全文召回的 (id, rnk) 列表。
+            alpha: 向量召回权重。
+            limit: 返回条数。
+
+        Returns:
+            按融合分数降序排列的 (id, score) 列表。
+        """
+        if limit == 0 or not (vector_rows or text_rows):
+            return []
+
+        k = self.rrf_k
+        vector = np.asarray(vector_rows, dtype=np.int64).reshape(-1, 2)
+        text = np.asarray(text_rows, dtype=np.int64).reshape(-1, 2)
+        ids = np.concatenate([vector[:, 0], text[:, 0]])
+        contributions = np.concatenate([alpha / (k + vector[:, 1]), (1 - alpha) / (k + text[:, 1])])
+
+        unique_ids, inverse = np.unique(ids, return_inverse=True)
+        fused = np.bincount(inverse, weights=contributions, minlength=len(unique_ids))
+
+        if len(fused) > limit:
+            top = np.argpartition(-fused, limit - 1)[:limit]
+        else:
+            top = np.arange(len(fused))
+        top = top[np.argsort(-fused[top], kind="stable")]
+
+        scores = fused[top] * (k + 1)
+        return list(zip(unique_ids[top].tolist(), scores.tolist(), strict=True))
+
+    def _hydrate_search_rows(self, fused: list[tuple[int, float]]) -> list[tuple]:
+        """为融合后的条目回捞源信息与内容，保持融合顺序。
+
+        入选 id、分数与名次注册为 NumPy 视图后与索引表等值连接，
+        查询计划与入选条数无关，顺序与分数也在 SQL 中一并带回。
+
+        Args:
+            fused: 按分数排序的 (id, score) 列表。
+
+        Returns:
+            (source_table, source_id, source_field, chunk_seq, content, score) 行列表。
+        """
+        if not fused:
+            return []
+        ids, scores = zip(*fused, strict=True)
+        selected = {
+            "id": np.array(ids, dtype=np.int64),
+            "score": np.array(scores, dtype=np.float64),
+            "pos": np.arange(len(fused), dtype=np.int32),
+        }
+        return self.execute_read(_HYDRATE_SQL, views={_SELECTED_IDS_VIEW: selected})
+
     async def vector_search(
         self,
         query: str,
@@ -339,33 +686,22 @@ class SearchMixin(BaseEngine):
             raise ValueError(f"limit 必须 >= 0，当前值: {limit}")
 
         query_vector = await self._get_query_vector(query)
-        if not query_vector:
+        if query_vector is None:
             return []
 
-        table_filter = ""
-        params: list[Any] = []
-
+        source_table: str | None = None
         if node_type:
             node_def = self.ontology.nodes.get(node_type)
             if node_def is None:
                 raise ValueError(f"Unknown node type: {node_type}")
-            table_filter = "AND source_table = ?"
-            params.append(node_def.table)
+            source_table = node_def.table
 
-        vector_dim = len(query_vector)
-        vector_literal = self._format_vector_for_sql(query_vector)
-
-        sql = f"""
-        SELECT source_table, source_id, source_field, chunk_seq, content,
-               array_cosine_similarity(vector::DOUBLE[{vector_dim}], {vector_literal}) as score
-        FROM {SEARCH_INDEX_TABLE}
-        WHERE vector IS NOT NULL {table_filter}
-        ORDER BY score DESC
-        LIMIT {limit}
-        """
+        def _search() -> list[tuple]:
+            ids, scores = self._vector_candidates(query_vector, source_table, limit)
+            return self._hydrate_search_rows(list(zip(ids.tolist(), scores.tolist(), strict=True)))
 
         try:
-            rows = await asyncio.to_thread(self.execute_read, sql, params)
+            rows = await asyncio.to_thread(_search)
             return self._process_results(rows)
         except Exception as e:
             logger.error(f"Vector search failed: {e}")
@@ -399,7 +735,7 @@ class SearchMixin(BaseEngine):
             return []
 
         table_filter = ""
-        params: list[Any] = [query, query]
+        params: list[Any] = [query]
 
         if node_type:
             node_def = self.ontology.nodes.get(node_type)
@@ -408,17 +744,7 @@ class SearchMixin(BaseEngine):
             table_filter = "AND source_table = ?"
             params.append(node_def.table)
 
-        sql = f"""
-        SELECT 
-            source_table, source_id, source_field, chunk_seq, content,
-            fts_main_{SEARCH_INDEX_TABLE}.match_bm25(id, ?) as score
-        FROM {SEARCH_INDEX_TABLE}
-        WHERE fts_content IS NOT NULL
-          AND fts_main_{SEARCH_INDEX_TABLE}.match_bm25(id, ?) IS NOT NULL
-        {table_filter}
-        ORDER BY score DESC
-        LIMIT ?
-        """
+        sql = _fts_search_sql(table_filter)
         params.append(limit)
 
         try:
@@ -448,21 +774,18 @@ class SearchMixin(BaseEngine):
         """
         validate_table_name(source_table)
 
-        def _fetch() -> dict[str, Any] | None:
-            rows = self.execute_read(f"SELECT * FROM {source_table} WHERE __id = ?", [source_id])
-            if not rows:
-                return None
-            row = rows[0]
-            columns = self._get_table_columns(source_table)
-            return dict(zip(columns, row, strict=True))
-
-        return await asyncio.to_thread(_fetch)
+        return await asyncio.to_thread(
+            self.execute_read_record,
+            f"SELECT * FROM {source_table} WHERE __id = ?",
+            [source_id],
+        )
 
     async def query_raw_sql(self, sql: str) -> list[dict[str, Any]]:
         """安全执行原始 SQL 查询。
 
         使用只读连接执行，自动拒绝所有写操作。
-        自动添加 LIMIT 限制，防止返回过多数据。
+        自动添加 LIMIT 限制，防止返回过多数据；查询语句还按结果体积上限推出行数上界，
+        包一层外层 LIMIT 交给 DuckDB 执行。其他语句（如 EXPLAIN）只靠取数时的体积检查。
 
         Args:
             sql: 原始 SQL 查询字符串。
@@ -474,46 +797,48 @@ class SearchMixin(BaseEngine):
             ValueError: SQL 语句类型不允许或结果集大小超限。
             duckdb.Error: SQL 执行失败或包含写操作。
         """
-        sql_stripped = sql.strip()
-        self._validate_sql_type(sql_stripped)
+        # 先去掉注释再去掉结尾分号，注释后的分号或分号后的注释都不会残留。
+        sql_stripped = (
+            _SQL_COMMENTS_AND_STRINGS_RE.sub(_keep_sql_literal, sql).strip().rstrip(";").rstrip()
+        )
+        # 关键字与 LIMIT 检查都只看代码部分，字符串中的单词不会误判。
+        sql_code = _SQL_COMMENTS_AND_STRINGS_RE.sub(_keep_sql_identifier, sql_stripped)
+        self._validate_sql_type(sql_code)
+
+        if not _LIMIT_RE.search(sql_code):
+            sql_stripped += f"\nLIMIT {QUERY_DEFAULT_LIMIT}"
 
-        if not re.search(r"\bLIMIT\s+\d+", sql_stripped.upper()):
-            sql = sql_stripped + f" LIMIT {QUERY_DEFAULT_LIMIT}"
+        # 每行 JSON 至少占 _MIN_JSON_ROW_BYTES 字节，行数超过该上界的结果必然超限，
+        # 外层 LIMIT 让 DuckDB 在执行阶段就停止产出多余的行，截断不会改变未超限的结果。
+        if _ROW_QUERY_RE.match(sql_code):
+            max_rows = QUERY_RESULT_SIZE_LIMIT // _MIN_JSON_ROW_BYTES + 1
+            sql_stripped = f"SELECT * FROM (\n{sql_stripped}\n) AS _raw LIMIT {max_rows}"
+        sql = sql_stripped
 
         return await asyncio.to_thread(self._execute_raw_sql_readonly, sql)
 
     def _validate_sql_type(self, sql: str) -> None:
         """验证 SQL 语句类型，仅允许 SELECT 查询。
 
+        单次扫描候选单词并在关键字集合中查找，大小写不敏感，无需先把整条 SQL 转为大写。
+
         Args:
             sql: SQL 查询字符串。
 
         Raises:
             ValueError: 当 SQL 不是 SELECT 语句时抛出。
         """
-        forbidden_keywords = [
-            "INSERT",
-            "UPDATE",
-            "DELETE",
-            "DROP",
-            "ALTER",
-            "CREATE",
-            "TRUNCATE",
-            "GRANT",
-            "REVOKE",
-            "EXEC",
-            "EXECUTE",
-            "CALL",
-        ]
-
-        sql_upper = sql.upper()
-        for keyword in forbidden_keywords:
-            if re.search(rf"\b{keyword}\b", sql_upper):
+        for match in _FORBIDDEN_CANDIDATE_RE.finditer(sql):
+            keyword = match.group().upper()
+            if keyword in _FORBIDDEN_SQL_KEYWORDS:
                 raise ValueError(f"仅允许 SELECT 查询，检测到禁止的关键字: {keyword}")
 
     def _execute_raw_sql_readonly(self, sql: str) -> list[dict[str, Any]]:
         """在只读模式下执行 SQL 查询。
 
+        列名取自游标 description，别名、表达式列与 ``SELECT *`` 都能得到真实列名。
+        结果按批取回并累计每批的 JSON 体积，超限即中止，不必先物化整个结果集。
+
         Args:
             sql: 要执行的 SQL 查询。
 
@@ -524,82 +849,36 @@ class SearchMixin(BaseEngine):
             ValueError: 结果集大小超限。
             duckdb.Error: SQL 执行失败或包含写操作。
         """
-        rows = self.execute_read(sql)
-        if not rows:
-            return []
-
-        columns = self._extract_columns_from_sql(sql)
-        actual_col_count = len(rows[0])
-        if len(columns) != actual_col_count:
-            columns = columns[:actual_col_count]
-            if len(columns) < actual_col_count:
-                columns.extend([f"col_{i}" for i in range(len(columns), actual_col_count)])
-        result = [dict(zip(columns, row, strict=True)) for row in rows]
-
-        json_bytes = orjson.dumps(result)
-        if len(json_bytes) > QUERY_RESULT_SIZE_LIMIT:
-            raise ValueError(
-                f"Result set size exceeds {QUERY_RESULT_SIZE_LIMIT // (1024 * 1024)}MB limit."
-            )
-
-        return result
-
-    def _format_vector_literal(self, vector: list[float]) -> str:
-        """格式化向量为 SQL 字面量。"""
-        values = ", ".join(str(v) for v in vector)
-        return f"[{values}]"
 
-    def _to_float32_array(self, vector: list[float]) -> list[float]:
-        """确保向量为 float32 格式。
-
-        Args:
-            vector: 浮点数列表。
-
-        Returns:
-            float32 值列表。
-        """
-        return [float(np.float32(v)) for v in vector]
-
-    def _format_vector_for_sql(self, vector: list[float]) -> str:
-        """格式化向量为 SQL 字面量，使用固定大小 DOUBLE 数组。
-
-        Args:
-            vector: 浮点数列表。
-
-        Returns:
-            SQL DOUBLE 数组字面量字符串。
-        """
-        dim = len(vector)
-        values = ", ".join(str(float(np.float32(v))) for v in vector)
-        return f"[{values}]::DOUBLE[{dim}]"
+        def consume(conn) -> list[dict[str, Any]]:
+            columns = [column[0] for column in conn.description]
+            result: list[dict[str, Any]] = []
+            running_bytes = 0
+            while batch := conn.fetchmany(_RAW_SQL_FETCH_SIZE):
+                records = [dict(zip(columns, row, strict=True)) for row in batch]
+                running_bytes += len(orjson.dumps(records))
+                if running_bytes > QUERY_RESULT_SIZE_LIMIT:
+                    raise ValueError(
+                        f"Result set size exceeds {QUERY_RESULT_SIZE_LIMIT // (1024 * 1024)}MB limit."
+                    )
+                result.extend(records)
+            return result
+
+        return self._run_read(sql, None, None, consume)
 
     def _process_results(self, rows: list[Any]) -> list[dict[str, Any]]:
         """处理原始数据库行为结构化结果。"""
         if not rows:
             return []
 
-        columns = ["source_table", "source_id", "source_field", "chunk_seq", "content", "score"]
-
-        results = []
-        for i, row in enumerate(rows):
-            row_dict = {}
-            for j, value in enumerate(row):
-                if j < len(columns):
-                    row_dict[columns[j]] = value
-                else:
-                    row_dict[f"col_{j}"] = value
-
-            # 增加元数据
-            row_dict["_meta"] = {
-                "rank": i + 1,
-                "rrf_k": self.rrf_k,
-                "auto_k": self._auto_k,
-                "strategy": self._strategy,
-            }
-
-            results.append(row_dict)
-
-        return results
+        rrf_k, auto_k, strategy = self.rrf_k, self._auto_k, self._strategy
+        return [
+            dict(
+                zip(_RESULT_COLUMNS, row, strict=True),
+                _meta={"rank": rank, "rrf_k": rrf_k, "auto_k": auto_k, "strategy": strategy},
+            )
+            for rank, row in enumerate(rows, start=1)
+        ]
 
     def _get_table_columns(self, table_name: str) -> list[str]:
         """获取表的列名列表。
@@ -614,35 +893,3 @@ class SearchMixin(BaseEngine):
             f"SELECT column_name FROM information_schema.columns WHERE table_name = '{table_name}' ORDER BY ordinal_position"
         )
         return [row[0] for row in rows]
-
-    def _extract_columns_from_sql(self, sql: str) -> list[str]:
-        """从 SQL 中提取列名。
-
-        Args:
-            sql: SQL 查询语句。
-
-        Returns:
-            列名列表。
-        """
-        sql_upper = sql.upper()
-        select_idx = sql_upper.find("SELECT")
-        from_idx = sql_upper.find("FROM")
-
-        if select_idx == -1 or from_idx == -1:
-            return [f"col_{i}" for i in range(100)]
-
-        select_part = sql[select_idx + 6 : from_idx].strip()
-
-        if select_part == "*":
-            return [f"col_{i}" for i in range(100)]
-
-        columns = []
-        for col in select_part.split(","):
-            col = col.strip()
-            if " AS " in col.upper():
-                col = col.split()[-1]
-            elif "." in col:
-                col = col.split(".")[-1]
-            columns.append(col)
-
-        return columns
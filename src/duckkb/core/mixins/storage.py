@@ -1,12 +1,13 @@
 """存储能力 Mixin。"""
 
 import asyncio
-import shutil
+import os
 from pathlib import Path
 
 from duckkb.constants import validate_table_name
 from duckkb.core.base import BaseEngine
 from duckkb.logger import logger
+from duckkb.utils.fs import fsync_dir
 
 
 class StorageMixin(BaseEngine):
@@ -31,9 +32,9 @@ class StorageMixin(BaseEngine):
 
         流程：
         1. Staging: 使用 read_json_auto 加载到临时表
-        2. ID Generation: 为缺失 __id 的记录使用 SEQUENCE 生成 ID
-        3. Merge: 使用 INSERT OR REPLACE 同步到主表（按 unique_fields 去重）
-        4. Sync Sequence: 更新 SEQUENCE 起始值为 MAX(__id) + 1
+        2. Sync Sequence: 以主表与暂存数据中的 MAX(__id) + 1 为起点重建 SEQUENCE
+        3. ID Generation: 为缺失 __id 的记录使用 SEQUENCE 生成 ID
+        4. Merge: 使用 INSERT ... SELECT ... ON CONFLICT 同步到主表（按 unique_fields 去重）
 
         Args:
             table_name: 目标表名。
@@ -67,16 +68,33 @@ class StorageMixin(BaseEngine):
                     logger.warning(f"No records loaded from {path_pattern}")
                     return 0
 
-                rows_needing_id = conn.execute(
-                    f"SELECT rowid FROM {staging_table} WHERE __id IS NULL"
-                ).fetchall()
-
-                for (rowid,) in rows_needing_id:
+                # DuckDB 不支持 setval，逐个 nextval 推进的代价与最大 ID 成正比；
+                # 这里先解除 __id 默认值对序列的依赖，以 max_id + 1 为起点重建序列，
+                # 再把默认值指回新序列，之后为缺失 __id 的记录取号。
+                max_id_result = conn.execute(
+                    f"SELECT GREATEST("
+                    f"(SELECT COALESCE(MAX(__id), 0) FROM {table_name}), "
+                    f"(SELECT COALESCE(MAX(__id), 0) FROM {staging_table}))"
+                ).fetchone()
+                max_id = max_id_result[0] if max_id_result else 0
+                last_result = conn.execute(
+                    "SELECT COALESCE(last_value, start_value - 1) FROM duckdb_sequences() "
+                    "WHERE sequence_name = ?",
+                    [seq_name],
+                ).fetchone()
+                if last_result and max_id > last_result[0]:
+                    conn.execute(f"ALTER TABLE {table_name} ALTER COLUMN __id DROP DEFAULT")
+                    conn.execute(f"DROP SEQUENCE {seq_name}")
+                    conn.execute(f"CREATE SEQUENCE {seq_name} START {int(max_id) + 1}")
                     conn.execute(
-                        f"UPDATE {staging_table} SET __id = nextval('{seq_name}') WHERE rowid = ?",
-                        [rowid],
+                        f"ALTER TABLE {table_name} ALTER COLUMN __id "
+                        f"SET DEFAULT nextval('{seq_name}')"
                     )
 
+                conn.execute(
+                    f"UPDATE {staging_table} SET __id = nextval('{seq_name}') WHERE __id IS NULL"
+                )
+
                 columns_result = conn.execute(
                     f"SELECT column_name FROM information_schema.columns "
                     f"WHERE table_name = '{table_name}' ORDER BY ordinal_position"
@@ -88,30 +106,19 @@ class StorageMixin(BaseEngine):
                 update_set = ", ".join(f"{c} = excluded.{c}" for c in update_cols)
 
                 cols_str = ", ".join(columns)
-                placeholders = ", ".join(["?" for _ in columns])
-
-                rows = conn.execute(f"SELECT {cols_str} FROM {staging_table}").fetchall()
+                conflict_action = f"DO UPDATE SET {update_set}" if update_set else "DO NOTHING"
 
-                if update_set:
-                    conn.executemany(
-                        f"INSERT INTO {table_name} ({cols_str}) VALUES ({placeholders}) "
-                        f"ON CONFLICT ({identity_cols}) DO UPDATE SET {update_set}",
-                        rows,
-                    )
-                else:
-                    conn.executemany(
-                        f"INSERT INTO {table_name} ({cols_str}) VALUES ({placeholders}) "
-                        f"ON CONFLICT ({identity_cols}) DO NOTHING",
-                        rows,
-                    )
+                # 暂存表到主表在 DuckDB 内一条语句完成，行数据不经过 Python。
+                # 同一业务键出现多次时保留最后一行，与逐行 upsert 的覆盖语义一致。
+                conn.execute(
+                    f"INSERT INTO {table_name} ({cols_str}) "
+                    f"SELECT {cols_str} FROM {staging_table} "
+                    f"QUALIFY row_number() OVER (PARTITION BY {identity_cols} ORDER BY rowid DESC) = 1 "
+                    f"ON CONFLICT ({identity_cols}) {conflict_action}"
+                )
 
                 conn.execute(f"DROP TABLE {staging_table}")
 
-                max_id_result = conn.execute(f"SELECT COALESCE(MAX(__id), 0) FROM {table_name}").fetchone()
-                max_id = max_id_result[0] if max_id_result else 0
-                conn.execute(f"DROP SEQUENCE IF EXISTS {seq_name}")
-                conn.execute(f"CREATE SEQUENCE {seq_name} START {max_id + 1}")
-
                 logger.info(f"Loaded {record_count} records into {table_name}")
                 return record_count
 
@@ -126,7 +133,8 @@ class StorageMixin(BaseEngine):
     ) -> int:
         """导出表数据到 JSONL 文件。
 
-        导出时按 __id 排序，支持分片。
+        导出时按 __id 排序，支持分片。COPY 在只读游标上执行，不占用写锁，
+        多个表可并发导出。
         目录结构：{output_dir}/{YYYYMMDD}/part_{NNN}.jsonl
 
         Args:
@@ -152,7 +160,7 @@ class StorageMixin(BaseEngine):
             if partition_by_date:
                 self._dump_partitioned_by_date(table_name, output_dir, max_rows_per_file)
             else:
-                self._dump_single_file(table_name, output_dir, max_rows_per_file)
+                self._dump_single_file(table_name, output_dir, max_rows_per_file, record_count)
 
             return record_count
 
@@ -171,25 +179,18 @@ class StorageMixin(BaseEngine):
         """按日期分区导出，支持分片。
 
         目录结构：{output_dir}/{YYYYMMDD}/part_{NNN}.jsonl
+        各日期的行数由一次 GROUP BY 查询得到，不再逐个日期重复扫描计数。
+        分片先写临时文件再 os.replace 原子替换，每个日期目录写完后刷盘一次。
         """
         rows = self.execute_read(
-            f"SELECT DISTINCT strftime(__created_at, '%Y%m%d') as date_part "
-            f"FROM {table_name} ORDER BY date_part"
+            f"SELECT strftime(__created_at, '%Y%m%d') AS date_part, COUNT(*) "
+            f"FROM {table_name} GROUP BY date_part ORDER BY date_part"
         )
 
-        for (date_part,) in rows:
+        for date_part, total_rows in rows:
             date_dir = output_dir / date_part
             date_dir.mkdir(parents=True, exist_ok=True)
 
-            count_row = self.execute_read(
-                f"SELECT COUNT(*) FROM {table_name} "
-                f"WHERE strftime(__created_at, '%Y%m%d') = '{date_part}'"
-            )
-            total_rows = count_row[0][0] if count_row else 0
-
-            if total_rows == 0:
-                continue
-
             num_parts = (total_rows + max_rows_per_file - 1) // max_rows_per_file
 
             for part_idx in range(num_parts):
@@ -197,7 +198,7 @@ class StorageMixin(BaseEngine):
                 temp_file = date_dir / "_temp.jsonl"
                 final_file = date_dir / f"part_{part_idx}.jsonl"
 
-                self.execute_write(
+                self.execute_read(
                     f"COPY ("
                     f"  SELECT * FROM {table_name} "
                     f"  WHERE strftime(__created_at, '%Y%m%d') = '{date_part}' "
@@ -206,18 +207,25 @@ class StorageMixin(BaseEngine):
                     f") TO '{temp_file}' (FORMAT JSON)"
                 )
 
-                shutil.move(str(temp_file), str(final_file))
+                os.replace(temp_file, final_file)
+
+            fsync_dir(date_dir)
 
     def _dump_single_file(
         self,
         table_name: str,
         output_dir: Path,
         max_rows_per_file: int,
+        total_rows: int,
     ) -> None:
-        """导出为多个分片文件。"""
-        count_row = self.execute_read(f"SELECT COUNT(*) FROM {table_name}")
-        total_rows = count_row[0][0] if count_row else 0
+        """导出为多个分片文件。
 
+        Args:
+            table_name: 源表名。
+            output_dir: 输出目录。
+            max_rows_per_file: 每个文件最大行数。
+            total_rows: 调用方已统计的表行数，避免重复计数。
+        """
         if total_rows == 0:
             return
 
@@ -228,7 +236,7 @@ class StorageMixin(BaseEngine):
             temp_file = output_dir / "_temp.jsonl"
             final_file = output_dir / f"part_{part_idx}.jsonl"
 
-            self.execute_write(
+            self.execute_read(
                 f"COPY ("
                 f"  SELECT * FROM {table_name} "
                 f"  ORDER BY __id "
@@ -236,12 +244,14 @@ class StorageMixin(BaseEngine):
                 f") TO '{temp_file}' (FORMAT JSON)"
             )
 
-            shutil.move(str(temp_file), str(final_file))
+            os.replace(temp_file, final_file)
+
+        fsync_dir(output_dir)
 
     async def load_node(self, node_type: str) -> int:
         """加载节点数据。
 
-        从 data/nodes/{node_type}/**/*.jsonl 加载数据到对应的表。
+        从 data/nodes/{node_type}/**/*.jsonl 加载数据到对应的表，目录不存在时返回 0。
 
         Args:
             node_type: 节点类型名称。
@@ -256,9 +266,12 @@ class StorageMixin(BaseEngine):
         if node_def is None:
             raise ValueError(f"Unknown node type: {node_type}")
 
-        path_pattern = str(
-            self.config.storage.data_dir / "nodes" / node_def.table / "**" / "*.jsonl"
-        )
+        table_dir = self.config.storage.data_dir / "nodes" / node_def.table
+        # 目录不存在时直接返回，不必为此占用写事务并让 DuckDB 展开 glob 后报 No files found。
+        if not table_dir.is_dir():
+            return 0
+
+        path_pattern = str(table_dir / "**" / "*.jsonl")
         return await self.load_table(
             table_name=node_def.table,
             path_pattern=path_pattern,
@@ -294,7 +307,7 @@ class StorageMixin(BaseEngine):
     async def load_edge(self, edge_name: str) -> int:
         """加载边数据。
 
-        从 data/edges/{edge_name}/**/*.jsonl 加载数据。
+        从 data/edges/{edge_name}/**/*.jsonl 加载数据，目录不存在时返回 0。
 
         Args:
             edge_name: 边类型名称。
@@ -310,9 +323,11 @@ class StorageMixin(BaseEngine):
             raise ValueError(f"Unknown edge type: {edge_name}")
 
         table_name = f"edge_{edge_name}"
-        path_pattern = str(
-            self.config.storage.data_dir / "edges" / edge_name.lower() / "**" / "*.jsonl"
-        )
+        edge_dir = self.config.storage.data_dir / "edges" / edge_name.lower()
+        if not edge_dir.is_dir():
+            return 0
+
+        path_pattern = str(edge_dir / "**" / "*.jsonl")
 
         unique_fields = ["__from_id", "__to_id"]
         return await self.load_table(
@@ -1,14 +1,56 @@
 """分词 Mixin。"""
 
 import asyncio
+import multiprocessing
+import os
 import threading
-
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from duckkb.constants import (
+    SEGMENT_PARALLEL_CHUNK_SIZE,
+    SEGMENT_PARALLEL_MIN_TEXTS,
+    SEGMENT_THREAD_WORKERS,
+)
 from duckkb.core.base import BaseEngine
 from duckkb.logger import logger
 
 _jieba_lock = threading.Lock()
 
 
+def _init_segment_worker(user_dict: str | None) -> None:
+    """分词子进程初始化：加载 jieba 词典与用户词典。
+
+    用户词典加载失败时与 init_tokenizer 一致，只记录警告并继续，
+    避免初始化异常导致整个进程池不可用。
+
+    Args:
+        user_dict: 用户词典路径，不存在时为 None。
+    """
+    import jieba
+
+    if user_dict:
+        try:
+            jieba.load_userdict(user_dict)
+        except Exception as e:
+            logger.warning(f"Failed to load user dict: {e}")
+    jieba.initialize()
+
+
+def _segment_texts(texts: list[str]) -> list[str]:
+    """在子进程中对一组文本分词。
+
+    Args:
+        texts: 待分词的文本列表。
+
+    Returns:
+        空格分隔的分词结果列表。
+    """
+    import jieba
+
+    return [" ".join(jieba.cut_for_search(t)) if t else "" for t in texts]
+
+
 class TokenizerMixin(BaseEngine):
     """分词 Mixin。
 
@@ -23,6 +65,9 @@ class TokenizerMixin(BaseEngine):
         """初始化分词 Mixin。"""
         super().__init__(*args, **kwargs)
         self._jieba_initialized = False
+        self._segment_pool: ProcessPoolExecutor | None = None
+        self._segment_thread_pool: ThreadPoolExecutor | None = None
+        self._segment_pool_lock = threading.Lock()
 
     @property
     def tokenizer(self) -> str:
@@ -73,17 +118,37 @@ class TokenizerMixin(BaseEngine):
         if not text:
             return ""
 
-        await asyncio.to_thread(self.init_tokenizer)
+        # 初始化（首次加载词典）与分词在同一次线程切换内完成，不阻塞事件循环。
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_segment_thread_pool(), self._segment_sync, text)
 
-        def _do_segment() -> str:
-            import jieba
+    async def segment_batch(self, texts: list[str]) -> list[str]:
+        """批量分词。
 
-            return " ".join(jieba.cut_for_search(text))
+        jieba 是纯 Python 实现，线程内分词受 GIL 限制无法利用多核。
+        文本数量达到 SEGMENT_PARALLEL_MIN_TEXTS 且机器有多个 CPU 时，
+        按 SEGMENT_PARALLEL_CHUNK_SIZE 分组提交到进程池并行分词；
+        否则在单个线程内完成，避免进程间序列化开销。
 
-        return await asyncio.to_thread(_do_segment)
+        Args:
+            texts: 待分词的文本列表。
 
-    async def segment_batch(self, texts: list[str]) -> list[str]:
-        """批量分词。
+        Returns:
+            分词结果列表。
+        """
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_segment_thread_pool(), self._segment_batch_sync, texts
+        )
+
+    def _segment_batch_sync(self, texts: list[str]) -> list[str]:
+        """同步批量分词。
+
+        用于事务内的同步索引构建场景，大批量时同样分发到进程池。
+        进程池损坏时丢弃该进程池（下次重新创建），本批改为在当前进程内分词。
 
         Args:
             texts: 待分词的文本列表。
@@ -94,14 +159,84 @@ class TokenizerMixin(BaseEngine):
         if not texts:
             return []
 
-        await asyncio.to_thread(self.init_tokenizer)
+        pool = self._get_segment_pool() if len(texts) >= SEGMENT_PARALLEL_MIN_TEXTS else None
+        if pool is not None:
+            try:
+                groups = pool.map(
+                    _segment_texts,
+                    [
+                        texts[i : i + SEGMENT_PARALLEL_CHUNK_SIZE]
+                        for i in range(0, len(texts), SEGMENT_PARALLEL_CHUNK_SIZE)
+                    ],
+                )
+                return [segmented for group in groups for segmented in group]
+            except BrokenProcessPool as e:
+                logger.warning(f"Segmentation process pool broken, segmenting in-process: {e}")
+                self._discard_segment_pool(pool)
 
-        import jieba
+        self.init_tokenizer()
+        return _segment_texts(texts)
+
+    def _get_segment_pool(self) -> ProcessPoolExecutor | None:
+        """获取分词进程池，首次调用时创建。
 
-        def _do_segment_batch() -> list[str]:
-            return [" ".join(jieba.cut_for_search(t)) for t in texts]
+        子进程使用 spawn 方式启动，避免在持有 DuckDB 后台线程的进程中 fork。
 
-        return await asyncio.to_thread(_do_segment_batch)
+        Returns:
+            进程池；单 CPU 环境下返回 None。
+        """
+        workers = os.cpu_count() or 1
+        if workers < 2:
+            return None
+
+        with self._segment_pool_lock:
+            if self._segment_pool is None:
+                user_dict = self.kb_path / "user_dict.txt"
+                self._segment_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_segment_worker,
+                    initargs=(str(user_dict) if user_dict.exists() else None,),
+                )
+                logger.debug(f"Started segmentation process pool with {workers} workers")
+            return self._segment_pool
+
+    def _discard_segment_pool(self, pool: ProcessPoolExecutor) -> None:
+        """丢弃已损坏的分词进程池，下次使用时重新创建。
+
+        Args:
+            pool: 损坏的进程池；若已被其他线程替换则不做处理。
+        """
+        with self._segment_pool_lock:
+            if self._segment_pool is pool:
+                self._segment_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_segment_thread_pool(self) -> ThreadPoolExecutor:
+        """获取分词专用线程池，首次调用时创建。
+
+        分词不与事件循环默认线程池共享，避免与数据库读写等 to_thread 调用互相排队。
+        jieba 在线程内受 GIL 限制，少量线程即可。
+
+        Returns:
+            分词线程池。
+        """
+        with self._segment_pool_lock:
+            if self._segment_thread_pool is None:
+                self._segment_thread_pool = ThreadPoolExecutor(
+                    max_workers=SEGMENT_THREAD_WORKERS, thread_name_prefix="duckkb-segment"
+                )
+            return self._segment_thread_pool
+
+    def shutdown_tokenizer(self) -> None:
+        """关闭分词进程池与线程池（如已创建）。"""
+        with self._segment_pool_lock:
+            if self._segment_pool is not None:
+                self._segment_pool.shutdown(cancel_futures=True)
+                self._segment_pool = None
+            if self._segment_thread_pool is not None:
+                self._segment_thread_pool.shutdown(wait=False, cancel_futures=True)
+                self._segment_thread_pool = None
 
     def _segment_sync(self, text: str) -> str:
         """同步分词处理。
@@ -5,6 +5,7 @@ from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any, cast
 
+import orjson
 from fastmcp import FastMCP
 from fastmcp.server.lifespan import lifespan
 
@@ -12,6 +13,29 @@ from duckkb.core.engine import Engine
 from duckkb.logger import logger
 
 
+def _dumps(obj: Any, *, indent: bool = True) -> str:
+    """将工具结果序列化为 JSON 字符串。
+
+    使用 orjson 编码，非 JSON 原生类型回退为 str()；日期时间同样经 str() 输出，
+    与 json.dumps(default=str) 的格式一致。超出 64 位的整数等 orjson 无法编码的值
+    回退到标准库 json。
+
+    Args:
+        obj: 待序列化的对象。
+        indent: 是否以两空格缩进输出。
+
+    Returns:
+        JSON 字符串。
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(obj, default=str, option=option).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, default=str)
+
+
 def _parse_edge_types(edge_types: str | None) -> list[str] | None:
     """解析 edge_types 参数字符串为列表。
 
@@ -190,7 +214,7 @@ class DuckMCP(Engine, FastMCP):
                 FileNotFoundError: 临时文件不存在时抛出。
             """
             result = await self.import_knowledge_bundle(temp_file_path)
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
     def _register_query_raw_sql_tool(self) -> None:
         """注册 query_raw_sql 工具。"""
@@ -218,7 +242,7 @@ class DuckMCP(Engine, FastMCP):
                 ValueError: SQL 语句不是只读查询时抛出。
             """
             results = await self.query_raw_sql(sql)
-            return json.dumps(results, ensure_ascii=False, default=str)
+            return _dumps(results, indent=False)
 
     def _register_search_tool(self) -> None:
         """注册 search 工具。"""
@@ -257,7 +281,7 @@ class DuckMCP(Engine, FastMCP):
                 limit=limit,
                 alpha=alpha,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
     def _register_vector_search_tool(self) -> None:
         """注册 vector_search 工具。"""
@@ -285,7 +309,7 @@ class DuckMCP(Engine, FastMCP):
                 node_type=node_type,
                 limit=limit,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
     def _register_fts_search_tool(self) -> None:
         """注册 fts_search 工具。"""
@@ -313,7 +337,7 @@ class DuckMCP(Engine, FastMCP):
                 node_type=node_type,
                 limit=limit,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
 
     def _register_get_source_record_tool(self) -> None:
         """注册 get_source_record 工具。"""
@@ -339,7 +363,7 @@ class DuckMCP(Engine, FastMCP):
                 source_table=source_table,
                 source_id=source_id,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2, default=str)
+            return _dumps(result)
 
     def _register_get_neighbors_tool(self) -> None:
         """注册 get_neighbors 工具。"""
@@ -377,7 +401,7 @@ class DuckMCP(Engine, FastMCP):
                 direction=direction,
                 limit=limit,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2, default=str)
+            return _dumps(result)
 
     def _register_graph_search_tool(self) -> None:
         """注册 graph_search 工具。"""
@@ -425,7 +449,7 @@ class DuckMCP(Engine, FastMCP):
                 neighbor_limit=neighbor_limit,
                 alpha=alpha,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2, default=str)
+            return _dumps(result)
 
     def _register_traverse_tool(self) -> None:
         """注册 traverse 工具。"""
@@ -469,7 +493,7 @@ class DuckMCP(Engine, FastMCP):
                 limit=limit,
                 return_paths=return_paths,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2, default=str)
+            return _dumps(result)
 
     def _register_extract_subgraph_tool(self) -> None:
         """注册 extract_subgraph 工具。"""
@@ -510,7 +534,7 @@ class DuckMCP(Engine, FastMCP):
                 node_limit=node_limit,
                 edge_limit=edge_limit,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2, default=str)
+            return _dumps(result)
 
     def _register_find_paths_tool(self) -> None:
         """注册 find_paths 工具。"""
@@ -552,4 +576,4 @@ class DuckMCP(Engine, FastMCP):
                 max_depth=max_depth,
                 limit=limit,
             )
-            return json.dumps(result, ensure_ascii=False, indent=2, default=str)
+            return _dumps(result)
@@ -1,5 +1,16 @@
 """工具模块。"""
 
+from duckkb.utils.fs import fsync_dir
+from duckkb.utils.hashing import content_hash
+from duckkb.utils.lru import LRUCache
 from duckkb.utils.rwlock import FairReadWriteLock
+from duckkb.utils.vector import normalize_vectors, register_vector_batch
 
-__all__ = ["FairReadWriteLock"]
+__all__ = [
+    "FairReadWriteLock",
+    "LRUCache",
+    "content_hash",
+    "fsync_dir",
+    "normalize_vectors",
+    "register_vector_batch",
+]
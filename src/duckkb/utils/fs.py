@@ -0,0 +1,21 @@
+"""文件系统工具。"""
+
+import os
+from pathlib import Path
+
+
+def fsync_dir(path: Path) -> None:
+    """刷盘目录元数据，使其中的 rename/replace 在掉电后仍然生效。
+
+    仅 POSIX 平台支持以只读方式打开目录并 fsync，其他平台直接跳过。
+
+    Args:
+        path: 目录路径。
+    """
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,19 @@
+"""内容哈希工具。"""
+
+import hashlib
+
+
+def content_hash(text: str) -> str:
+    """计算文本内容哈希，用作向量与分词缓存的键。
+
+    缓存会持久化到 search_cache.parquet，算法变更会使已有缓存全部失效，
+    因此保持 MD5 不变。哈希只用于内容去重，以 ``usedforsecurity=False``
+    声明非安全用途，FIPS 模式下也可使用 OpenSSL 的 MD5 实现。
+
+    Args:
+        text: 待计算哈希的文本。
+
+    Returns:
+        32 位十六进制哈希字符串。
+    """
+    return hashlib.md5(text.encode("utf-8"), usedforsecurity=False).hexdigest()
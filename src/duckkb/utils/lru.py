@@ -0,0 +1,102 @@
+"""进程内 LRU 缓存实现。"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class LRUCache:
+    """容量有限的 LRU 缓存（线程安全），可选 TTL。
+
+    命中时把条目移到队尾，超出容量时淘汰队首最久未使用的条目。
+    设置 ttl 时，写入超过 ttl 秒的条目视为未命中并被移除。
+    记录命中与未命中次数，便于观察命中率。
+
+    Attributes:
+        maxsize: 最大条目数。
+        ttl: 条目存活秒数，None 表示不过期。
+        hits: 命中次数。
+        misses: 未命中次数。
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        """初始化 LRU 缓存。
+
+        Args:
+            maxsize: 最大条目数，必须 >= 1。
+            ttl: 条目存活秒数，None 表示不过期。
+
+        Raises:
+            ValueError: maxsize 小于 1 时抛出。
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """读取缓存条目。
+
+        Args:
+            key: 缓存键。
+
+        Returns:
+            缓存值，未命中时返回 None。
+        """
+        with self._lock:
+            try:
+                stored_at, value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """写入缓存条目，必要时淘汰最久未使用的条目。
+
+        Args:
+            key: 缓存键。
+            value: 缓存值。
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """清空缓存条目，保留统计计数。"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """当前条目数。"""
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        """缓存统计信息。
+
+        Returns:
+            包含 size、maxsize、hits、misses、hit_rate 的字典。
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
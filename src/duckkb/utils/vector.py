@@ -0,0 +1,65 @@
+"""向量批量写入工具。"""
+
+from collections.abc import Sequence
+
+import duckdb
+import numpy as np
+
+
+def register_vector_batch(
+    conn: duckdb.DuckDBPyConnection,
+    name: str,
+    vectors: Sequence[Sequence[float]] | np.ndarray,
+) -> str:
+    """将一批向量以列式 NumPy 缓冲区注册到连接上。
+
+    DuckDB 绑定 Python 列表参数时会逐元素转换，向量维度较高时开销很大；
+    而扫描一维 NumPy 数组是整块内存拷贝。这里把 (n, dim) 矩阵展开为
+    row/pos/val 三列注册为视图，再由 DuckDB 按行聚合回 FLOAT[]。
+
+    调用方负责在使用完毕后执行 ``conn.unregister(name)``。
+
+    Args:
+        conn: DuckDB 连接。
+        name: 注册的视图名。
+        vectors: 向量列表或二维数组，所有向量维度必须一致。
+
+    Returns:
+        可直接嵌入 SQL 的子查询，输出列为 ``row``（与输入顺序一致，从 0 开始）
+        和 ``vector``（FLOAT[]）。
+
+    Raises:
+        ValueError: 向量维度不一致时抛出。
+    """
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D vector batch, got shape {matrix.shape}")
+
+    n, dim = matrix.shape
+    conn.register(
+        name,
+        {
+            "row": np.repeat(np.arange(n, dtype=np.int64), dim),
+            "pos": np.tile(np.arange(dim, dtype=np.int32), n),
+            "val": matrix.ravel(),
+        },
+    )
+    return f"(SELECT row, list(val ORDER BY pos) AS vector FROM {name} GROUP BY row)"
+
+
+def normalize_vectors(vectors: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    """将一批向量按行做 L2 归一化。
+
+    单位向量之间的余弦相似度等于内积，检索时可用 ``array_inner_product``
+    代替每次都要重算两侧范数的 ``array_cosine_similarity``。范数为 0 的向量原样保留。
+
+    Args:
+        vectors: 向量列表或二维数组，所有向量维度必须一致。
+
+    Returns:
+        归一化后的 float32 二维数组。
+    """
+    matrix = np.array(vectors, dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
@@ -27,6 +27,23 @@ class TestCLICommands:
         assert "DuckKB" in result.stdout
 
 
+class TestEchoJson:
+    """JSON 输出测试。"""
+
+    def test_echo_json_datetime_and_huge_int(self, capsys):
+        """测试日期时间保持 str() 格式，超出 64 位的整数回退到标准库 json。"""
+        from datetime import UTC, datetime
+
+        from duckkb.cli.duck_typer import _echo_json
+
+        _echo_json({"at": datetime(2024, 1, 1, tzinfo=UTC), "v": 2**70})
+
+        assert json.loads(capsys.readouterr().out) == {
+            "at": "2024-01-01 00:00:00+00:00",
+            "v": 2**70,
+        }
+
+
 class TestGetKnowledgeIntro:
     """获取知识库介绍测试。"""
 
@@ -1,5 +1,7 @@
 """数据库连接测试。"""
 
+import pytest
+
 
 class TestEnsureFtsInstalled:
     """FTS 扩展安装测试。"""
@@ -45,3 +47,77 @@ class TestReadConnection:
             assert len(result) == 1
         finally:
             conn.close()
+
+
+class TestLongLivedConnection:
+    """长连接测试。"""
+
+    def test_connection_reused_across_calls(self, engine):
+        """测试多次读写复用同一长连接，关闭后释放。"""
+        engine.execute_write("CREATE TABLE IF NOT EXISTS _t_conn (a INTEGER)")
+        conn = engine._conn
+        assert conn is not None
+
+        engine.execute_write("INSERT INTO _t_conn VALUES (1)")
+        assert engine.execute_read("SELECT a FROM _t_conn") == [(1,)]
+        assert engine._conn is conn
+
+        engine._close_connection()
+        assert engine._conn is None
+
+    def test_read_cursors_pooled(self, engine):
+        """测试读游标归还后复用，出错的游标被丢弃，关闭时清空池。"""
+        import duckdb
+
+        engine.execute_read("SELECT 1")
+        assert len(engine._read_cursors) == 1
+        cursor = engine._read_cursors[0]
+
+        engine.execute_read("SELECT 2")
+        assert engine._read_cursors == [cursor]
+
+        with pytest.raises(duckdb.Error):
+            engine.execute_read("SELECT * FROM _no_such_table")
+        assert engine._read_cursors == []
+
+        engine.execute_read("SELECT 3")
+        engine._close_connection()
+        assert engine._read_cursors == []
+
+    def test_execute_read_rejects_writes(self, engine):
+        """测试读操作在只读事务中执行，拒绝写语句与多语句。"""
+        import duckdb
+
+        engine.execute_write("CREATE TABLE IF NOT EXISTS _t_ro (a INTEGER)")
+
+        with pytest.raises(duckdb.Error):
+            engine.execute_read("INSERT INTO _t_ro VALUES (1)")
+        with pytest.raises(duckdb.Error):
+            engine.execute_read("SELECT 1; COMMIT; INSERT INTO _t_ro VALUES (1)")
+
+        assert engine.execute_read("SELECT COUNT(*) FROM _t_ro") == [(0,)]
+
+    def test_execute_read_record(self, engine):
+        """测试首行按结果列名返回字典，无结果时返回 None。"""
+        engine.execute_write("CREATE TABLE IF NOT EXISTS _t_rec (a INTEGER, b VARCHAR)")
+        engine.execute_write("INSERT INTO _t_rec VALUES (1, 'x')")
+
+        assert engine.execute_read_record("SELECT * FROM _t_rec WHERE a = ?", [1]) == {
+            "a": 1,
+            "b": "x",
+        }
+        assert engine.execute_read_record("SELECT * FROM _t_rec WHERE a = ?", [2]) is None
+
+    def test_write_cursor_reused(self, engine):
+        """测试写操作复用同一写游标，事务失败回滚后游标仍可继续使用。"""
+        engine.execute_write("CREATE TABLE IF NOT EXISTS _t_w (a INTEGER)")
+        cursor = engine._write_cursor
+        assert cursor is not None
+
+        with pytest.raises(ValueError), engine.write_transaction() as conn:
+            conn.execute("INSERT INTO _t_w VALUES (1)")
+            raise ValueError("boom")
+
+        engine.execute_write("INSERT INTO _t_w VALUES (2)")
+        assert engine._write_cursor is cursor
+        assert engine.execute_read("SELECT a FROM _t_w") == [(2,)]
@@ -101,6 +101,118 @@ class TestEmbeddingCache:
 
             assert row[0] >= 0
 
+    @pytest.mark.asyncio
+    async def test_cache_embeddings_batch_roundtrip(self, async_engine):
+        """测试批量写入的向量可按哈希原样读回（含重复哈希）。"""
+        hashes = ["h1", "h2", "h1"]
+        embeddings = [[0.5, -1.0, 2.0], [0.25, 0.0, 1.0], [0.5, -1.0, 2.0]]
+
+        async_engine._cache_embeddings_batch(hashes, embeddings)
+        cached = async_engine._get_cached_embeddings_batch(["h1", "h2", "h3"])
+
+        assert cached == {"h1": [0.5, -1.0, 2.0], "h2": [0.25, 0.0, 1.0]}
+
+    @pytest.mark.asyncio
+    async def test_cache_lookup_refreshes_last_used(self, async_engine):
+        """测试批量查询命中时仅刷新命中条目的 last_used。"""
+        async_engine._cache_embeddings_batch(["h1", "h2"], [[1.0], [2.0]])
+        async_engine.execute_write(
+            "UPDATE _sys_search_cache SET last_used = TIMESTAMPTZ '2000-01-01 00:00:00+00'"
+        )
+
+        async_engine._get_cached_embeddings_batch(["h1", "h3"])
+
+        rows = async_engine.execute_read(
+            "SELECT content_hash, year(last_used) FROM _sys_search_cache ORDER BY content_hash"
+        )
+        assert rows[0][0] == "h1" and rows[0][1] > 2000
+        assert rows[1] == ("h2", 2000)
+
+    @pytest.mark.asyncio
+    async def test_embed_splits_into_batches(self, async_engine):
+        """测试缓存未命中的文本按 batch_size 分批请求并保持顺序。"""
+        from unittest.mock import patch
+
+        batches: list[list[str]] = []
+
+        async def fake_api(texts: list[str]) -> list[list[float]]:
+            batches.append(list(texts))
+            return [[float(len(t)), 0.0] for t in texts]
+
+        async_engine.kb_config.embedding.batch_size = 2
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        with patch.object(async_engine, "_call_embedding_api", side_effect=fake_api):
+            results = await async_engine.embed(texts)
+            again = await async_engine.embed(texts)
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert results == [[float(len(t)), 0.0] for t in texts]
+        assert again == results
+
+    @pytest.mark.asyncio
+    async def test_embed_uses_precomputed_hashes(self, async_engine):
+        """测试传入预先算好的哈希时直接按其查缓存，不再重复计算。"""
+        from unittest.mock import AsyncMock, patch
+
+        async_engine._cache_embeddings_batch(["pre"], [[9.0, 1.0]])
+
+        with (
+            patch("duckkb.core.mixins.embedding.content_hash") as hasher,
+            patch.object(async_engine, "_call_embedding_api", AsyncMock()) as api,
+        ):
+            results = await async_engine.embed(["任意文本"], ["pre"])
+
+        assert results == [[9.0, 1.0]]
+        hasher.assert_not_called()
+        api.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embed_deduplicates_identical_texts(self, async_engine):
+        """测试重复文本只请求一次嵌入，结果按原顺序回填。"""
+        from unittest.mock import patch
+
+        requested: list[str] = []
+
+        async def fake_api(texts: list[str]) -> list[list[float]]:
+            requested.extend(texts)
+            return [[float(len(t))] for t in texts]
+
+        texts = ["重复", "唯一文本", "重复", "重复"]
+
+        with patch.object(async_engine, "_call_embedding_api", side_effect=fake_api):
+            results = await async_engine.embed(texts)
+
+        assert requested == ["重复", "唯一文本"]
+        assert results == [[2.0], [4.0], [2.0], [2.0]]
+
+    @pytest.mark.asyncio
+    async def test_embed_batches_bounded_concurrency(self, async_engine):
+        """测试并发在途的批次数不超过 max_concurrency。"""
+        import asyncio
+        from unittest.mock import patch
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_api(texts: list[str]) -> list[list[float]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[float(len(t))] for t in texts]
+
+        async_engine.kb_config.embedding.batch_size = 1
+        async_engine.kb_config.embedding.max_concurrency = 2
+        texts = [f"并发文本{i}" for i in range(6)]
+
+        with patch.object(async_engine, "_call_embedding_api", side_effect=fake_api):
+            results = await async_engine.embed(texts)
+
+        assert peak == 2
+        assert results == [[float(len(t))] for t in texts]
+
 
 class TestEmbeddingEdgeCases:
     """向量边界情况测试。"""
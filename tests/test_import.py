@@ -51,6 +51,307 @@ class TestImportNodes:
         assert row is not None
         assert row[0] == "更新后的简介"
 
+    @pytest.mark.asyncio
+    async def test_import_unchanged_node_skips_index(self, async_engine, tmp_path, monkeypatch):
+        """测试重复导入未变化的节点时跳过索引与 FTS 重建，仅重建变化字段。"""
+        yaml_content = """
+- type: Character
+  name: 李华
+  bio: 不变的简介
+"""
+        fts_rebuilds: list[int] = []
+        original_rebuild = async_engine.rebuild_fts_index
+
+        def counting_rebuild() -> None:
+            fts_rebuilds.append(1)
+            original_rebuild()
+
+        monkeypatch.setattr(async_engine, "rebuild_fts_index", counting_rebuild)
+
+        for name in ("bundle1.yaml", "bundle2.yaml"):
+            yaml_file = tmp_path / name
+            yaml_file.write_text(yaml_content, encoding="utf-8")
+            result = await async_engine.import_knowledge_bundle(str(yaml_file))
+
+        assert result["indexed"]["Character"] == 0
+        assert len(fts_rebuilds) == 1
+
+        yaml_file = tmp_path / "bundle3.yaml"
+        yaml_file.write_text(yaml_content.replace("不变的简介", "新的简介"), encoding="utf-8")
+        result = await async_engine.import_knowledge_bundle(str(yaml_file))
+
+        assert result["indexed"]["Character"] == 1
+        rows = async_engine.execute_read(
+            "SELECT source_field, content FROM _sys_search_index "
+            "WHERE source_table = 'characters' ORDER BY source_field"
+        )
+        assert rows == [("bio", "新的简介"), ("name", "李华")]
+
+    @pytest.mark.asyncio
+    async def test_import_shared_chunk_segmented_once(self, async_engine, tmp_path, monkeypatch):
+        """测试同批导入中内容相同的分片只分词一次，且结果写入缓存。"""
+        yaml_content = """
+- type: Character
+  name: 丙
+  bio: 相同的简介
+- type: Character
+  name: 丁
+  bio: 相同的简介
+"""
+        segmented: list[str] = []
+        original_segment = async_engine._segment_sync
+        original_batch = async_engine._segment_batch_sync
+
+        def counting_batch(texts: list[str]) -> list[str]:
+            segmented.extend(texts)
+            return original_batch(texts)
+
+        monkeypatch.setattr(async_engine, "_segment_batch_sync", counting_batch)
+
+        yaml_file = tmp_path / "bundle.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+        await async_engine.import_knowledge_bundle(str(yaml_file))
+
+        assert segmented.count("相同的简介") == 1
+        rows = async_engine.execute_read(
+            "SELECT fts_content FROM _sys_search_index "
+            "WHERE source_table = 'characters' AND source_field = 'bio'"
+        )
+        assert len(rows) == 2
+        assert rows[0][0] == rows[1][0] == original_segment("相同的简介")
+        cached = async_engine.execute_read(
+            "SELECT fts_content FROM _sys_search_cache WHERE content_hash = ?",
+            [hashlib.md5("相同的简介".encode()).hexdigest()],
+        )
+        assert cached == [(original_segment("相同的简介"),)]
+
+    @pytest.mark.asyncio
+    async def test_import_fills_vectors_from_cache(self, async_engine, tmp_path):
+        """测试导入后向量经缓存一次性回填到索引，重复内容只请求一次。"""
+        from unittest.mock import patch
+
+        requested: list[str] = []
+        dim = async_engine.embedding_dim
+
+        async def fake_api(texts: list[str]) -> list[list[float]]:
+            requested.extend(texts)
+            return [[1.0] + [0.0] * (dim - 1) for _ in texts]
+
+        yaml_content = """
+- type: Character
+  name: 戊
+  bio: 共享的简介
+- type: Character
+  name: 己
+  bio: 共享的简介
+"""
+        yaml_file = tmp_path / "bundle.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+        with patch.object(async_engine, "_call_embedding_api", side_effect=fake_api):
+            result = await async_engine.import_knowledge_bundle(str(yaml_file))
+
+        assert result["vectors"]["Character"] == {"success": 2, "failed": 0}
+        assert requested == ["共享的简介"]
+        rows = async_engine.execute_read(
+            "SELECT COUNT(*) FROM _sys_search_index "
+            "WHERE source_table = 'characters' AND source_field = 'bio' AND vector IS NOT NULL"
+        )
+        assert rows[0][0] == 2
+
+    @pytest.mark.asyncio
+    async def test_import_vectors_survive_cache_write_failure(self, async_engine, tmp_path):
+        """测试向量缓存写入失败时，embed 返回的向量仍写入索引。"""
+        from unittest.mock import patch
+
+        dim = async_engine.embedding_dim
+
+        async def fake_api(texts: list[str]) -> list[list[float]]:
+            return [[1.0] + [0.0] * (dim - 1) for _ in texts]
+
+        yaml_file = tmp_path / "bundle.yaml"
+        yaml_file.write_text("- type: Character\n  name: 辛\n  bio: 缓存失败\n", encoding="utf-8")
+        with (
+            patch.object(async_engine, "_call_embedding_api", side_effect=fake_api),
+            patch.object(async_engine, "_cache_embeddings_batch", lambda hashes, vectors: None),
+        ):
+            result = await async_engine.import_knowledge_bundle(str(yaml_file))
+
+        assert result["vectors"]["Character"]["failed"] == 0
+        rows = async_engine.execute_read(
+            "SELECT COUNT(*) FILTER (WHERE vector IS NULL), COUNT(*) FROM _sys_search_index "
+            "WHERE source_table = 'characters' AND source_field = 'bio'"
+        )
+        assert rows[0][0] == 0
+        assert rows[0][1] > 0
+
+    @pytest.mark.asyncio
+    async def test_import_embeds_with_configured_concurrency(self, async_engine, tmp_path):
+        """测试导入按 batch_size × max_concurrency 分轮向量化，请求并发达到上限。"""
+        import asyncio
+        from unittest.mock import patch
+
+        dim = async_engine.embedding_dim
+        in_flight = 0
+        peak = 0
+        sizes: list[int] = []
+        rounds: list[int] = []
+        original_embed = async_engine.embed
+
+        async def recording_embed(texts, hashes=None):
+            rounds.append(len(texts))
+            return await original_embed(texts, hashes)
+
+        async def fake_api(texts: list[str]) -> list[list[float]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            sizes.append(len(texts))
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[1.0] + [0.0] * (dim - 1) for _ in texts]
+
+        async_engine.kb_config.embedding.batch_size = 2
+        async_engine.kb_config.embedding.max_concurrency = 2
+        yaml_content = "".join(
+            f"- type: Character\n  name: 并发{i}\n  bio: 并发简介{i}\n" for i in range(5)
+        )
+        yaml_file = tmp_path / "bundle.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+        with (
+            patch.object(async_engine, "_call_embedding_api", side_effect=fake_api),
+            patch.object(async_engine, "embed", side_effect=recording_embed),
+        ):
+            result = await async_engine.import_knowledge_bundle(str(yaml_file))
+
+        assert result["vectors"]["Character"] == {"success": 5, "failed": 0}
+        assert rounds == [4, 1]
+        assert peak == 2
+        assert max(sizes) == 2
+
+    @pytest.mark.asyncio
+    async def test_import_rewrites_only_changed_chunks(self, async_engine, tmp_path, monkeypatch):
+        """测试字段变化时只改写变化的分片，未变分片保留，多余分片被截断。"""
+        monkeypatch.setattr(async_engine, "_chunk_text_sync", lambda text: text.split("|"))
+
+        def index_rows() -> list[tuple]:
+            return async_engine.execute_read(
+                "SELECT chunk_seq, content, created_at FROM _sys_search_index "
+                "WHERE source_table = 'characters' AND source_field = 'bio' ORDER BY chunk_seq"
+            )
+
+        yaml_file = tmp_path / "bundle1.yaml"
+        yaml_file.write_text("- type: Character\n  name: 庚\n  bio: 甲|乙|丙\n", encoding="utf-8")
+        await async_engine.import_knowledge_bundle(str(yaml_file))
+        before = index_rows()
+
+        yaml_file = tmp_path / "bundle2.yaml"
+        yaml_file.write_text("- type: Character\n  name: 庚\n  bio: 甲|丁\n", encoding="utf-8")
+        result = await async_engine.import_knowledge_bundle(str(yaml_file))
+
+        assert result["indexed"]["Character"] == 1
+        after = index_rows()
+        assert [(seq, content) for seq, content, _ in after] == [(0, "甲"), (1, "丁")]
+        assert after[0] == before[0]
+
+    @pytest.mark.asyncio
+    async def test_import_node_delete(self, async_engine, tmp_path):
+        """测试按业务键删除节点，同时清理关联的边和索引。"""
+        yaml_content1 = """
+- type: Character
+  name: 甲
+  bio: 甲的简介
+- type: Character
+  name: 乙
+  bio: 乙的简介
+- type: knows
+  source: {name: 甲}
+  target: {name: 乙}
+"""
+        yaml_file1 = tmp_path / "bundle1.yaml"
+        yaml_file1.write_text(yaml_content1, encoding="utf-8")
+        await async_engine.import_knowledge_bundle(str(yaml_file1))
+
+        yaml_content2 = """
+- type: Character
+  action: delete
+  name: 甲
+- type: Character
+  action: delete
+  name: 不存在
+"""
+        yaml_file2 = tmp_path / "bundle2.yaml"
+        yaml_file2.write_text(yaml_content2, encoding="utf-8")
+        result = await async_engine.import_knowledge_bundle(str(yaml_file2))
+
+        assert result["nodes"]["deleted"]["Character"] == 1
+        names = async_engine.execute_read("SELECT name FROM characters")
+        assert names == [("乙",)]
+        assert async_engine.execute_read("SELECT COUNT(*) FROM edge_knows")[0][0] == 0
+        rows = async_engine.execute_read(
+            "SELECT DISTINCT content FROM _sys_search_index "
+            "WHERE source_table = 'characters' AND source_field = 'name'"
+        )
+        assert rows == [("乙",)]
+
+
+class TestImportPersistence:
+    """导入持久化测试。"""
+
+    @pytest.mark.asyncio
+    async def test_import_carries_over_untouched_tables(self, async_engine, tmp_path):
+        """测试未涉及的表以硬链接搬入新 data 目录，涉及的表重新导出。"""
+        yaml_content1 = """
+- type: Character
+  name: 甲
+  bio: 甲的简介
+- type: Document
+  doc_id: D1
+  title: 文档
+  content: 文档内容
+"""
+        yaml_file1 = tmp_path / "bundle1.yaml"
+        yaml_file1.write_text(yaml_content1, encoding="utf-8")
+        await async_engine.import_knowledge_bundle(str(yaml_file1))
+
+        data_dir = async_engine.config.storage.data_dir
+        doc_files = list((data_dir / "nodes" / "documents").rglob("*.jsonl"))
+        assert len(doc_files) == 1
+        doc_inode = doc_files[0].stat().st_ino
+
+        yaml_file2 = tmp_path / "bundle2.yaml"
+        yaml_file2.write_text("- type: Character\n  name: 乙\n  bio: 乙的简介\n", encoding="utf-8")
+        result = await async_engine.import_knowledge_bundle(str(yaml_file2))
+
+        assert "Document" not in result["dumped"]
+        assert result["dumped"]["Character"] == 2
+        doc_files = list((data_dir / "nodes" / "documents").rglob("*.jsonl"))
+        assert [f.stat().st_ino for f in doc_files] == [doc_inode]
+        char_lines = [
+            line
+            for f in (data_dir / "nodes" / "characters").rglob("*.jsonl")
+            for line in f.read_text(encoding="utf-8").splitlines()
+        ]
+        assert len(char_lines) == 2
+
+    @pytest.mark.asyncio
+    async def test_import_reuses_unchanged_cache_file(self, async_engine, tmp_path, monkeypatch):
+        """测试缓存表未变化时沿用已导出的缓存文件，不再重写。"""
+        from unittest.mock import AsyncMock
+
+        monkeypatch.setattr(async_engine, "_compute_vectors_async", AsyncMock(return_value={}))
+        cache_file = async_engine.config.storage.data_dir / "cache" / "search_cache.parquet"
+
+        yaml_file = tmp_path / "bundle.yaml"
+        yaml_file.write_text("- type: Character\n  name: 辛\n  bio: 辛的简介\n", encoding="utf-8")
+        result = await async_engine.import_knowledge_bundle(str(yaml_file))
+        assert result["dumped"]["_sys_search_cache"] > 0
+        cache_inode = cache_file.stat().st_ino
+
+        yaml_file.write_text("- type: Character\n  name: 辛\n  bio: 辛的简介\n", encoding="utf-8")
+        result = await async_engine.import_knowledge_bundle(str(yaml_file))
+        assert "_sys_search_cache" not in result["dumped"]
+        assert cache_file.stat().st_ino == cache_inode
+
 
 class TestImportValidation:
     """导入校验测试。"""
@@ -73,6 +374,22 @@ class TestImportValidation:
         with pytest.raises(ValueError, match="must contain an array"):
             await async_engine.import_knowledge_bundle(str(yaml_file))
 
+    @pytest.mark.asyncio
+    async def test_import_reuses_bundle_validator(self, async_engine, tmp_path):
+        """测试多次导入复用同一个 Schema 校验器，且校验错误仍带出路径。"""
+        yaml_file = tmp_path / "bad_item.yaml"
+        yaml_file.write_text("- type: Character\n  name: 123\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Validation error at"):
+            await async_engine.import_knowledge_bundle(str(yaml_file))
+        validator = async_engine._bundle_validator
+        assert validator is not None
+
+        yaml_file.write_text("- type: Character\n  name: 123\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Validation error at"):
+            await async_engine.import_knowledge_bundle(str(yaml_file))
+        assert async_engine._bundle_validator is validator
+
     @pytest.mark.asyncio
     async def test_import_missing_type(self, async_engine, tmp_path):
         """测试缺失类型字段。"""
@@ -87,6 +87,72 @@ class TestBuildIndex:
         count = await async_engine.rebuild_index("Character")
         assert count >= 0
 
+    @pytest.mark.asyncio
+    async def test_rebuild_index_swaps_atomically(self, async_engine, monkeypatch):
+        """测试重建期间旧索引保持可见，完成后分批整体替换并清除过期条目。"""
+        from datetime import UTC, datetime
+        from unittest.mock import patch
+
+        from duckkb.core.mixins import index
+
+        monkeypatch.setattr(index, "INDEX_INSERT_BATCH_SIZE", 1)
+
+        async_engine.execute_write(
+            "INSERT INTO characters (__id, __created_at, __updated_at, name, bio) "
+            "VALUES (1, now(), now(), '重建角色', '重建简介')"
+        )
+        async_engine._insert_index_entries(
+            [("characters", 999, "name", 0, "过期", "过期", None, "stale", datetime.now(UTC))]
+        )
+
+        def _count() -> int:
+            return async_engine.execute_read(
+                "SELECT COUNT(*) FROM _sys_search_index WHERE source_table = 'characters'"
+            )[0][0]
+
+        seen_during_build: list[int] = []
+
+        async def fake_embed(texts: list[str], **kwargs) -> None:
+            seen_during_build.append(_count())
+
+        with patch.object(async_engine, "_embed_with_retry", side_effect=fake_embed):
+            count = await async_engine.rebuild_index("Character")
+
+        assert seen_during_build == [1]
+        assert count == 2
+        rows = async_engine.execute_read(
+            "SELECT source_id, content FROM _sys_search_index "
+            "WHERE source_table = 'characters' ORDER BY content"
+        )
+        assert rows == [(1, "重建简介"), (1, "重建角色")]
+
+    @pytest.mark.asyncio
+    async def test_build_index_refreshes_fts(self, async_engine):
+        """测试构建完成后 FTS 索引已包含新写入的内容。"""
+        from unittest.mock import AsyncMock, patch
+
+        async_engine.execute_write(
+            "INSERT INTO characters (__id, __created_at, __updated_at, name, bio) "
+            "VALUES (1, now(), now(), '全文角色', '擅长量子计算研究')"
+        )
+
+        with patch.object(async_engine, "_embed_with_retry", AsyncMock(return_value=None)):
+            await async_engine.build_index("Character")
+
+        results = await async_engine.fts_search("量子")
+        assert results
+
+    @pytest.mark.asyncio
+    async def test_rebuild_index_empty_table_skips_fts(self, async_engine, monkeypatch):
+        """测试重建前后都没有索引条目时不重建 FTS 索引。"""
+        fts_rebuilds: list[int] = []
+        monkeypatch.setattr(async_engine, "_try_create_fts_index", lambda: fts_rebuilds.append(1))
+
+        count = await async_engine.rebuild_index("Character")
+
+        assert count == 0
+        assert fts_rebuilds == []
+
     @pytest.mark.asyncio
     async def test_rebuild_index_unknown_type(self, async_engine):
         """测试重建未知类型的索引。"""
@@ -130,10 +196,110 @@ class TestIndexHelpers:
         assert isinstance(chunks, list)
         assert len(chunks) >= 1
 
+    def test_get_search_fields(self, engine):
+        """测试搜索字段解析：合并字段去重且顺序固定。"""
+        from types import SimpleNamespace
+
+        from duckkb.core.mixins.index import get_search_fields
+
+        node_def = SimpleNamespace(
+            search=SimpleNamespace(full_text=["name", "bio"], vectors=["bio"])
+        )
+        assert get_search_fields(node_def) == (["name", "bio"], ["bio"], ["name", "bio"])
+        assert get_search_fields(SimpleNamespace(search=None)) == ([], [], [])
+
+    def test_insert_index_entries_upsert(self, engine):
+        """测试批量写入索引条目（含空向量）并按复合键覆盖。"""
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        engine._insert_index_entries(
+            [
+                ("t_insert", 1, "bio", 0, "甲", "甲", [0.5, 1.0], "h1", now),
+                ("t_insert", 1, "bio", 1, "乙", None, None, "h2", now),
+            ]
+        )
+        engine._insert_index_entries(
+            [("t_insert", 1, "bio", 1, "丙", "丙", [2.0, 3.0], "h3", now)],
+        )
+
+        rows = engine.execute_read(
+            "SELECT chunk_seq, content, fts_content, vector, content_hash "
+            "FROM _sys_search_index WHERE source_table = 't_insert' ORDER BY chunk_seq"
+        )
+        assert rows == [
+            (0, "甲", "甲", [0.5, 1.0], "h1"),
+            (1, "丙", "丙", [2.0, 3.0], "h3"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_fts_batch(self, async_engine, monkeypatch):
+        """测试批量分词：缓存命中直接返回，未命中去重后一次分词并写回缓存。"""
+        texts = ["已缓存文本", "新的文本", "新的文本"]
+        hashes = [async_engine._compute_hash(t) for t in texts]
+        async_engine.execute_write(
+            "INSERT INTO _sys_search_cache VALUES (?, '已缓存 文本', NULL, now(), now())",
+            [hashes[0]],
+        )
+
+        calls: list[list[str]] = []
+        original = async_engine.segment_batch
+
+        async def spy(batch):
+            calls.append(batch)
+            return await original(batch)
+
+        monkeypatch.setattr(async_engine, "segment_batch", spy)
+
+        results = await async_engine._get_or_compute_fts_batch(texts, hashes)
+
+        expected = async_engine._segment_sync("新的文本")
+        assert results == ["已缓存 文本", expected, expected]
+        assert calls == [["新的文本"]]
+        rows = async_engine.execute_read(
+            "SELECT fts_content FROM _sys_search_cache WHERE content_hash = ?", [hashes[1]]
+        )
+        assert rows == [(expected,)]
+
 
 class TestCacheOperations:
     """缓存操作测试。"""
 
+    @pytest.mark.asyncio
+    async def test_rebuild_index_from_cache(self, async_engine, monkeypatch):
+        """测试从缓存分批重建索引时按字段归属回填分词与向量，空字段只跳过该字段。"""
+        from datetime import UTC, datetime
+
+        from duckkb.core.mixins import index
+
+        monkeypatch.setattr(index, "INDEX_INSERT_BATCH_SIZE", 1)
+
+        now = datetime.now(UTC)
+        async_engine.execute_write(
+            "INSERT INTO characters (__id, __created_at, __updated_at, name, bio) "
+            "VALUES (1, now(), now(), '缓存角色', '缓存简介'), (2, now(), now(), '无简介', NULL)"
+        )
+        for text, fts, vector in [
+            ("缓存角色", "缓存 角色", None),
+            ("缓存简介", "缓存 简介", [1.0]),
+        ]:
+            async_engine.execute_write(
+                "INSERT INTO _sys_search_cache VALUES (?, ?, ?, ?, ?)",
+                [async_engine._compute_hash(text), fts, vector, now, now],
+            )
+
+        await async_engine._rebuild_index_from_cache()
+
+        rows = async_engine.execute_read(
+            "SELECT source_id, source_field, fts_content, vector FROM _sys_search_index "
+            "WHERE source_table = 'characters' ORDER BY source_id, source_field"
+        )
+        assert rows == [
+            (1, "bio", "缓存 简介", [1.0]),
+            (1, "name", "缓存 角色", None),
+            (2, "name", None, None),
+        ]
+
     @pytest.mark.asyncio
     async def test_save_and_load_cache(self, async_engine, tmp_path):
         """测试保存和加载缓存。"""
@@ -219,6 +385,58 @@ class TestIndexWithContent:
             assert isinstance(rows[0][3], int)
             assert isinstance(rows[0][4], str)
 
+    @pytest.mark.asyncio
+    async def test_build_index_pipelines_batches(self, async_engine):
+        """测试多批次流水线写入全部条目，写入失败时抛出原始异常。"""
+        from unittest.mock import AsyncMock, patch
+
+        async_engine.execute_write(
+            "INSERT INTO characters (__id, __created_at, __updated_at, name, bio) "
+            "SELECT i, now(), now(), '角色' || i, '简介' || i FROM range(1, 6) t(i)"
+        )
+
+        with patch.object(async_engine, "_embed_with_retry", AsyncMock(return_value=None)):
+            count = await async_engine.build_index("Character", batch_size=2)
+
+            assert count == 10
+            rows = async_engine.execute_read(
+                "SELECT COUNT(*) FROM _sys_search_index WHERE source_table = 'characters'"
+            )
+            assert rows[0][0] == 10
+
+            with (
+                patch.object(
+                    async_engine, "_insert_index_entries", side_effect=RuntimeError("boom")
+                ),
+                pytest.raises(RuntimeError, match="boom"),
+            ):
+                await async_engine.build_index("Character", batch_size=1)
+
+    @pytest.mark.asyncio
+    async def test_build_index_node_types_bounded_concurrency(self, async_engine, monkeypatch):
+        """测试全部节点类型以有限并发构建并汇总条目数。"""
+        import asyncio
+
+        from duckkb.core.mixins import index
+
+        monkeypatch.setattr(index, "INDEX_NODE_CONCURRENCY", 2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_build(node_type, batch_size, replace=False):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 1
+
+        monkeypatch.setattr(async_engine, "_build_node_index", fake_build)
+        count = await async_engine.build_index()
+
+        assert count == len(async_engine.ontology.nodes)
+        assert max_in_flight == min(2, len(async_engine.ontology.nodes))
+
 
 class TestIndexEdgeCases:
     """索引边界条件测试。"""
@@ -0,0 +1,62 @@
+"""LRUCache 单元测试。"""
+
+import pytest
+
+from duckkb.utils.lru import LRUCache
+
+
+class TestLRUCache:
+    """LRU 缓存测试。"""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """测试超出容量时淘汰最久未使用的条目。"""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_stats_and_clear(self) -> None:
+        """测试命中率统计，清空后保留计数。"""
+        cache = LRUCache(4)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        assert cache.stats() == {
+            "size": 1,
+            "maxsize": 4,
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+        }
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()["hits"] == 1
+
+    def test_ttl_expiry(self, monkeypatch) -> None:
+        """测试超过 TTL 的条目视为未命中并被移除。"""
+        from duckkb.utils import lru
+
+        now = [100.0]
+        monkeypatch.setattr(lru.time, "monotonic", lambda: now[0])
+        cache = LRUCache(4, ttl=10)
+        cache.put("a", 1)
+
+        now[0] = 109.0
+        assert cache.get("a") == 1
+        now[0] = 111.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self) -> None:
+        """测试非法容量。"""
+        with pytest.raises(ValueError, match="maxsize"):
+            LRUCache(0)
@@ -1,5 +1,7 @@
 """MCP 测试。"""
 
+import json
+
 import pytest
 
 
@@ -23,6 +25,38 @@ class TestMCPInit:
         mcp.close()
 
 
+class TestMCPDumps:
+    """MCP 结果序列化测试。"""
+
+    def test_dumps_indent_and_unicode(self):
+        """测试默认缩进输出且保留非 ASCII 字符。"""
+        from duckkb.mcp.duck_mcp import _dumps
+
+        result = _dumps({"name": "张三", "count": 1})
+        assert result == '{\n  "name": "张三",\n  "count": 1\n}'
+
+    def test_dumps_compact_with_fallback(self):
+        """测试紧凑输出与非原生类型回退为字符串。"""
+        from decimal import Decimal
+
+        from duckkb.mcp.duck_mcp import _dumps
+
+        result = _dumps([{"value": Decimal("1.5"), 1: "a"}], indent=False)
+        assert result == '[{"value":"1.5","1":"a"}]'
+
+    def test_dumps_datetime_and_huge_int(self):
+        """测试日期时间保持 str() 格式，超出 64 位的整数回退到标准库 json。"""
+        from datetime import UTC, datetime
+
+        from duckkb.mcp.duck_mcp import _dumps
+
+        assert (
+            _dumps({"at": datetime(2024, 1, 1, tzinfo=UTC)}, indent=False)
+            == '{"at":"2024-01-01 00:00:00+00:00"}'
+        )
+        assert json.loads(_dumps([{"v": 2**70}])) == [{"v": 2**70}]
+
+
 class TestMCPTools:
     """MCP 工具测试。"""
 
@@ -309,6 +309,18 @@ class TestOntologyMixin:
         assert "example_yaml" in result
         assert result["full_bundle_schema"]["type"] == "array"
 
+    def test_get_bundle_schema_cached(self, engine):
+        """测试知识包 Schema 及其 JSON 序列化结果被缓存复用。"""
+        first = engine.get_bundle_schema()
+        assert engine.get_bundle_schema() is first
+
+        info = engine.get_info()
+        schema_json = engine._bundle_schema_json
+        assert schema_json is not None
+        assert schema_json in info
+        engine.get_info()
+        assert engine._bundle_schema_json is schema_json
+
     def test_json_type_to_duckdb_string(self, engine):
         """测试 JSON 类型到 DuckDB 类型映射。"""
         assert engine._json_type_to_duckdb({"type": "string"}) == "VARCHAR"
@@ -84,6 +84,176 @@ class TestSearch:
             assert isinstance(results1, list)
             assert isinstance(results2, list)
 
+    @pytest.mark.asyncio
+    async def test_query_vector_cached(self, async_engine):
+        """测试相同查询只计算一次查询向量（float32 数组），切换模型后重新计算。"""
+        from unittest.mock import patch
+
+        import numpy as np
+
+        with patch("duckkb.core.mixins.embedding.EmbeddingMixin.embed_single") as mock:
+            mock.return_value = [0.1] * 1536
+            first = await async_engine._get_query_vector("缓存查询")
+            second = await async_engine._get_query_vector("缓存查询")
+            assert second is first
+            assert first.dtype == np.float32
+            assert mock.call_count == 1
+
+            async_engine.kb_config.embedding.model = "text-embedding-3-large"
+            with patch.object(type(async_engine), "embedding_dim", 1536):
+                await async_engine._get_query_vector("缓存查询")
+            assert mock.call_count == 2
+
+        stats = async_engine.query_vector_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_search_results_cached_until_index_changes(self, async_engine):
+        """测试相同参数的检索命中结果缓存，索引写入后缓存失效。"""
+        from datetime import UTC, datetime
+        from unittest.mock import AsyncMock, patch
+
+        hybrid = AsyncMock(return_value=[{"source_id": 1, "score": 1.0}])
+        with (
+            patch("duckkb.core.mixins.embedding.EmbeddingMixin.embed_single") as mock,
+            patch.object(async_engine, "_execute_hybrid_search", hybrid),
+        ):
+            mock.return_value = [0.1] * 1536
+            first = await async_engine.search("缓存结果", limit=5)
+            first[0]["score"] = 0.0
+            second = await async_engine.search("缓存结果", limit=5)
+            await async_engine.search("缓存结果", limit=6)
+            assert hybrid.call_count == 2
+            assert second == [{"source_id": 1, "score": 1.0}]
+
+            async_engine._insert_index_entries(
+                [("characters", 1, "name", 0, "新", "新", None, "h", datetime.now(UTC))]
+            )
+            await async_engine.search("缓存结果", limit=5)
+            assert hybrid.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_query(self, async_engine):
+        """测试并发的相同检索只执行一次，各调用方拿到独立副本。"""
+        import asyncio
+        from unittest.mock import patch
+
+        calls = 0
+
+        async def slow_hybrid(**kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return [{"source_id": 1, "score": 1.0}]
+
+        with (
+            patch("duckkb.core.mixins.embedding.EmbeddingMixin.embed_single") as mock,
+            patch.object(async_engine, "_execute_hybrid_search", side_effect=slow_hybrid),
+        ):
+            mock.return_value = [0.1] * 1536
+            results = await asyncio.gather(*(async_engine.search("并发") for _ in range(3)))
+
+        assert calls == 1
+        assert results[0] == results[1] == results[2] == [{"source_id": 1, "score": 1.0}]
+        assert results[0][0] is not results[1][0]
+        assert async_engine._search_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_search_during_index_write_not_cached(self, async_engine):
+        """测试检索进行中发生索引写入时，读到旧索引的结果不写入缓存。"""
+        import asyncio
+        from datetime import UTC, datetime
+        from unittest.mock import patch
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_hybrid(**kwargs):
+            nonlocal calls
+            calls += 1
+            started.set()
+            await release.wait()
+            return [{"source_id": 1, "score": 1.0}]
+
+        with (
+            patch("duckkb.core.mixins.embedding.EmbeddingMixin.embed_single") as mock,
+            patch.object(async_engine, "_execute_hybrid_search", side_effect=slow_hybrid),
+        ):
+            mock.return_value = [0.1] * 1536
+            task = asyncio.create_task(async_engine.search("写入竞争"))
+            await started.wait()
+            await asyncio.to_thread(
+                async_engine._insert_index_entries,
+                [("characters", 1, "name", 0, "新", "新", None, "h", datetime.now(UTC))],
+            )
+            release.set()
+            assert await task == [{"source_id": 1, "score": 1.0}]
+
+            await async_engine.search("写入竞争")
+            assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_search_after_cache_clear_not_merged(self, async_engine):
+        """测试工作线程清空缓存后，新请求不再合并到旧检索上，任务结束后记录被移除。"""
+        import asyncio
+        from unittest.mock import patch
+
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_hybrid(**kwargs):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [{"source_id": calls, "score": 1.0}]
+
+        with (
+            patch("duckkb.core.mixins.embedding.EmbeddingMixin.embed_single") as mock,
+            patch.object(async_engine, "_execute_hybrid_search", side_effect=slow_hybrid),
+        ):
+            mock.return_value = [0.1] * 1536
+            old = asyncio.create_task(async_engine.search("纪元"))
+            await asyncio.sleep(0.01)
+            await asyncio.to_thread(async_engine.clear_search_cache)
+            new = asyncio.create_task(async_engine.search("纪元"))
+            await asyncio.sleep(0.01)
+            release.set()
+            await asyncio.gather(old, new)
+
+        assert calls == 2
+        assert async_engine._search_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_fuses_both_recalls(self, async_engine):
+        """测试两路召回并发执行后按 RRF 融合，两路都排第一的条目得分为 1。"""
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        async_engine._insert_index_entries(
+            [
+                ("characters", 1, "bio", 0, "量子计算", "量子 计算", [1.0, 0.0, 0.0], "a", now),
+                ("characters", 2, "bio", 0, "量子通信", "量子 通信", [0.0, 1.0, 0.0], "b", now),
+                ("documents", 3, "content", 0, "经典力学", "经典 力学", [0.0, 0.0, 1.0], "c", now),
+            ]
+        )
+        async_engine._create_fts_index()
+
+        results = await async_engine._execute_hybrid_search(
+            query="量子", query_vector=[1.0, 0.0, 0.0], node_type=None, limit=3, alpha=0.5
+        )
+
+        assert [r["source_id"] for r in results][:2] == [1, 2]
+        assert results[0]["content"] == "量子计算"
+        assert results[0]["score"] == pytest.approx(1.0)
+        assert results[0]["score"] > results[1]["score"] > results[2]["score"]
+
+        filtered = await async_engine._execute_hybrid_search(
+            query="量子", query_vector=[1.0, 0.0, 0.0], node_type="Document", limit=3, alpha=0.5
+        )
+        assert [r["source_id"] for r in filtered] == [3]
+
 
 class TestVectorSearch:
     """向量搜索测试。"""
@@ -144,6 +314,69 @@ class TestVectorSearch:
             with pytest.raises(ValueError, match="Unknown node type"):
                 await async_engine.vector_search("测试", node_type="InvalidType")
 
+    def test_vector_candidates_track_index_writes(self, engine):
+        """测试向量矩阵按需构建、按源表过滤、忽略维度不同的向量，并在索引写入后重建。"""
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        engine._insert_index_entries(
+            [
+                ("characters", 1, "bio", 0, "甲", "甲", [1.0, 0.0, 0.0], "a", now),
+                ("documents", 2, "content", 0, "乙", "乙", [0.6, 0.8, 0.0], "b", now),
+            ]
+        )
+        engine._insert_index_entries(
+            [("documents", 3, "content", 0, "丙", "丙", [1.0, 0.0], "c", now)]
+        )
+
+        ids, scores = engine._vector_candidates([1.0, 0.0, 0.0], None, 5)
+        assert ids.tolist() == [1, 2]
+        assert scores.tolist() == pytest.approx([1.0, 0.6])
+        assert engine._vector_matrix is not None
+
+        ids, _ = engine._vector_candidates([1.0, 0.0, 0.0], "documents", 5)
+        assert ids.tolist() == [2]
+
+        engine._insert_index_entries(
+            [("documents", 4, "content", 0, "丁", "丁", [0.8, 0.6, 0.0], "d", now)]
+        )
+        assert engine._vector_matrix is None
+        ids, _ = engine._vector_candidates([1.0, 0.0, 0.0], None, 2)
+        assert ids.tolist() == [1, 4]
+
+        assert engine._vector_recall([1.0, 0.0, 0.0], None, 5) == [(1, 1), (4, 2), (2, 3)]
+
+    def test_vector_matrix_normalizes_stored_vectors(self, engine):
+        """测试索引中非单位长度的向量在构建矩阵时归一化，打分等于余弦相似度。"""
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        engine._insert_index_entries(
+            [
+                ("characters", 1, "bio", 0, "甲", "甲", [0.5, 0.0, 0.0], "a", now),
+                ("characters", 2, "bio", 0, "乙", "乙", [6.0, 8.0, 0.0], "b", now),
+                ("characters", 3, "bio", 0, "丙", "丙", [0.0, 0.0, 0.0], "c", now),
+            ]
+        )
+
+        ids, scores = engine._vector_candidates([1.0, 0.0, 0.0], None, 3)
+        assert ids.tolist() == [1, 2, 3]
+        assert scores.tolist() == pytest.approx([1.0, 0.6, 0.0])
+
+    def test_clear_search_cache_waits_for_matrix_build(self, engine):
+        """测试向量矩阵重建期间的失效会等待重建结束后再清空矩阵。"""
+        import threading
+
+        engine._vector_matrix = object()
+        with engine._vector_matrix_lock:
+            worker = threading.Thread(target=engine.clear_search_cache)
+            worker.start()
+            worker.join(0.1)
+            assert worker.is_alive()
+            assert engine._vector_matrix is not None
+        worker.join()
+        assert engine._vector_matrix is None
+
 
 class TestFtsSearch:
     """全文搜索测试。"""
@@ -206,6 +439,28 @@ class TestFtsSearch:
         with pytest.raises(ValueError, match="Unknown node type"):
             await async_engine.fts_search("测试", node_type="InvalidType")
 
+    @pytest.mark.asyncio
+    async def test_fts_search_scores_and_filter(self, async_engine):
+        """测试全文检索只返回有 BM25 分数的条目，并按源表过滤。"""
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        async_engine._insert_index_entries(
+            [
+                ("characters", 1, "bio", 0, "量子计算", "量子 计算", None, "a", now),
+                ("documents", 2, "content", 0, "量子通信", "量子 通信", None, "b", now),
+                ("documents", 3, "content", 0, "经典力学", "经典 力学", None, "c", now),
+            ]
+        )
+        async_engine._create_fts_index()
+
+        results = await async_engine.fts_search("量子")
+        assert sorted(r["source_id"] for r in results) == [1, 2]
+        assert all(r["score"] > 0 for r in results)
+
+        filtered = await async_engine.fts_search("量子", node_type="Document")
+        assert [r["source_id"] for r in filtered] == [2]
+
 
 class TestGetSourceRecord:
     """获取原始记录测试。"""
@@ -281,27 +536,81 @@ class TestQueryRawSql:
         results = await async_engine.query_raw_sql("SELECT * FROM characters LIMIT 1")
         assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_query_raw_sql_rejects_forbidden_keywords(self, async_engine):
+        """测试大小写不敏感地拒绝写操作关键字，小写 limit 也视为已有 LIMIT。"""
+        with pytest.raises(ValueError, match="DELETE"):
+            await async_engine.query_raw_sql("delete from characters")
+        with pytest.raises(ValueError, match="EXECUTE"):
+            await async_engine.query_raw_sql("Execute stmt")
+        with pytest.raises(ValueError, match="DROP"):
+            await async_engine.query_raw_sql("SELECT 1; drop TABLE characters")
 
-class TestSearchHelpers:
-    """搜索辅助方法测试。"""
+        async_engine._validate_sql_type("SELECT created_at, updates, dropped_items FROM t")
+
+        results = await async_engine.query_raw_sql("select 1 as value limit 1")
+        assert results == [{"value": 1}]
+
+    @pytest.mark.asyncio
+    async def test_query_raw_sql_ignores_comments_and_strings(self, async_engine):
+        """测试注释与字符串字面量中的关键字不触发拒绝，也不算作已有 LIMIT。"""
+        rows = await async_engine.query_raw_sql(
+            "SELECT 'delete -- me' AS s /* drop */ FROM range(1500) -- LIMIT 5"
+        )
+        assert len(rows) == 1000
+        assert rows[0] == {"s": "delete -- me"}
+
+        with pytest.raises(ValueError, match="DROP"):
+            await async_engine.query_raw_sql("SELECT '--' AS s; DROP TABLE characters")
+
+    @pytest.mark.asyncio
+    async def test_query_raw_sql_columns_from_cursor(self, async_engine):
+        """测试结果列名取自游标描述，SELECT * 与表达式列均为真实列名。"""
+        async_engine.execute_write(
+            "INSERT INTO characters (__id, __created_at, __updated_at, name, bio) "
+            "VALUES (1, now(), now(), '列名角色', '简介')"
+        )
+
+        rows = await async_engine.query_raw_sql("SELECT * FROM characters")
+        assert rows[0]["name"] == "列名角色"
+        assert "__id" in rows[0]
+
+        rows = await async_engine.query_raw_sql(
+            "SELECT upper(name), count(*) c FROM characters GROUP BY 1"
+        )
+        assert list(rows[0]) == ['upper("name")', "c"]
+
+    @pytest.mark.asyncio
+    async def test_query_raw_sql_size_limit_streams(self, async_engine, monkeypatch):
+        """测试结果集按批取回，累计体积超限时中止。"""
+        from duckkb.core.mixins import search
+
+        monkeypatch.setattr(search, "_RAW_SQL_FETCH_SIZE", 10)
+        monkeypatch.setattr(search, "QUERY_RESULT_SIZE_LIMIT", 1024)
 
-    def test_format_vector_literal(self, engine):
-        """测试向量字面量格式化。"""
-        vector = [0.1, 0.2, 0.3]
-        literal = engine._format_vector_literal(vector)
-        assert literal == "[0.1, 0.2, 0.3]"
+        rows = await async_engine.query_raw_sql("SELECT range AS n FROM range(25)")
+        assert [row["n"] for row in rows] == list(range(25))
 
-    def test_format_vector_for_sql(self, engine):
-        """测试 SQL 向量格式化。"""
-        vector = [0.1, 0.2, 0.3]
-        literal = engine._format_vector_for_sql(vector)
-        assert "DOUBLE[3]" in literal
+        with pytest.raises(ValueError, match="exceeds"):
+            await async_engine.query_raw_sql("SELECT repeat('x', 100) AS s FROM range(50)")
 
-    def test_to_float32_array(self, engine):
-        """测试转换为 float32 数组。"""
-        vector = [0.1, 0.2, 0.3]
-        result = engine._to_float32_array(vector)
-        assert len(result) == 3
+    @pytest.mark.asyncio
+    async def test_query_raw_sql_row_bound_from_size_limit(self, async_engine):
+        """测试外层 LIMIT 由体积上限推出，超大结果在执行阶段即被截断并判定超限。"""
+        with pytest.raises(ValueError, match="exceeds"):
+            await async_engine.query_raw_sql("SELECT range FROM range(50000000) LIMIT 50000000")
+
+        assert await async_engine.query_raw_sql("SELECT 1 AS v;") == [{"v": 1}]
+        assert await async_engine.query_raw_sql("SELECT 1 AS v -- 注释") == [{"v": 1}]
+        assert await async_engine.query_raw_sql("SELECT 1 AS v; -- 注释") == [{"v": 1}]
+        assert await async_engine.query_raw_sql("SELECT '--x;' AS \"a--b\"") == [{"a--b": "--x;"}]
+
+        plan = await async_engine.query_raw_sql("EXPLAIN SELECT 1")
+        assert plan and "explain_value" in plan[0]
+
+
+class TestSearchHelpers:
+    """搜索辅助方法测试。"""
 
     def test_execute_query(self, engine):
         """测试执行查询。"""
@@ -314,6 +623,17 @@ class TestSearchHelpers:
         results = engine._process_results([])
         assert results == []
 
+    def test_fuse_rrf(self, engine):
+        """测试两路排名按 id 归并求和，部分排序后按分数降序截断。"""
+        k = engine.rrf_k
+        fused = engine._fuse_rrf([(10, 1), (20, 2)], [(20, 1), (30, 2)], alpha=0.5, limit=2)
+
+        assert [row_id for row_id, _ in fused] == [20, 10]
+        assert fused[0][1] == pytest.approx((0.5 / (k + 2) + 0.5 / (k + 1)) * (k + 1))
+        assert fused[1][1] == pytest.approx(0.5)
+        assert engine._fuse_rrf([], [], alpha=0.5, limit=5) == []
+        assert engine._fuse_rrf([(1, 1)], [], alpha=0.5, limit=0) == []
+
     def test_process_results_with_data(self, engine):
         """测试处理有数据的结果。"""
         rows = [("characters", 1, "bio", 0, "test content", 0.85)]
@@ -330,26 +650,6 @@ class TestSearchHelpers:
         assert "__id" in columns
         assert "name" in columns
 
-    def test_extract_columns_from_sql(self, engine):
-        """测试从 SQL 提取列名。"""
-        sql = "SELECT name, bio FROM characters"
-        columns = engine._extract_columns_from_sql(sql)
-        assert "name" in columns
-        assert "bio" in columns
-
-    def test_extract_columns_from_sql_with_alias(self, engine):
-        """测试从带别名的 SQL 提取列名。"""
-        sql = "SELECT name AS n, bio AS b FROM characters"
-        columns = engine._extract_columns_from_sql(sql)
-        assert "n" in columns
-        assert "b" in columns
-
-    def test_extract_columns_from_sql_star(self, engine):
-        """测试从 SELECT * 提取列名。"""
-        sql = "SELECT * FROM characters"
-        columns = engine._extract_columns_from_sql(sql)
-        assert len(columns) > 0
-
 
 class TestSearchEdgeCases:
     """搜索边界条件测试。"""
@@ -1,5 +1,7 @@
 """存储测试。"""
 
+import json
+
 import pytest
 
 
@@ -20,6 +22,59 @@ class TestStorageMixin:
         )
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_load_table_merges_staging(self, async_engine, tmp_path):
+        """测试加载时序列推进到已有最大 ID 之后再分配缺失的 __id，同一业务键保留最后一行。"""
+        data_dir = tmp_path / "test_data"
+        data_dir.mkdir(parents=True)
+        columns = async_engine._get_table_columns("characters")
+        records = [
+            {"__id": 5, "name": "甲", "bio": "旧"},
+            {"__id": None, "name": "乙", "bio": "乙"},
+            {"__id": 5, "name": "甲", "bio": "新"},
+        ]
+        lines = []
+        for record in records:
+            row = dict.fromkeys(columns)
+            row.update(record, __created_at="2026-01-01 00:00:00")
+            row["__updated_at"] = row["__created_at"]
+            lines.append(json.dumps(row, ensure_ascii=False))
+        (data_dir / "part_0.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        count = await async_engine.load_table(
+            table_name="characters",
+            path_pattern=str(data_dir / "*.jsonl"),
+            unique_fields=["name"],
+        )
+
+        assert count == 3
+        rows = async_engine.execute_read("SELECT __id, name, bio FROM characters ORDER BY __id")
+        assert rows == [(5, "甲", "新"), (6, "乙", "乙")]
+
+    @pytest.mark.asyncio
+    async def test_load_table_large_explicit_id(self, async_engine, tmp_path):
+        """测试显式 __id 很大时直接重建序列，后续取号从最大 ID 之后继续。"""
+        data_dir = tmp_path / "test_data"
+        data_dir.mkdir(parents=True)
+        columns = async_engine._get_table_columns("characters")
+        lines = []
+        for record in ({"__id": 10**12, "name": "壬"}, {"__id": None, "name": "癸"}):
+            row = dict.fromkeys(columns)
+            row.update(record, __created_at="2026-01-01 00:00:00")
+            row["__updated_at"] = row["__created_at"]
+            lines.append(json.dumps(row, ensure_ascii=False))
+        (data_dir / "part_0.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        await async_engine.load_table(
+            table_name="characters",
+            path_pattern=str(data_dir / "*.jsonl"),
+            unique_fields=["name"],
+        )
+        async_engine.execute_write("INSERT INTO characters (name) VALUES ('子')")
+
+        rows = async_engine.execute_read("SELECT __id, name FROM characters ORDER BY __id")
+        assert rows == [(10**12, "壬"), (10**12 + 1, "癸"), (10**12 + 2, "子")]
+
     def test_table_exists(self, engine):
         """测试表存在检查。"""
         assert engine._table_exists("characters") is True
@@ -46,6 +101,19 @@ class TestStorageOperations:
         with pytest.raises(ValueError, match="Unknown edge type"):
             await async_engine.load_edge("NonexistentEdge")
 
+    @pytest.mark.asyncio
+    async def test_load_node_missing_dir(self, async_engine, monkeypatch):
+        """测试数据目录不存在时直接返回 0，不进入加载流程。"""
+        import shutil
+        from unittest.mock import AsyncMock
+
+        shutil.rmtree(async_engine.config.storage.data_dir / "nodes" / "documents", True)
+        load_table = AsyncMock()
+        monkeypatch.setattr(async_engine, "load_table", load_table)
+
+        assert await async_engine.load_node("Document") == 0
+        load_table.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_dump_node_nonexistent(self, async_engine):
         """测试导出不存在的节点类型。"""
@@ -57,3 +125,42 @@ class TestStorageOperations:
         """测试导出不存在的边类型。"""
         with pytest.raises(ValueError, match="Unknown edge type"):
             await async_engine.dump_edge("NonexistentEdge")
+
+
+class TestStorageDump:
+    """导出分片测试。"""
+
+    @pytest.mark.asyncio
+    async def test_dump_table_partitions_and_shards(self, async_engine, tmp_path):
+        """测试按日期分区、按行数分片导出。"""
+        async_engine.execute_write(
+            "INSERT INTO characters (__id, __created_at, __updated_at, name) VALUES "
+            "(1, '2026-01-01 10:00:00', now(), 'A'), "
+            "(2, '2026-01-01 11:00:00', now(), 'B'), "
+            "(3, '2026-01-02 09:00:00', now(), 'C')"
+        )
+
+        partitioned_dir = tmp_path / "partitioned"
+        count = await async_engine.dump_table("characters", partitioned_dir, max_rows_per_file=1)
+
+        assert count == 3
+        files = sorted(
+            p.relative_to(partitioned_dir).as_posix() for p in partitioned_dir.rglob("*.jsonl")
+        )
+        assert files == [
+            "20260101/part_0.jsonl",
+            "20260101/part_1.jsonl",
+            "20260102/part_0.jsonl",
+        ]
+
+        flat_dir = tmp_path / "flat"
+        count = await async_engine.dump_table(
+            "characters", flat_dir, partition_by_date=False, max_rows_per_file=2
+        )
+
+        assert count == 3
+        lines = [
+            len(p.read_text(encoding="utf-8").splitlines())
+            for p in sorted(flat_dir.glob("*.jsonl"))
+        ]
+        assert lines == [2, 1]
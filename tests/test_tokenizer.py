@@ -56,6 +56,102 @@ class TestTokenizer:
         results = await async_engine.segment_batch([])
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_segment_uses_dedicated_thread_pool(self, async_engine, monkeypatch):
+        """测试分词在专用线程池中执行，关闭分词器后线程池被释放。"""
+        import threading
+
+        thread_names: list[str] = []
+        original_segment = async_engine._segment_sync
+
+        def recording_segment(text: str) -> str:
+            thread_names.append(threading.current_thread().name)
+            return original_segment(text)
+
+        monkeypatch.setattr(async_engine, "_segment_sync", recording_segment)
+
+        await async_engine.segment("专用线程池分词")
+
+        assert thread_names[0].startswith("duckkb-segment")
+        async_engine.shutdown_tokenizer()
+        assert async_engine._segment_thread_pool is None
+
+    @pytest.mark.asyncio
+    async def test_segment_batch_process_pool(self, async_engine, monkeypatch):
+        """测试大批量分词走进程池时结果与单进程一致且保持顺序。"""
+        from duckkb.core.mixins import tokenizer
+
+        monkeypatch.setattr(tokenizer, "SEGMENT_PARALLEL_MIN_TEXTS", 4)
+        monkeypatch.setattr(tokenizer, "SEGMENT_PARALLEL_CHUNK_SIZE", 3)
+        monkeypatch.setattr(tokenizer.os, "cpu_count", lambda: 2)
+
+        texts = [f"第{i}段中文分词文本" for i in range(8)] + [""]
+        try:
+            results = await async_engine.segment_batch(texts)
+            assert async_engine._segment_pool is not None
+        finally:
+            async_engine.shutdown_tokenizer()
+
+        assert results == [async_engine._segment_sync(t) for t in texts]
+        assert async_engine._segment_pool is None
+
+    def test_segment_batch_sync_process_pool(self, engine, monkeypatch):
+        """测试同步批量分词在大批量时同样走进程池。"""
+        from duckkb.core.mixins import tokenizer
+
+        monkeypatch.setattr(tokenizer, "SEGMENT_PARALLEL_MIN_TEXTS", 4)
+        monkeypatch.setattr(tokenizer, "SEGMENT_PARALLEL_CHUNK_SIZE", 3)
+        monkeypatch.setattr(tokenizer.os, "cpu_count", lambda: 2)
+
+        texts = [f"同步第{i}段文本" for i in range(5)]
+        try:
+            results = engine._segment_batch_sync(texts)
+            assert engine._segment_pool is not None
+        finally:
+            engine.shutdown_tokenizer()
+
+        assert results == [engine._segment_sync(t) for t in texts]
+
+    def test_segment_pool_tolerates_bad_user_dict(self, engine, monkeypatch):
+        """测试用户词典不是 UTF-8 时进程池仍可分词。"""
+        from duckkb.core.mixins import tokenizer
+
+        (engine.kb_path / "user_dict.txt").write_bytes("测试词 10\n".encode("gbk"))
+        monkeypatch.setattr(tokenizer, "SEGMENT_PARALLEL_MIN_TEXTS", 2)
+        monkeypatch.setattr(tokenizer.os, "cpu_count", lambda: 2)
+
+        texts = ["坏词典第一段", "坏词典第二段"]
+        try:
+            results = engine._segment_batch_sync(texts)
+        finally:
+            engine.shutdown_tokenizer()
+
+        assert results == [engine._segment_sync(t) for t in texts]
+
+    def test_segment_batch_sync_broken_pool_fallback(self, engine, monkeypatch):
+        """测试进程池损坏时改为进程内分词，并丢弃损坏的进程池。"""
+        from concurrent.futures.process import BrokenProcessPool
+
+        from duckkb.core.mixins import tokenizer
+
+        class _BrokenPool:
+            def map(self, fn, groups):
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        broken = _BrokenPool()
+        engine._segment_pool = broken
+        monkeypatch.setattr(tokenizer, "SEGMENT_PARALLEL_MIN_TEXTS", 2)
+        monkeypatch.setattr(tokenizer.os, "cpu_count", lambda: 2)
+
+        texts = ["损坏进程池第一段", "损坏进程池第二段"]
+        results = engine._segment_batch_sync(texts)
+
+        assert results == [engine._segment_sync(t) for t in texts]
+        assert engine._segment_pool is None
+
 
 class TestTokenizerInit:
     """分词器初始化测试。"""
@@ -0,0 +1,60 @@
+"""向量工具测试。"""
+
+import duckdb
+import numpy as np
+import pytest
+
+from duckkb.utils.vector import normalize_vectors, register_vector_batch
+
+
+class TestRegisterVectorBatch:
+    """register_vector_batch 测试。"""
+
+    def test_roundtrip_preserves_order_and_values(self):
+        """测试按行聚合后的向量与输入一致。"""
+        conn = duckdb.connect()
+        vectors = np.random.default_rng(0).random((5, 7), dtype=np.float32)
+
+        subquery = register_vector_batch(conn, "_vecs", vectors)
+        rows = conn.execute(f"SELECT row, vector FROM {subquery} ORDER BY row").fetchall()
+        conn.unregister("_vecs")
+        conn.close()
+
+        assert [r[0] for r in rows] == list(range(5))
+        for (_, vector), expected in zip(rows, vectors, strict=True):
+            assert np.array_equal(np.asarray(vector, dtype=np.float32), expected)
+
+    def test_accepts_python_lists(self):
+        """测试支持 Python 列表输入。"""
+        conn = duckdb.connect()
+        subquery = register_vector_batch(conn, "_vecs", [[1.0, 2.0], [3.0, 4.0]])
+        rows = conn.execute(f"SELECT vector FROM {subquery} ORDER BY row").fetchall()
+        conn.close()
+
+        assert rows == [([1.0, 2.0],), ([3.0, 4.0],)]
+
+    def test_ragged_input_raises(self):
+        """测试维度不一致时抛出异常。"""
+        conn = duckdb.connect()
+        with pytest.raises(ValueError):
+            register_vector_batch(conn, "_vecs", [[1.0, 2.0], [3.0]])
+        conn.close()
+
+
+class TestNormalizeVectors:
+    """normalize_vectors 测试。"""
+
+    def test_rows_have_unit_norm(self):
+        """测试归一化后内积等于余弦相似度。"""
+        vectors = [[3.0, 4.0], [1.0, 1.0]]
+        result = normalize_vectors(vectors)
+
+        assert result.dtype == np.float32
+        assert np.allclose(np.linalg.norm(result, axis=1), 1.0)
+        assert np.allclose(result[0], [0.6, 0.8])
+        assert float(result[0] @ result[1]) == pytest.approx(7 / (5 * np.sqrt(2)), rel=1e-6)
+
+    def test_zero_vector_kept(self):
+        """测试零向量原样保留，不产生 NaN。"""
+        result = normalize_vectors([[0.0, 0.0], [2.0, 0.0]])
+        assert result.tolist() == [[0.0, 0.0], [1.0, 0.0]]